@@ -17,40 +17,180 @@ TopCinema Advanced Web Scraper UI (v2.3)
 - NEW (User Request): Added "Download DB" button.
 """
 
+import asyncio
+import gzip
 import json
+import hashlib
 import os
 import re
 import time
+import socket
 import sqlite3
+import tempfile
 import threading
 import logging
 import queue
+import multiprocessing
 from typing import List, Dict, Optional, Any, Tuple
 from urllib.parse import urlparse, quote
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from datetime import datetime
 from queue import Queue
-from collections import deque
+from collections import Counter, deque, OrderedDict
+from contextlib import closing, contextmanager
+from functools import lru_cache
+from itertools import islice
 
+import aiohttp
+import orjson
 import requests
-from bs4 import BeautifulSoup
-from flask import Flask, jsonify, Response, request, send_file, render_template_string
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+from lxml import etree
+from flask import Flask, jsonify, Response, request
+from waitress import serve
 
 # --- Configuration ---
 
 # Suppress all terminal logging except for our one startup message
 log = logging.getLogger('werkzeug')
 log.setLevel(logging.ERROR)
+logging.getLogger('waitress').setLevel(logging.ERROR)
 
 DB_PATH = "data/scrapped.db"
 JSON_FILES = ["data/movies.json", "data/series_animes.json"]
+EMPTY_URLS_JSON = b'{"urls": []}' # Contents of a freshly created source file
 FETCHER_WORKERS_MOVIES = 50 # Fast speed for movies
 FETCHER_WORKERS_SERIES = 15 # Reduced speed for series to prevent thread errors
 FETCHER_WORKERS_ANIME = 15 # Reduced speed for anime to prevent thread errors
+SEASON_WORKERS = 3 # Seasons of one series scraped in parallel (their episodes all run on the fetch event loop)
+EPISODE_CONCURRENCY = 20 # Episodes of one season in flight at once
+FETCH_CONNECTIONS = 100 # Sockets in the shared aiohttp session (episode pages and every server POST)
 SERVER_PORT = 8080
+WEB_THREADS = 16 # Request threads for the waitress server; up to STATUS_HELD_LIMIT of them serve held status responses
+STATUS_HELD_LIMIT = WEB_THREADS // 2 # Open /api/stream responses plus parked long-polls; past it they get a 503
+SQLITE_STATEMENT_CACHE = 256 # Compiled statements kept per connection
+PARSE_WORKERS = os.cpu_count() or 1 # Processes used for HTML parsing
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024 # Bytes per chunk when streaming the DB download
+SHOW_PAGE_CACHE_SIZE = 256 # Rendered /db/show pages kept between writer commits
+SHOWS_CACHE_TTL = 30 # Seconds the /api/shows response is reused between writer commits
+READ_POOL_SIZE = max(WEB_THREADS, os.cpu_count() or 1) # Idle SQLite connections kept for the web routes
+DATA_QUEUE_MAXSIZE = 100 # Scraped results waiting for the writer; fetchers block when full
+WRITER_BATCH_SIZE = 500 # Max queued results the writer drains into one transaction
+SERVER_UPSERT_ROWS = 100 # Server rows per multi-row INSERT (4 bound values each, far below SQLite's variable limit)
+PAGE_CACHE_SIZE = 64 # Fetched pages kept so a page read twice in one scrape is downloaded once
+PAGE_CACHE_TTL = 120 # Seconds a cached page stays valid (sync must still see new episodes)
+FETCH_LOG_LINES = 500 # Fetch-log lines the server keeps for the UI
+
+class WriteQueue:
+    """
+    Bounded multi-producer / single-consumer queue feeding the writer thread.
+    put() is a plain deque.append (atomic under the GIL); the condition is only taken
+    when the writer is parked on an empty queue or a fetcher on a full one.
+    Offers the put/get/get_nowait subset of queue.Queue that the scraper uses, plus get_batch.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items = deque()
+        self._cond = threading.Condition()
+        self._sleepers = 0 # Threads parked on _cond; only changed while holding it
+
+    def put(self, item):
+        """Appends an item, blocking while the queue is full (a soft bound: racing fetchers may overshoot by one each)."""
+        if len(self._items) >= self.maxsize:
+            with self._cond:
+                self._sleepers += 1
+                self._cond.wait_for(lambda: len(self._items) < self.maxsize)
+                self._sleepers -= 1
+        self._items.append(item)
+        self._wake()
+
+    def get(self):
+        """Removes and returns the oldest item, blocking while the queue is empty."""
+        if not self._items:
+            with self._cond:
+                self._sleepers += 1
+                self._cond.wait_for(lambda: self._items)
+                self._sleepers -= 1
+        item = self._items.popleft()
+        self._wake()
+        return item
+
+    def get_nowait(self):
+        """Removes and returns the oldest item, raising queue.Empty if there is none."""
+        try:
+            item = self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+        self._wake()
+        return item
+
+    def get_batch(self, max_items: int) -> list:
+        """Blocks for the first item, then takes up to max_items in one go, stopping after a None sentinel.
+        Producers parked on a full queue are woken once for the whole batch."""
+        if not self._items:
+            with self._cond:
+                self._sleepers += 1
+                self._cond.wait_for(lambda: self._items)
+                self._sleepers -= 1
+        batch = []
+        popleft = self._items.popleft
+        try:
+            while len(batch) < max_items:
+                item = popleft()
+                batch.append(item)
+                if item is None:
+                    break
+        except IndexError:
+            pass # Drained everything that was queued
+        self._wake()
+        return batch
+
+    def _wake(self):
+        # A sleeper registers before re-checking its predicate, so reading the count unlocked can't miss it
+        if self._sleepers:
+            with self._cond:
+                self._cond.notify_all()
 
 # --- Global State for UI ---
 
+class LogRing:
+    """
+    The newest fetch-log lines with a running sequence number, plus their JSON encoding,
+    cached until the next append so repeated full status bodies don't re-encode every line.
+    Not locked itself: callers hold STATE_LOCK.
+    """
+
+    def __init__(self, maxlen: int):
+        self.lines = deque(maxlen=maxlen)
+        self.seq = 0 # Lines appended so far, i.e. the sequence number of the newest one
+        self._json = None
+
+    def append(self, line: str):
+        self.lines.append(line)
+        self.seq += 1
+        self._json = None
+
+    def since(self, log_since: Optional[int], upto: int) -> Optional[List[str]]:
+        """Lines numbered log_since+1..upto (all kept lines up to upto if log_since is None);
+        None if some of them were already dropped or log_since is from another run."""
+        skip = self.seq - upto # Lines appended after the snapshot that asked
+        held = len(self.lines) - skip
+        count = held if log_since is None else upto - log_since
+        if count < 0 or count > held:
+            return None
+        return list(islice(reversed(self.lines), skip, skip + count))[::-1]
+
+    def to_json(self, upto: int) -> bytes:
+        """JSON array of all kept lines up to upto."""
+        if upto != self.seq:
+            return orjson.dumps(self.since(None, upto))
+        if self._json is None:
+            self._json = orjson.dumps(list(self.lines))
+        return self._json
+
 # This dictionary is the single source of truth for the web UI
 GLOBAL_STATE = {
     "scraper_running": False,
@@ -68,24 +208,64 @@ GLOBAL_STATE = {
         "series": 0,
         "anime": 0
     },
-    "live_db_log": "...",
-    "live_fetch_logs": deque(maxlen=500) # Increased for longer log history
+    "live_db_log": "..."
 }
-
-DATA_QUEUE = Queue()
+FETCH_LOGS = LogRing(FETCH_LOG_LINES) # Sent as live_fetch_logs next to GLOBAL_STATE
+
+# Every GLOBAL_STATE change goes through STATE_LOCK and bumps STATE_VERSION,
+# so /api/status can reuse its last serialized snapshot until something changes.
+STATE_LOCK = threading.RLock()
+STATE_CHANGED = threading.Condition(STATE_LOCK) # Notified on every STATE_VERSION bump; long-polls of /api/status wait on it
+STATE_VERSION = 0
+# Fetch-log lines waiting to be merged into FETCH_LOGS; bounded like it, so nothing grows while nobody polls
+FETCH_LOG_INBOX = deque(maxlen=FETCH_LOG_LINES)
+STATUS_SNAPSHOT = (-1, b"", "", {}) # (STATE_VERSION it was built from, JSON bytes without the logs, ETag, state dict)
+# One slot per web thread a held status response may tie up, so the other routes always keep threads
+STATUS_HELD_SLOTS = threading.BoundedSemaphore(STATUS_HELD_LIMIT)
+STATUS_HISTORY = OrderedDict() # ETag -> state dict of the last STATUS_HISTORY_SIZE snapshots, bases for ?delta=1
+STATUS_GZIP = ("", b"") # (ETag, gzipped full status body) so every poller shares one compression
+STATUS_CACHE_CONTROL = "no-cache" # Browser keeps /api/status but revalidates every poll (304 when unchanged)
+STATUS_LONG_POLL_TIMEOUT = 25 # Seconds /api/status?wait=1 holds an unchanged client before answering 304
+STATUS_LONG_POLL_TICK = 0.25 # Max seconds a held poll goes without checking for new fetch-log lines
+STATUS_COALESCE_QUIET = 0.05 # A held poll answers once the state has been still this long after a change...
+STATUS_COALESCE_MAX = 0.1 # ...or this long after the first change, whichever comes first
+STATUS_STREAM_STATS_INTERVAL = 0.5 # Min seconds between stats events on /api/stream; fetch-log lines are not held back
+STATUS_STREAM_LOG_CHUNK = 100 # Max fetch-log lines per /api/stream event, so a reconnect backlog arrives in pieces
+STATUS_STREAM_HEARTBEAT = 15 # Seconds an idle /api/stream goes before a keep-alive comment (a closed tab frees its thread within two)
+STATUS_HISTORY_SIZE = 16 # Snapshots kept to diff against; an older client ETag gets a full body
+STATUS_GZIP_MIN_SIZE = 500 # /api/status bodies smaller than this go out uncompressed
+STATUS_GZIP_LEVEL = 6 # zlib level for /api/status; the repetitive log lines shrink ~10x already
+STYLESHEET_MAX_AGE = 86400 # Seconds browsers may reuse /assets/ stylesheets (1 day)
+PAGE_MAX_AGE = 60 # Seconds browsers may reuse the pre-rendered dashboard and DB explorer pages
+
+DATA_QUEUE = WriteQueue(DATA_QUEUE_MAXSIZE)
 STOP_EVENT = threading.Event()
 SCRAPER_THREAD = None
 SYNC_THREAD = None # Thread for the sync operation
+PARSE_POOL = None # Process pool for CPU-bound HTML parsing, created on first use
+PARSE_POOL_LOCK = threading.Lock()
+FETCH_LOOP = None # Event loop (in its own thread) that runs every aiohttp request, started on first use
+FETCH_LOOP_LOCK = threading.Lock()
+FETCH_SESSION = None # The fetch loop's aiohttp session, created on the loop on first use
+READ_POOL = Queue(maxsize=READ_POOL_SIZE) # Idle read connections reused across requests
+WRITER_DB = None # The scraper's Database, opened by the first run and kept open for every later one
+SHOWS_CACHE: Dict[tuple, Tuple[float, bytes]] = {} # (limit, after_id, type) -> (expires, /api/shows body)
+PAGE_CACHE: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict() # url -> (expires, HTML bytes), LRU order
+PAGE_CACHE_LOCK = threading.Lock()
 
 # --- Networking Setup ---
 
+SITE_ORIGIN = "https://topcinema.pro"
+TRAILER_ENDPOINT = SITE_ORIGIN + "/wp-content/themes/movies2023/Ajaxat/Home/LoadTrailer.php"
+SERVER_ENDPOINT = SITE_ORIGIN + "/wp-content/themes/movies2023/Ajaxat/Single/Server.php"
+
 # Base headers for GET requests (browsing pages)
 BASE_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
     "Connection": "keep-alive",
-    "Referer": "https://topcinema.pro/",
+    "Referer": SITE_ORIGIN + "/",
 }
 
 # Magic headers for the server-fetching POST request
@@ -96,8 +276,21 @@ SERVER_POST_HEADERS = {
 }
 
 REQUEST_TIMEOUT = 15
-REQUEST_DELAY = 0.1  # Minimal delay for VPS
+# aiohttp's total= also counts the wait for a free connector slot, so under load queued requests would time
+# out unsent. Like requests' timeout=, these only bound the connect and each socket read.
+PAGE_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT)
+SERVER_POST_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=5) # Per server POST
+# The shared page-GET budget keeps the ceiling the old per-thread 0.1 s sleep gave the busiest phase
+# (series: each of the 15 workers ran 5 episode threads); change REQUEST_SPACING to throttle everything.
+REQUEST_SPACING = 0.1 # Seconds the old code slept before each GET, per thread
+REQUEST_STREAMS = max(FETCHER_WORKERS_MOVIES, FETCHER_WORKERS_SERIES * 5, FETCHER_WORKERS_ANIME * 5) # GET threads the old code ran at once
+REQUEST_RATE = REQUEST_STREAMS / REQUEST_SPACING # Page GETs per second, shared by all workers (750)
+REQUEST_BURST = FETCHER_WORKERS_MOVIES # GETs allowed back-to-back before the rate applies: one per movie worker
 VERIFY_SSL = False
+HTTP_POOL_SIZE = 256 # Keep-alive connections the GET session holds open
+DNS_CACHE_TTL = 300 # Seconds a resolved host is reused before asking the resolver again
+HTML_PARSER = "lxml" # BeautifulSoup tree builder (C tokenizer, much faster than html.parser)
+PAGE_ENCODING = "utf-8" # Charset the site serves; passed to the parsers so they skip encoding detection
 
 # Setup persistent session for GET requests
 SESSION = requests.Session()
@@ -107,12 +300,65 @@ retry_strategy = requests.packages.urllib3.util.retry.Retry(
     backoff_factor=0.5,
     status_forcelist=[429, 500, 502, 503, 504],
 )
-adapter = requests.adapters.HTTPAdapter(pool_connections=100, pool_maxsize=100, max_retries=retry_strategy)
+# Every fetcher thread can hold a page GET and a trailer GET open at once
+adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                                        pool_block=False, max_retries=retry_strategy)
 SESSION.mount('https://', adapter)
 SESSION.mount('http://', adapter)
+
+# Every new pooled connection calls getaddrinfo; cache the answers for the site's few hosts
+_system_getaddrinfo = socket.getaddrinfo
+DNS_CACHE: Dict[tuple, Tuple[float, list]] = {} # (host, port, args) -> (expires, getaddrinfo result)
+
+def cached_getaddrinfo(host, port, *args, **kwargs):
+    """socket.getaddrinfo with a DNS_CACHE_TTL cache."""
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    cached = DNS_CACHE.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    result = _system_getaddrinfo(host, port, *args, **kwargs)
+    DNS_CACHE[key] = (now + DNS_CACHE_TTL, result)
+    return result
+
+socket.getaddrinfo = cached_getaddrinfo
+
 if not VERIFY_SSL:
     requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
 
+class TokenBucket:
+    """Thread-safe token bucket that caps the combined request rate of all workers."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes one token and returns how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1 # Reserve our slot; later callers queue up behind it
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Takes one token, sleeping only for as long as the bucket is overdrawn."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """acquire() for coroutines: waits without blocking the event loop."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+RATE_LIMITER = TokenBucket(REQUEST_RATE, REQUEST_BURST)
+
 # --- Regex & Constants ---
 
 REGEX_PATTERNS = {
@@ -125,68 +371,297 @@ REGEX_PATTERNS = {
     'watch_suffix': re.compile(r'/watch/?$'),
     'episode_id': re.compile(r'"id"\s*:\s*"(\d+)"'),
     'title_clean_prefix': re.compile(r'^\s*(فيلم|انمي|مسلسل|anime|film|movie|series)\s+', re.IGNORECASE | re.UNICODE),
-    'title_clean_suffix': re.compile(r'\s+(مترجم|اون\s*لاين|اونلاين|online|مترجمة|مدبلج|مدبلجة)(\s+|$)', re.IGNORECASE | re.UNICODE),
-    'base_show_url': re.compile(r'(https?:\/\/[^\/]+\/(?:مسلسل|انمي|series|anime)-[^\/]+)\/') # NEW: For sitemap parser
+    # Lookahead leaves the trailing space for the next token, so back-to-back suffixes go in one pass
+    'title_clean_suffix': re.compile(r'\s+(?:مترجم|اون\s*لاين|اونلاين|online|مترجمة|مدبلج|مدبلجة)(?=\s|$)', re.IGNORECASE | re.UNICODE),
+    'base_show_url': re.compile(r'(https?:\/\/[^\/]+\/(?:مسلسل|انمي|series|anime)-[^\/]+)\/'), # NEW: For sitemap parser
+    'year4': re.compile(r'(\d{4})'),
+    'whitespace': re.compile(r'\s+'),
+    'ep_num_chars': re.compile(r'[\d\.-]'), # A cleaned episode number must contain one of these
+    # URL routers for run_single, tried in priority order by route_url (anime URLs live under /series/)
+    'url_movie': re.compile(r'فيلم|/film-|/movie-|%d9%81%d9%8a%d9%84%d9%85', re.IGNORECASE),
+    'url_anime': re.compile(r'انمي|anime', re.IGNORECASE),
+    'url_series': re.compile(r'مسلسل|series', re.IGNORECASE),
+    'iframe_src': re.compile(r'<iframe[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE), # Embed URL in the Ajax POST fragments
+}
+
+# CSS selectors compiled once at import instead of being re-parsed on every page
+CSS_SELECTORS = {
+    'episode_anchor': sv.compile(".allepcont .row > a"),
+    'imdb_box': sv.compile(".UnderPoster .imdbR"),
+    'season_box': sv.compile("div.Small--Box.Season"),
+    'sitemap_link': sv.compile("#content table tbody tr a"),
 }
 
+# Site taxonomy labels -> metadata keys kept by extract_media_details
+METADATA_KEY_MAPPING = {
+    "قسم المسلسل": "category", "قسم الفيلم": "category", "نوع المسلسل": "genres",
+    "نوع الفيلم": "genres", "النوع": "genres", "جودة المسلسل": "quality",
+    "جودة الفيلم": "quality", "عدد الحلقات": "episode_count", "توقيت المسلسل": "duration",
+    "توقيت الفيلم": "duration", "مدة الفيلم": "duration", "موعد الصدور": "release_year",
+    "سنة الانتاج": "release_year", "لغة المسلسل": "language", "لغة الفيلم": "language",
+    "دولة المسلسل": "country", "دولة الفيلم": "country", "المخرجين": "directors",
+    "المخرج": "directors", "بطولة": "cast"
+}
+METADATA_KEYS = frozenset(METADATA_KEY_MAPPING.values())
+
+# Season pages only need the episode list; parse_only builds just that subtree.
+# (A regex, because the strainer sees the raw multi-class attribute "allepcont getMoreByScroll".)
+EPISODE_LIST_STRAINER = SoupStrainer(class_=re.compile(r'(?:^|\s)allepcont(?:\s|$)'))
+
 ARABIC_ORDINALS = {
     "الاول": 1, "الأول": 1, "الثاني": 2, "ثاني": 2, "الثالث": 3, "ثالث": 3,
     "الابع": 4, "رابع": 4, "الخامس": 5, "خامس": 5, "السادس": 6, "sادس": 6,
     "السابع": 7, "سابع": 7, "الثامن": 8, "ثامن": 8, "التاسع": 9, "تاسع": 9,
     "العاشر": 10, "عاشر": 10,
 }
+# Every ordinal in one alternation (longest first, so "الثالث" wins over "ثالث" at the same spot)
+ARABIC_ORDINALS_PATTERN = re.compile('|'.join(map(re.escape, sorted(ARABIC_ORDINALS, key=len, reverse=True))))
 
 # --- UI Logging ---
 
+def _state_changed():
+    """Bumps STATE_VERSION and wakes held status polls. Caller holds STATE_LOCK."""
+    global STATE_VERSION
+    STATE_VERSION += 1
+    STATE_CHANGED.notify_all()
+
 def log_to_ui(log_type: str, message: str):
     """Updates the GLOBAL_STATE for the UI to read."""
-    if log_type == "db":
-        GLOBAL_STATE["live_db_log"] = message
-    elif log_type == "fetch":
-        GLOBAL_STATE["live_fetch_logs"].append(message)
-    elif log_type == "status":
-        GLOBAL_STATE["status_message"] = message
+    if log_type == "fetch":
+        # Hot path for the fetch workers: deque.append is atomic, so no STATE_LOCK round-trip.
+        # get_status_json moves these lines into FETCH_LOGS when the UI next polls.
+        FETCH_LOG_INBOX.append(message)
+        return
+    with STATE_LOCK:
+        if log_type == "db":
+            GLOBAL_STATE["live_db_log"] = message
+        elif log_type == "status":
+            GLOBAL_STATE["status_message"] = message
+        _state_changed()
+
+def update_state(**fields):
+    """Replaces top-level GLOBAL_STATE fields atomically."""
+    with STATE_LOCK:
+        GLOBAL_STATE.update(fields)
+        _state_changed()
+
+def set_stats(progress: Optional[Dict[str, int]] = None, counts: Optional[Dict[str, int]] = None):
+    """Overwrites progress/count values (e.g. after reading them from the DB)."""
+    with STATE_LOCK:
+        GLOBAL_STATE["progress"].update(progress or {})
+        GLOBAL_STATE["counts"].update(counts or {})
+        _state_changed()
+
+def bump_stats(progress: Optional[Dict[str, int]] = None, counts: Optional[Dict[str, int]] = None):
+    """Adds deltas to progress/count values as items are written."""
+    with STATE_LOCK:
+        for section, deltas in (("progress", progress), ("counts", counts)):
+            for key, delta in (deltas or {}).items():
+                GLOBAL_STATE[section][key] += delta
+        _state_changed()
+
+def claim_scraper(scrape_type: str, scrape_queue: List[str]) -> bool:
+    """Marks a run as started; returns False if one is already running."""
+    with STATE_LOCK:
+        if GLOBAL_STATE["scraper_running"]:
+            return False
+        update_state(scraper_running=True, current_scrape_type=scrape_type,
+                     scrape_queue=scrape_queue, live_db_log="...")
+        return True
+
+def advance_scrape_queue() -> Optional[str]:
+    """Pops the next auto-chained type off scrape_queue and makes it current, in one step under
+    STATE_LOCK so /api/stop can't clear the queue in between. None if nothing is queued or a stop was requested."""
+    with STATE_LOCK:
+        remaining = GLOBAL_STATE["scrape_queue"]
+        if not remaining or STOP_EVENT.is_set():
+            return None
+        update_state(current_scrape_type=remaining[0], scrape_queue=remaining[1:])
+        return remaining[0]
+
+def release_scraper():
+    """Marks the scraper as idle and drops any queued scrape types."""
+    update_state(scraper_running=False, current_scrape_type=None, scrape_queue=[])
+
+def get_status_json() -> Tuple[bytes, str, Dict]:
+    """Serialized GLOBAL_STATE (without the fetch-log lines), its ETag and the state dict it was
+    encoded from, re-encoded only when something changed since the last call.
+    Pending fetch-log lines are merged in first; log_seq stands in for them in the ETag."""
+    global STATUS_SNAPSHOT
+    with STATE_LOCK:
+        if FETCH_LOG_INBOX:
+            try:
+                while True:
+                    FETCH_LOGS.append(FETCH_LOG_INBOX.popleft())
+            except IndexError:
+                pass
+            _state_changed()
+        if STATUS_SNAPSHOT[0] != STATE_VERSION:
+            state = dict(GLOBAL_STATE, progress=dict(GLOBAL_STATE["progress"]),
+                         counts=dict(GLOBAL_STATE["counts"]),
+                         scrape_queue=list(GLOBAL_STATE["scrape_queue"]),
+                         log_seq=FETCH_LOGS.seq)
+            body = orjson.dumps(state)
+            etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+            STATUS_SNAPSHOT = (STATE_VERSION, body, etag, state)
+            STATUS_HISTORY[etag] = state
+            while len(STATUS_HISTORY) > STATUS_HISTORY_SIZE:
+                STATUS_HISTORY.popitem(last=False)
+        return STATUS_SNAPSHOT[1:]
+
+def status_base(etags) -> Optional[Dict]:
+    """The recent snapshot a client already holds (by its If-None-Match ETags), if still kept."""
+    with STATE_LOCK:
+        return next((STATUS_HISTORY[etag] for etag in etags if etag in STATUS_HISTORY), None)
+
+def status_full_json(body: bytes, state: Dict) -> bytes:
+    """A get_status_json() body with all kept fetch-log lines spliced in as live_fetch_logs."""
+    with STATE_LOCK:
+        logs = FETCH_LOGS.to_json(state["log_seq"])
+    return body[:-1] + b',"live_fetch_logs":' + logs + b'}'
+
+def status_logs(state: Dict, log_since: int) -> Tuple[List[str], bool]:
+    """The fetch-log lines after sequence number log_since up to the snapshot's log_seq, and whether
+    they don't connect to log_since (then all kept lines up to log_seq are returned)."""
+    with STATE_LOCK:
+        logs = FETCH_LOGS.since(log_since, state["log_seq"])
+        if logs is not None:
+            return logs, False
+        return FETCH_LOGS.since(None, state["log_seq"]), True
+
+def status_since_json(state: Dict, log_since: int, base: Optional[Dict] = None) -> bytes:
+    """
+    A status snapshot whose live_fetch_logs holds only the lines after sequence number log_since.
+    log_reset tells the client its lines don't connect (server restarted or lines were dropped).
+    Given base (the snapshot the client holds), only the fields that differ from it are sent,
+    marked partial so the client merges them into its copy.
+    """
+    logs, reset = status_logs(state, log_since)
+    if base is not None:
+        state = {key: value for key, value in state.items() if base.get(key) != value}
+        state["partial"] = True
+    return orjson.dumps(dict(state, live_fetch_logs=logs, log_reset=reset))
 
-# --- Utility Functions ---
+def wait_for_status(etag: str, timeout: float) -> Tuple[bytes, str, Dict]:
+    """
+    get_status_json(), held until its ETag differs from etag or timeout passes.
+    A change is debounced (STATUS_COALESCE_QUIET, capped at STATUS_COALESCE_MAX) so a burst of
+    log lines and counter bumps goes out as one response instead of one per update.
+    Fetch-log lines don't notify, so the wait wakes every STATUS_LONG_POLL_TICK to merge them.
+    """
+    deadline = time.monotonic() + timeout
+    with STATE_LOCK:
+        snapshot = get_status_json()
+        while snapshot[1] == etag:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return snapshot
+            STATE_CHANGED.wait(min(remaining, STATUS_LONG_POLL_TICK))
+            snapshot = get_status_json()
+
+        first_change = settled_at = time.monotonic()
+        while True:
+            answer_at = min(settled_at + STATUS_COALESCE_QUIET, first_change + STATUS_COALESCE_MAX)
+            now = time.monotonic()
+            if now >= answer_at:
+                return snapshot
+            STATE_CHANGED.wait(answer_at - now)
+            latest = get_status_json()
+            if latest[1] != snapshot[1]:
+                snapshot, settled_at = latest, time.monotonic()
+
+def gzip_status(body: bytes, etag: str = "") -> bytes:
+    """Gzipped /api/status body; a full snapshot (etag given) is compressed once and reused."""
+    global STATUS_GZIP
+    if etag and STATUS_GZIP[0] == etag:
+        return STATUS_GZIP[1]
+    compressed = gzip.compress(body, compresslevel=STATUS_GZIP_LEVEL, mtime=0)
+    if etag:
+        STATUS_GZIP = (etag, compressed)
+    return compressed
+
+def status_busy() -> Response:
+    """503 for a stream or long-poll past STATUS_HELD_LIMIT; the page polls once a second instead."""
+    response = Response(status=503)
+    response.headers['Retry-After'] = '1'
+    return response
 
-def slugify(text: str) -> str:
-    """Create a safe filename from a title."""
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
-    return text[:100]
+# --- Utility Functions ---
 
-def fetch_html(url: str) -> Optional[BeautifulSoup]:
-    """Fetches and parses HTML from a URL."""
+def fetch_page(url: str) -> Optional[bytes]:
+    """Fetches the raw HTML bytes of a URL without decoding or parsing them."""
     if STOP_EVENT.is_set(): return None
     if not url.startswith(('http://', 'https://')):
         return None
     try:
-        time.sleep(REQUEST_DELAY)
+        RATE_LIMITER.acquire()
         resp = SESSION.get(url, timeout=REQUEST_TIMEOUT, verify=VERIFY_SSL)
         resp.raise_for_status()
-        return BeautifulSoup(resp.text, "html.parser")
+        if STOP_EVENT.is_set(): return None # Stopped while downloading; don't hand the page to a parser
+        return resp.content
     except Exception as e:
         # Don't flood the UI log with request failures
         pass
     return None
 
+def fetch_page_cached(url: str) -> Optional[bytes]:
+    """fetch_page through PAGE_CACHE; failures are not cached."""
+    now = time.monotonic()
+    with PAGE_CACHE_LOCK:
+        cached = PAGE_CACHE.get(url)
+        if cached and cached[0] > now:
+            PAGE_CACHE.move_to_end(url)
+            return cached[1]
+
+    html = fetch_page(url)
+    if html is not None:
+        with PAGE_CACHE_LOCK:
+            PAGE_CACHE[url] = (now + PAGE_CACHE_TTL, html)
+            PAGE_CACHE.move_to_end(url)
+            while len(PAGE_CACHE) > PAGE_CACHE_SIZE:
+                PAGE_CACHE.popitem(last=False)
+    return html
+
+def absolute_url(href: str) -> str:
+    """Resolves a page link against the site with plain string checks (hrefs are absolute or root-relative)."""
+    if href.startswith(('http://', 'https://')):
+        return href
+    return SITE_ORIGIN + href if href.startswith('/') else SITE_ORIGIN + '/' + href
+
+def make_soup(html: bytes, encoding: Optional[str] = None, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parses raw HTML bytes with the configured tree builder and a known encoding."""
+    return BeautifulSoup(html, HTML_PARSER, from_encoding=encoding or PAGE_ENCODING, parse_only=parse_only)
+
+def fetch_html(url: str, cached: bool = False, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+    """Fetches and parses HTML from a URL (cached=True goes through PAGE_CACHE)."""
+    html = fetch_page_cached(url) if cached else fetch_page(url)
+    return make_soup(html, parse_only=parse_only) if html is not None else None
+
+def run_parser(func, html: bytes):
+    """Runs a top-level parse function on raw page bytes in the parser process pool (falls back to this thread)."""
+    global PARSE_POOL
+    try:
+        if PARSE_POOL is None:
+            with PARSE_POOL_LOCK:
+                if PARSE_POOL is None:
+                    # spawn: forking a process that is running dozens of threads is unsafe
+                    PARSE_POOL = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return PARSE_POOL.submit(func, html).result()
+    except Exception:
+        return func(html)
+
 def extract_number_from_text(text: str) -> Optional[int]:
     if not text: return None
     m = REGEX_PATTERNS['number'].search(text)
     if m: return int(m.group(1))
     lower = text.replace("ي", "ى").replace("أ", "ا").replace("إ", "ا").strip()
-    for word, num in ARABIC_ORDINALS.items():
-        if word in lower: return num
-    return None
+    m = ARABIC_ORDINALS_PATTERN.search(lower)
+    return ARABIC_ORDINALS[m.group(0)] if m else None
 
 def clean_title(title: str) -> str:
     if not title: return title
     cleaned = REGEX_PATTERNS['title_clean_prefix'].sub('', title)
-    prev = ""
-    while prev != cleaned:
-        prev = cleaned
-        cleaned = REGEX_PATTERNS['title_clean_suffix'].sub(' ', cleaned)
+    cleaned = REGEX_PATTERNS['title_clean_suffix'].sub(' ', cleaned)
     cleaned = ' '.join(cleaned.split()).strip(' -–—|:،؛')
     return cleaned
 
@@ -209,13 +684,82 @@ def get_sort_key(ep_str: Optional[str]) -> float:
         return 0.0
     return 99999.0
 
+def classify_url(url: str) -> Optional[str]:
+    """Returns the scrape bucket of a URL: 'movies', 'anime', 'series' or None."""
+    if "فيلم" in url or "movie" in url:
+        return "movies"
+    if "انمي" in url or "anime" in url:
+        return "anime"
+    if "مسلسل" in url or "series" in url:
+        return "series"
+    return None
+
+def route_url(url: str) -> Optional[str]:
+    """Returns how run_single scrapes a URL: 'movie', 'anime', 'series' or None. Movie beats anime beats series."""
+    for kind in ("movie", "anime", "series"):
+        if REGEX_PATTERNS[f"url_{kind}"].search(url):
+            return kind
+    return None
+
+# Parsed source files, keyed by path: (mtime, urls). Re-read only when the file changes.
+_JSON_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+# Bucket of every URL seen in the source files, classified once when the file is loaded.
+URL_TYPES: Dict[str, Optional[str]] = {}
+
+def get_url_type(url: str) -> Optional[str]:
+    """Looks up a URL's bucket, classifying it on the spot if it wasn't loaded from a file."""
+    try:
+        return URL_TYPES[url]
+    except KeyError:
+        return classify_url(url)
+
+def get_all_urls_from_files() -> List[str]:
+    """Returns the de-duplicated URLs from all JSON_FILES, in file order."""
+    all_urls: Dict[str, None] = {}
+    for file_path in JSON_FILES:
+        try:
+            mtime = os.stat(file_path).st_mtime
+            cached = _JSON_CACHE.get(file_path)
+            if cached and cached[0] == mtime:
+                file_urls = cached[1]
+            else:
+                with open(file_path, 'rb') as f: # orjson parses the raw UTF-8 bytes, no text decode pass
+                    file_urls = [url for url in orjson.loads(f.read()).get("urls", []) if url]
+                _JSON_CACHE[file_path] = (mtime, file_urls)
+                URL_TYPES.update((url, classify_url(url)) for url in file_urls)
+            all_urls.update(dict.fromkeys(file_urls))
+        except Exception as e:
+            log_to_ui("status", f"Error reading {file_path}: {e}")
+    return list(all_urls)
+
 # --- Database Initialization ---
 
+# Per-connection settings. journal_mode=WAL is persistent and is set once by init_database.
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA cache_size = -64000", # ~64 MB page cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456", # Read pages through a 256 MB memory map instead of read() calls
+)
+
+def apply_pragmas(conn: sqlite3.Connection):
+    """Applies the shared SQLite tuning to a freshly opened connection."""
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+
+# Same buckets as classify_url; instr() is a case-sensitive substring test like Python's `in`
+SQL_URL_TYPE = """
+    CASE WHEN instr(url, 'فيلم') OR instr(url, 'movie') THEN 'movies'
+         WHEN instr(url, 'انمي') OR instr(url, 'anime') THEN 'anime'
+         WHEN instr(url, 'مسلسل') OR instr(url, 'series') THEN 'series' END"""
+
 def init_database(db_path: str = DB_PATH):
     """Create 4-table POLYMORPHIC database schema"""
     os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
     with sqlite3.connect(db_path) as conn:
         cursor = conn.cursor()
+        cursor.execute("PRAGMA journal_mode = WAL") # Readers no longer block the writer
         cursor.execute("PRAGMA foreign_keys = ON")
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS shows (
@@ -250,18 +794,78 @@ def init_database(db_path: str = DB_PATH):
             id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE NOT NULL,
             status TEXT DEFAULT 'pending' CHECK(status IN ('pending', 'completed', 'failed')),
             show_id INTEGER, error_message TEXT, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            type TEXT, -- classify_url() bucket, stored at insert: 'movies', 'anime', 'series' or NULL
             FOREIGN KEY (show_id) REFERENCES shows(id) ON DELETE SET NULL
         )""")
+        # Databases created before the type column existed: add it and classify the backlog once
+        if "type" not in {row[1] for row in cursor.execute("PRAGMA table_info(scrape_progress)")}:
+            cursor.execute("ALTER TABLE scrape_progress ADD COLUMN type TEXT")
+            cursor.execute(f"UPDATE scrape_progress SET type = {SQL_URL_TYPE}")
+        # Carries url too, so the pending lists are read from the index alone (supersedes the (status, type) index)
+        cursor.execute("DROP INDEX IF EXISTS idx_progress_status_type")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_progress_status_type_url ON scrape_progress(status, type, url)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_shows_type_id ON shows(type, id)") # Keyset paging per type
+        # Servers are always looked up (and refreshed) by their parent, in server order. The index is
+        # UNIQUE so a re-scrape upserts in place; older DBs swap their plain index for it once, keeping
+        # only the newest row of any duplicated server slot.
+        if cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_servers_parent'").fetchone():
+            cursor.execute("""
+                DELETE FROM servers WHERE id NOT IN (
+                    SELECT MAX(id) FROM servers GROUP BY parent_type, parent_id, server_number)""")
+            cursor.execute("DROP INDEX idx_servers_parent")
+        cursor.execute("""CREATE UNIQUE INDEX IF NOT EXISTS idx_servers_parent_number
+                          ON servers(parent_type, parent_id, server_number)""")
         conn.commit()
 
+# Read-side statements for the explorer routes. Constant text keeps them in each pooled
+# connection's statement cache, so a warm route does no SQL compilation.
+SQL_SELECT_SHOW = """
+    SELECT id, title, type, poster, synopsis, imdb_rating, trailer, year,
+           genres, "cast", directors, country, language, duration, source_url, created_at
+    FROM shows WHERE id = ?"""
+SQL_SELECT_SHOW_CARDS = "SELECT id, title, type, poster, year, imdb_rating, genres FROM shows"
+SQL_SELECT_SEASONS = """
+    SELECT id, show_id, season_number, poster, created_at
+    FROM seasons WHERE show_id = ? ORDER BY season_number"""
+SQL_SELECT_EPISODES = """
+    SELECT id, episode_number
+    FROM episodes WHERE season_id = ?
+    ORDER BY CAST(episode_number AS REAL)"""
+SQL_SELECT_SERVERS = """
+    SELECT embed_url, server_number
+    FROM servers WHERE parent_type = ? AND parent_id = ?
+    ORDER BY server_number"""
+
+def invalidate_read_caches():
+    """Drops cached explorer responses; called whenever the writer commits."""
+    SHOWS_CACHE.clear()
+    render_show_page.cache_clear()
+
+@contextmanager
+def read_connection():
+    """Borrows a pooled read-only connection for a web request, opening one if none is idle."""
+    try:
+        conn = READ_POOL.get_nowait()
+    except queue.Empty:
+        # Read-only URI: the web routes can never take a write lock away from the scraper's writer
+        conn = sqlite3.connect(f"file:{quote(os.path.abspath(DB_PATH))}?mode=ro", uri=True,
+                               check_same_thread=False, cached_statements=SQLITE_STATEMENT_CACHE)
+        conn.row_factory = sqlite3.Row
+        apply_pragmas(conn)
+    try:
+        yield conn
+    finally:
+        try:
+            READ_POOL.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
 # --- Core Scraping Logic ---
 
 def get_trailer_embed_url(page_url: str, form_url: str) -> Optional[str]:
     """Fetches trailer embed URL via Ajax POST request."""
     if STOP_EVENT.is_set(): return None
     try:
-        base = "https://topcinema.pro"
-        trailer_endpoint = base + "/wp-content/themes/movies2023/Ajaxat/Home/LoadTrailer.php"
         data_str = f"href={quote(form_url, safe=':/')}"
         trailer_headers = {
             "accept": "*/*", 
@@ -269,13 +873,12 @@ def get_trailer_embed_url(page_url: str, form_url: str) -> Optional[str]:
             "x-requested-with": "XMLHttpRequest", 
             "referer": quote(page_url, safe=':/')
         }
-        resp = SESSION.post(trailer_endpoint, headers=trailer_headers, data=data_str.encode('utf-8'),
+        resp = SESSION.post(TRAILER_ENDPOINT, headers=trailer_headers, data=data_str.encode('utf-8'),
                           timeout=REQUEST_TIMEOUT, verify=VERIFY_SSL)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        iframe = soup.find("iframe")
-        if iframe and iframe.get("src"):
-            trailer_url = iframe["src"].strip()
+        match = REGEX_PATTERNS['iframe_src'].search(resp.text)
+        if match:
+            trailer_url = unescape(match.group(1)).strip()
             if trailer_url and trailer_url.startswith(('http://', 'https://')):
                 return trailer_url
     except Exception:
@@ -283,90 +886,170 @@ def get_trailer_embed_url(page_url: str, form_url: str) -> Optional[str]:
     return None
 
 def get_episode_servers(episode_id: str, referer: Optional[str] = None, total_servers: int = 10) -> List[Dict]:
-    """Fetches all server embed URLs using the 4-header POST request fix."""
+    """Fetches all server embed URLs using the 4-header POST request fix (on the fetch event loop)."""
+    if STOP_EVENT.is_set(): return []
+    return run_on_fetch_loop(lambda session: get_episode_servers_async(session, episode_id, referer, total_servers))
+
+def get_fetch_loop() -> asyncio.AbstractEventLoop:
+    """The event loop every aiohttp request runs on, started in a daemon thread on first use."""
+    global FETCH_LOOP
+    with FETCH_LOOP_LOCK:
+        if FETCH_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="FetchLoop", daemon=True).start()
+            FETCH_LOOP = loop
+        return FETCH_LOOP
+
+async def get_fetch_session() -> aiohttp.ClientSession:
+    """The fetch loop's shared session; only runs on that loop, so creating it needs no lock.
+    It carries no default headers: page GETs pass BASE_HEADERS, server POSTs stay as clean as a bare post."""
+    global FETCH_SESSION
+    if FETCH_SESSION is None:
+        connector = aiohttp.TCPConnector(limit=FETCH_CONNECTIONS, ttl_dns_cache=DNS_CACHE_TTL, ssl=VERIFY_SSL)
+        FETCH_SESSION = aiohttp.ClientSession(connector=connector)
+    return FETCH_SESSION
+
+def run_on_fetch_loop(make_coro):
+    """Runs make_coro(session) on the fetch loop and blocks the calling worker thread for its result.
+    Every fetcher shares one session, so keep-alive connections outlive a single episode or season."""
+    async def run():
+        return await make_coro(await get_fetch_session())
+    return asyncio.run_coroutine_threadsafe(run(), get_fetch_loop()).result()
+
+def close_fetch_loop():
+    """Closes the shared session and stops the fetch loop (at shutdown)."""
+    if FETCH_LOOP is None:
+        return
+    if FETCH_SESSION is not None:
+        asyncio.run_coroutine_threadsafe(FETCH_SESSION.close(), FETCH_LOOP).result()
+    FETCH_LOOP.call_soon_threadsafe(FETCH_LOOP.stop)
+
+async def fetch_page_async(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+    """fetch_page for the episode event loop."""
+    if STOP_EVENT.is_set(): return None
+    if not url.startswith(('http://', 'https://')):
+        return None
+    try:
+        await RATE_LIMITER.acquire_async()
+        async with session.get(url, headers=BASE_HEADERS, timeout=PAGE_TIMEOUT) as resp:
+            resp.raise_for_status()
+            html = await resp.read()
+        if STOP_EVENT.is_set(): return None # Stopped while downloading; don't hand the page to a parser
+        return html
+    except Exception:
+        # Don't flood the UI log with request failures
+        pass
+    return None
+
+async def get_episode_servers_async(session: aiohttp.ClientSession, episode_id: str, referer: Optional[str] = None,
+                                    total_servers: int = 10) -> List[Dict]:
+    """get_episode_servers for the episode event loop: every server POST of the episode is in flight at once."""
     if STOP_EVENT.is_set(): return []
-    servers: List[Dict] = []
-    server_url = "https://topcinema.pro/wp-content/themes/movies2023/Ajaxat/Single/Server.php"
-    
-    # Use the 4 magic headers for the POST request
     server_headers = SERVER_POST_HEADERS.copy()
-    server_headers["Referer"] = quote(referer, safe=':/') if referer else "https://topcinema.pro/"
+    server_headers["Referer"] = quote(referer, safe=':/') if referer else SITE_ORIGIN + "/"
 
-    def fetch_one(i: int):
+    async def fetch_one(i: int):
         if STOP_EVENT.is_set(): return None
         try:
             data = {"id": str(episode_id), "i": str(i)}
-            # Use requests.post directly to send a clean request
-            resp = requests.post(server_url, headers=server_headers, data=data, timeout=5, verify=VERIFY_SSL)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-            iframe = soup.find("iframe")
-            if iframe and iframe.get("src") and iframe.get("src").strip():
-                return {"server_number": i, "embed_url": iframe.get("src").strip()}
+            async with session.post(SERVER_ENDPOINT, headers=server_headers, data=data, timeout=SERVER_POST_TIMEOUT) as resp:
+                resp.raise_for_status()
+                text = await resp.text()
+            match = REGEX_PATTERNS['iframe_src'].search(text)
+            if match and match.group(1).strip():
+                return {"server_number": i, "embed_url": unescape(match.group(1)).strip()}
         except Exception:
             pass
         return None
 
-    # Fetch all servers in parallel (reduced workers to prevent thread errors)
-    with ThreadPoolExecutor(max_workers=5) as ex:
-        futures = {ex.submit(fetch_one, i): i for i in range(total_servers)}
-        for fut in as_completed(futures):
-            if STOP_EVENT.is_set():
-                ex.shutdown(wait=False, cancel_futures=True)
-                break
-            res = fut.result()
-            if res:
-                servers.append(res)
-
-    servers.sort(key=lambda x: x.get("server_number", 0))
-    return servers
+    # gather keeps submission order, so the servers come back sorted by number
+    results = await asyncio.gather(*(fetch_one(i) for i in range(total_servers)))
+    return [res for res in results if res]
+
+class EpisodeIdTarget:
+    """lxml parser target that picks the episode ID out of a /watch/ page while it is parsed."""
+
+    def __init__(self):
+        self.episode_id: Optional[str] = None
+        self.script_text: List[str] = [] # Text of every <script>, searched once at the end
+        self._stack: List[bool] = [] # Per open element: is it the servers list?
+        self._in_list = 0
+        self._in_script = False
+
+    def start(self, tag, attrib):
+        is_list = "watch--servers--list" in attrib.get("class", "").split()
+        self._stack.append(is_list)
+        self._in_list += is_list
+        if tag == "li" and self.episode_id is None and self._in_list and "data-id" in attrib \
+                and "server--item" in attrib.get("class", "").split():
+            self.episode_id = attrib["data-id"].strip()
+        elif tag == "script":
+            self._in_script = True
+
+    def end(self, tag):
+        if self._stack:
+            self._in_list -= self._stack.pop()
+        if tag == "script" and self._in_script:
+            self.script_text.append("\n")
+            self._in_script = False
+
+    def data(self, text):
+        if self._in_script:
+            self.script_text.append(text)
 
-def extract_episode_id_from_watch_page(soup: BeautifulSoup) -> Optional[str]:
-    """Finds the internal episode ID from a /watch/ page."""
-    if not soup: return None
-    li = soup.select_one(".watch--servers--list li.server--item[data-id]")
-    if li and li.has_attr("data-id"):
-        return li["data-id"].strip()
-    for script in soup.find_all("script"):
-        if script.string:
-            m = REGEX_PATTERNS['episode_id'].search(script.string)
-            if m: return m.group(1)
-    return None
+    def close(self):
+        if self.episode_id is not None:
+            return self.episode_id
+        m = REGEX_PATTERNS['episode_id'].search("".join(self.script_text))
+        return m.group(1) if m else None
+
+def parse_episode_id(html: bytes) -> Optional[str]:
+    """Finds the internal episode ID from a /watch/ page (runs in the parser pool)."""
+    if not html: return None
+    try:
+        return etree.fromstring(html, etree.HTMLParser(target=EpisodeIdTarget(), encoding=PAGE_ENCODING))
+    except Exception:
+        return None
 
 def scrape_season_episodes(season_url: str) -> List[Dict]:
     """Scrapes all episodes and their servers for a given season URL."""
     if STOP_EVENT.is_set(): return []
     
-    # 1. Fetch season page directly (no /list/ or pagination)
-    soup = fetch_html(season_url)
-    if not soup: 
+    # 1. Fetch season page directly (no /list/ or pagination); cached for the trailer lookup
+    html = fetch_page_cached(season_url)
+    if html is None: 
+        if STOP_EVENT.is_set(): return []
         log_to_ui("fetch", f"🔥 [ERROR]   > Failed to fetch season page: {season_url}")
         return []
 
-    # Add anchors from page 1
-    all_anchors = soup.select('.allepcont .row > a')
+    # Add anchors from page 1 (only the episode list is parsed)
+    all_anchors = CSS_SELECTORS['episode_anchor'].select(make_soup(html, parse_only=EPISODE_LIST_STRAINER))
     if not all_anchors:
+        soup = make_soup(html) # Unusual layout: the fallback scans every link on the page
         all_anchors = [x for x in soup.find_all('a') if (x.find(class_='epnum') or (x.get('title') and ('الحلقة' in x.get('title') or 'Episode' in x.get('title'))))]
     
     episodes: List[Dict] = []
-    seen = set()
     
     log_to_ui("fetch", f"➡️ [DEBUG]   > Found {len(all_anchors)} total episodes.")
 
-    def process_episode(a):
+    # Drop duplicate anchors (same title, or same link when untitled) before any work; the first one wins
+    unique_anchors: Dict[str, Any] = {}
+    for a in all_anchors:
+        href = a.get('href')
+        key = a.get('title', '').strip() or (absolute_url(href).strip() if href else '')
+        if href and key:
+            unique_anchors.setdefault(key, a)
+
+    async def process_episode(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, a):
         if STOP_EVENT.is_set(): return None
         try:
             raw_href = a.get('href')
             if not raw_href: return None
+            raw_href = absolute_url(raw_href)
             
             ep_title = a.get('title', '').strip()
             ep_num_text = a.get_text(" ", strip=True)
             full_text_for_parse = f"{ep_title} {ep_num_text}"
-            
-            key = (ep_title.strip() or raw_href.strip())
-            if not key: return None
-            if key in seen: return None
-            seen.add(key)
 
             # --- New Episode Number Logic (FIX) ---
             ep_num_str: Optional[str] = None
@@ -382,10 +1065,10 @@ def scrape_season_episodes(season_url: str) -> List[Dict]:
                     num_str = complex_match.group(1).strip() # e.g., "12 و 13", "1115.5"
                     # Clean the string: "12 و 13" -> "12-13", "1115.5" -> "1115.5"
                     num_str = num_str.replace('و', '-').strip()
-                    num_str = re.sub(r'\s+', '', num_str)
+                    num_str = REGEX_PATTERNS['whitespace'].sub('', num_str)
                     
                     # Final check it's a valid-looking number string
-                    if re.search(r'[\d\.-]', num_str):
+                    if REGEX_PATTERNS['ep_num_chars'].search(num_str):
                         ep_num_str = num_str
 
             # Priority 3: Fallback to simple number extraction
@@ -401,28 +1084,29 @@ def scrape_season_episodes(season_url: str) -> List[Dict]:
             # --- End New Logic ---
 
             watch_url = raw_href.rstrip('/') + '/watch/'
-            ep_watch_soup = fetch_html(watch_url)
-            episode_id = extract_episode_id_from_watch_page(ep_watch_soup) if ep_watch_soup else None
-            
             server_list: List[Dict] = []
-            if episode_id:
-                server_list = get_episode_servers(episode_id, referer=watch_url, total_servers=10)
+            async with semaphore:
+                ep_watch_html = await fetch_page_async(session, watch_url)
+                episode_id = None
+                if ep_watch_html is not None:
+                    episode_id = await asyncio.get_running_loop().run_in_executor(
+                        None, run_parser, parse_episode_id, ep_watch_html)
+                if episode_id:
+                    server_list = await get_episode_servers_async(session, episode_id, referer=watch_url, total_servers=10)
             
             return {"episode_number": ep_num_str, "servers": server_list}
         except Exception as e:
             log_to_ui("fetch", f"🔥 [ERROR]   > processing episode {a.get('href')}: {e}")
             return None
 
-    # Fetch all episodes in parallel (reduced workers to prevent thread errors)
-    with ThreadPoolExecutor(max_workers=5) as ex:
-        futures = [ex.submit(process_episode, a) for a in all_anchors]
-        for fut in as_completed(futures):
-            if STOP_EVENT.is_set():
-                ex.shutdown(wait=False, cancel_futures=True)
-                break
-            res = fut.result()
-            if res:
-                episodes.append(res)
+    if STOP_EVENT.is_set(): return [] # Don't start a season's worth of episodes after a stop
+
+    async def process_all(session: aiohttp.ClientSession):
+        semaphore = asyncio.Semaphore(EPISODE_CONCURRENCY)
+        return await asyncio.gather(*(process_episode(session, semaphore, a) for a in unique_anchors.values()))
+
+    # Fetch all episodes concurrently on the fetch event loop instead of a thread per episode
+    episodes.extend(res for res in run_on_fetch_loop(process_all) if res)
 
     # Sort episodes based on the numeric value of their new string-based number
     episodes.sort(key=lambda e: get_sort_key(e.get("episode_number")))
@@ -450,7 +1134,7 @@ def extract_media_details(soup: BeautifulSoup) -> Dict:
             p = story.find('p')
             if p: details["synopsis"] = p.get_text(strip=True)
         
-        imdb_box = soup.select_one(".UnderPoster .imdbR")
+        imdb_box = CSS_SELECTORS['imdb_box'].select_one(soup)
         if imdb_box:
             sp = imdb_box.find("span")
             if sp:
@@ -460,33 +1144,36 @@ def extract_media_details(soup: BeautifulSoup) -> Dict:
         tax = soup.find('ul', class_='RightTaxContent')
         if tax:
             for li in tax.find_all('li'):
-                key_el = li.find('span')
+                # One walk over the item collects the key span, link texts and fallback strong
+                key_el = strong_el = None
+                links = []
+                for el in li.find_all(('span', 'a', 'strong')):
+                    if el.name == 'a':
+                        text = el.get_text(strip=True)
+                        if text: links.append(text)
+                    elif el.name == 'span':
+                        if key_el is None: key_el = el
+                    elif strong_el is None:
+                        strong_el = el
                 if key_el:
                     key = key_el.get_text(strip=True).replace(':', '')
-                    links = [a.get_text(strip=True) for a in li.find_all('a') if a.get_text(strip=True)]
-                    details["metadata"][key] = links if links else li.find('strong').get_text(strip=True) if li.find('strong') else ""
+                    details["metadata"][key] = links if links else strong_el.get_text(strip=True) if strong_el else ""
     except Exception:
         pass
     
-    key_mapping = {
-        "قسم المسلسل": "category", "قسم الفيلم": "category", "نوع المسلسل": "genres",
-        "نوع الفيلم": "genres", "النوع": "genres", "جودة المسلسل": "quality",
-        "جودة الفيلم": "quality", "عدد الحلقات": "episode_count", "توقيت المسلسل": "duration",
-        "توقيت الفيلم": "duration", "مدة الفيلم": "duration", "موعد الصدور": "release_year",
-        "سنة الانتاج": "release_year", "لغة المسلسل": "language", "لغة الفيلم": "language",
-        "دولة المسلسل": "country", "دولة الفيلم": "country", "المخرجين": "directors",
-        "المخرج": "directors", "بطولة": "cast"
-    }
-    
     mapped_metadata = {}
     for k, v in details["metadata"].items():
         clean_key = k.strip().rstrip(':')
-        new_key = key_mapping.get(clean_key, clean_key)
-        if new_key in key_mapping.values():
+        new_key = METADATA_KEY_MAPPING.get(clean_key, clean_key)
+        if new_key in METADATA_KEYS:
             mapped_metadata[new_key] = v
     details["metadata"] = mapped_metadata
     return details
 
+def parse_media_details(html: bytes) -> Dict:
+    """Parses a details page and extracts its media details (runs in the parser pool)."""
+    return extract_media_details(make_soup(html))
+
 def scrape_series(url: str) -> Optional[Dict]:
     """Scrapes a full series or anime, including all seasons and episodes."""
     if STOP_EVENT.is_set(): return None
@@ -499,10 +1186,10 @@ def scrape_series(url: str) -> Optional[Dict]:
     seen_urls = set()
     
     # Find season links
-    for s_el in soup.select('div.Small--Box.Season'):
+    for s_el in CSS_SELECTORS['season_box'].select(soup):
         a_el = s_el.find('a')
         if not a_el or not a_el.get('href'): continue
-        s_url = a_el.get('href')
+        s_url = absolute_url(a_el.get('href'))
         if s_url in seen_urls: continue
         seen_urls.add(s_url)
         s_title = a_el.get('title') or a_el.get_text(strip=True) or ""
@@ -530,19 +1217,22 @@ def scrape_series(url: str) -> Optional[Dict]:
     
     log_to_ui("fetch", f"➡️ [DEBUG]   > Found {len(seasons)} seasons.")
 
-    # Scrape episodes for each season
-    for season in seasons:
-        if STOP_EVENT.is_set(): break
-        s_num = season["season_number"]
-        if s_num in season_urls:
-            season["episodes"] = scrape_season_episodes(season_urls[s_num])
+    # Scrape episodes for each season; seasons are independent, so a small pool runs them side by side
+    with ThreadPoolExecutor(max_workers=SEASON_WORKERS) as ex:
+        futures = {ex.submit(scrape_season_episodes, season_urls[season["season_number"]]): season
+                   for season in seasons if season["season_number"] in season_urls}
+        for fut in as_completed(futures):
+            if STOP_EVENT.is_set():
+                ex.shutdown(wait=False, cancel_futures=True)
+                break
+            futures[fut]["episodes"] = fut.result() or []
 
     # Get trailer
     trailer_url = None
     if season_urls:
         first_season_url = list(season_urls.values())[0]
-        temp_soup = fetch_html(first_season_url)
-        if temp_soup and (first_ep_link := temp_soup.select_one(".allepcont .row > a")):
+        temp_soup = fetch_html(first_season_url, cached=True, parse_only=EPISODE_LIST_STRAINER) # Already fetched by scrape_season_episodes
+        if temp_soup and (first_ep_link := CSS_SELECTORS['episode_anchor'].select_one(temp_soup)):
             trailer_url = get_trailer_embed_url(url, first_ep_link.get("href"))
     if not trailer_url:
         trailer_url = get_trailer_embed_url(url, url)
@@ -557,16 +1247,16 @@ def scrape_movie(url: str) -> Optional[Dict]:
     """Scrapes a movie and its streaming servers."""
     if STOP_EVENT.is_set(): return None
     
-    details_soup = fetch_html(url)
-    if not details_soup: return None
+    details_html = fetch_page(url)
+    if details_html is None: return None
     
-    details = extract_media_details(details_soup)
+    details = run_parser(parse_media_details, details_html)
     
     watch_url = url.rstrip('/') + '/watch/'
-    watch_soup = fetch_html(watch_url)
-    if not watch_soup: return None
+    watch_html = fetch_page(watch_url)
+    if watch_html is None: return None
         
-    episode_id = extract_episode_id_from_watch_page(watch_soup)
+    episode_id = run_parser(parse_episode_id, watch_html)
     servers = []
     if episode_id:
         servers = get_episode_servers(episode_id, referer=watch_url)
@@ -579,7 +1269,7 @@ def scrape_movie(url: str) -> Optional[Dict]:
     # Add year from title if not in metadata
     year = None
     if details["metadata"].get("release_year"):
-        match = re.search(r'(\d{4})', str(details["metadata"]["release_year"]))
+        match = REGEX_PATTERNS['year4'].search(str(details["metadata"]["release_year"]))
         if match: year = int(match.group(1))
     if not year:
         year = extract_number_from_text(details["title"])
@@ -606,15 +1296,16 @@ def run_single(url_input: str) -> Tuple[Optional[Dict], Optional[str]]:
     error_message = None
     
     try:
-        if "فيلم" in url or REGEX_PATTERNS['movie'].search(url):
+        url_kind = route_url(url)
+        if url_kind == 'movie':
             show_type = 'movie'
             result = scrape_movie(url)
-        elif "انمي" in url or "anime" in url:
+        elif url_kind == 'anime':
             show_type = 'anime'
             result = scrape_series(url)
             if result:
                 result['type'] = 'anime' # Ensure type is correctly set
-        elif "مسلسل" in url or "series" in url:
+        elif url_kind == 'series':
             show_type = 'series'
             result = scrape_series(url)
             if result:
@@ -679,141 +1370,237 @@ def run_single(url_input: str) -> Tuple[Optional[Dict], Optional[str]]:
 
 # --- Database Class & Writer Thread ---
 
+def to_string(value) -> Optional[str]:
+    """Flattens a metadata value for a TEXT column: lists are comma-joined, empty values become None.
+    The columns hold display text, not JSON: the explorer renders them verbatim and exported DBs rely on it."""
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value if v)
+    return str(value) if value else None
+
+def show_row(show_data: Dict) -> tuple:
+    """Builds the SQL_INSERT_SHOW parameters for a scraped show (year parsing, list flattening)."""
+    metadata = show_data.get("metadata", {})
+    year = show_data.get("year")
+    if not year:
+        year_str = metadata.get("release_year") or metadata.get("year")
+        if year_str:
+            match = REGEX_PATTERNS['year4'].search(str(year_str))
+            if match:
+                year = int(match.group(1))
+    return (
+        show_data.get("title"), show_data.get("type", "series"),
+        show_data.get("poster"), show_data.get("synopsis"),
+        show_data.get("imdb_rating"), show_data.get("trailer"), year,
+        to_string(metadata.get("genres")), to_string(metadata.get("cast")),
+        to_string(metadata.get("directors")), to_string(metadata.get("country")),
+        to_string(metadata.get("language")), to_string(metadata.get("duration")),
+        show_data.get("source_url") # FIX: Insert source_url
+    )
+
+def server_numbers_json(servers: List[Dict]) -> str:
+    """The server numbers of a scraped parent as a JSON array, for SQL_DELETE_STALE_SERVERS."""
+    return orjson.dumps([server.get("server_number") for server in servers]).decode()
+
 class Database:
     """Database class to handle all DB operations in the writer thread."""
-    
-    def __init__(self, db_path: str):
+
+    # Hot-path statements. The SQL text is kept constant so sqlite3's per-connection
+    # statement cache hands back the already-compiled statement on every call.
+    SQL_INSERT_SHOW = """
+        INSERT INTO shows (title, type, poster, synopsis, imdb_rating, trailer, year,
+                           genres, cast, directors, country, language, duration, source_url)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(source_url) DO UPDATE SET source_url = excluded.source_url
+        RETURNING id""" # The no-op update makes RETURNING yield the existing id too, so no follow-up SELECT
+    SQL_INSERT_SEASON = "INSERT OR IGNORE INTO seasons (show_id, season_number, poster) VALUES (?, ?, ?)"
+    SQL_SELECT_SEASON_IDS = "SELECT season_number, id FROM seasons WHERE show_id = ?"
+    SQL_INSERT_EPISODE = "INSERT OR IGNORE INTO episodes (season_id, episode_number) VALUES (?, ?)"
+    SQL_SELECT_EPISODE_IDS = """
+        SELECT e.season_id, e.episode_number, e.id
+        FROM episodes e JOIN seasons s ON s.id = e.season_id WHERE s.show_id = ?"""
+    # Refreshing a parent's servers: upsert the scraped slots (an unchanged URL is not rewritten),
+    # then drop the slots the page no longer lists. The kept numbers are bound as one JSON array.
+    # Full chunks go through one SERVER_UPSERT_ROWS-row VALUES list, the remainder row by row;
+    # both texts are fixed, so each is compiled once per connection.
+    SQL_UPSERT_SERVER_CONFLICT = """
+        ON CONFLICT(parent_type, parent_id, server_number) DO UPDATE SET embed_url = excluded.embed_url
+        WHERE embed_url IS NOT excluded.embed_url"""
+    SQL_UPSERT_SERVER = f"""
+        INSERT INTO servers (embed_url, server_number, parent_type, parent_id) VALUES (?, ?, ?, ?)
+        {SQL_UPSERT_SERVER_CONFLICT}"""
+    SQL_UPSERT_SERVER_CHUNK = f"""
+        INSERT INTO servers (embed_url, server_number, parent_type, parent_id)
+        VALUES {", ".join(["(?, ?, ?, ?)"] * SERVER_UPSERT_ROWS)}
+        {SQL_UPSERT_SERVER_CONFLICT}"""
+    SQL_DELETE_STALE_SERVERS = """
+        DELETE FROM servers WHERE parent_type = ? AND parent_id = ?
+        AND server_number NOT IN (SELECT value FROM json_each(?))"""
+    SQL_MARK_PROGRESS = """
+        UPDATE scrape_progress SET status = ?, show_id = ?, error_message = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE url = ?"""
+    SQL_PROGRESS_COUNTS = "SELECT status, COUNT(*) FROM scrape_progress GROUP BY status" # Walks idx_progress_status_type_url in order
+    SQL_INSERT_PROGRESS = "INSERT OR IGNORE INTO scrape_progress (url, type) VALUES (?, ?)"
+    # All three are covering range scans of idx_progress_status_type_url: no table row is visited
+    SQL_PENDING_TYPE_COUNTS = "SELECT type, COUNT(*) FROM scrape_progress WHERE status = 'pending' GROUP BY type"
+    SQL_SELECT_PENDING_URLS = "SELECT url FROM scrape_progress WHERE status = 'pending'"
+    SQL_SELECT_PENDING_URLS_BY_TYPE = f"{SQL_SELECT_PENDING_URLS} AND type = ?"
+
+    def __init__(self, db_path: str, readonly: bool = False):
         self.db_path = db_path
         # Each thread MUST create its own connection.
         try:
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.conn.row_factory = sqlite3.Row
+            if readonly:
+                # Stats-only handle: a WAL reader never waits on (or blocks) the writer's transaction
+                self.conn = sqlite3.connect(f"file:{quote(os.path.abspath(db_path))}?mode=ro", uri=True,
+                                            check_same_thread=False, isolation_level=None,
+                                            cached_statements=SQLITE_STATEMENT_CACHE)
+                self.conn.execute("PRAGMA query_only = 1")
+                apply_pragmas(self.conn)
+                return
+            # isolation_level=None: sqlite3 never opens transactions behind our back; the writer
+            # BEGINs one per batch and bulk loads use savepoint(), so every COMMIT is deliberate
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                        cached_statements=SQLITE_STATEMENT_CACHE)
+            # Rows stay plain tuples: the writer only reads ids and counts by position
             self.conn.execute("PRAGMA foreign_keys = ON")
+            # WAL is persistent and set by init_database; re-asserting it here covers a DB file swapped in since startup
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            apply_pragmas(self.conn)
         except Exception as e:
             print(f"[DB ERROR] Could not connect to DB at {db_path}: {e}")
             self.conn = None
 
+    @classmethod
+    def open_readonly(cls, db_path: str) -> "Database":
+        """Opens a connection that can only read, for stats queries off the writer's connection."""
+        return cls(db_path, readonly=True)
+
+    @contextmanager
+    def savepoint(self, name: str = "show"):
+        """Nested transaction: everything written inside is kept on success and undone on an exception."""
+        self.conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute(f"ROLLBACK TO {name}")
+            self.conn.execute(f"RELEASE {name}")
+            raise
+        self.conn.execute(f"RELEASE {name}")
+
     def close(self):
         if self.conn:
             self.conn.commit()
             self.conn.close()
+            self.conn = None
+
+    def optimize(self):
+        """Refreshes planner statistics after bulk writes so the indexes get picked."""
+        if not self.conn: return
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except Exception as e:
+            log_to_ui("db", f"ERROR optimizing DB: {e}")
 
     def insert_show(self, show_data: Dict) -> Optional[int]:
         """Insert show and return ID"""
         if not self.conn: return None
-        cursor = self.conn.cursor()
         try:
-            title = show_data.get("title")
-            source_url = show_data.get("source_url") # FIX: Get source_url
-            metadata = show_data.get("metadata", {})
-            
-            def to_string(value):
-                if isinstance(value, list):
-                    return ", ".join(str(v) for v in value if v)
-                return str(value) if value else None
-            
-            year = show_data.get("year")
-            if not year:
-                year_str = metadata.get("release_year") or metadata.get("year")
-                if year_str:
-                    match = re.search(r'(\d{4})', str(year_str))
-                    if match:
-                        year = int(match.group(1))
-            
-            show_type = show_data.get("type", "series")
-
-            cursor.execute("""
-            INSERT INTO shows (title, type, poster, synopsis, imdb_rating, trailer, year, 
-                             genres, cast, directors, country, language, duration, source_url)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                title, show_type,
-                show_data.get("poster"), show_data.get("synopsis"),
-                show_data.get("imdb_rating"), show_data.get("trailer"), year,
-                to_string(metadata.get("genres")), to_string(metadata.get("cast")),
-                to_string(metadata.get("directors")), to_string(metadata.get("country")),
-                to_string(metadata.get("language")), to_string(metadata.get("duration")),
-                source_url # FIX: Insert source_url
-            ))
-            show_id = cursor.lastrowid
-            return show_id
-        except sqlite3.IntegrityError:
-            # FIX: Check based on source_url
-            cursor.execute("SELECT id FROM shows WHERE source_url = ?", (source_url,))
-            result = cursor.fetchone()
-            return result["id"] if result else None
+            # Fetchers attach the prepared row; anything queued without one is prepared here
+            params = show_data.get("show_row") or show_row(show_data)
+            row = self.conn.execute(self.SQL_INSERT_SHOW, params).fetchone() # New or already scraped, the show's id comes back either way
+            return row[0] if row else None
         except Exception as e:
             log_to_ui("db", f"ERROR inserting show: {e}")
             return None
 
     def insert_seasons_episodes_servers(self, show_id: int, seasons_data: List[Dict]):
-        """Inserts seasons, episodes, and servers for a show."""
+        """Inserts seasons, episodes, and servers for a show, one executemany per table."""
         if not self.conn: return
-        cursor = self.conn.cursor()
+        conn = self.conn
         try:
+            # 1. Seasons, then every season ID of the show in one query
+            conn.executemany(self.SQL_INSERT_SEASON, [(show_id, season.get("season_number", 1), season.get("poster"))
+                                                      for season in seasons_data])
+            season_ids = dict(conn.execute(self.SQL_SELECT_SEASON_IDS, (show_id,)).fetchall())
+
+            # 2. Episodes, then every episode ID of the show in one query
+            episode_rows = [(season_ids[season.get("season_number", 1)], episode.get("episode_number"))
+                            for season in seasons_data if season.get("season_number", 1) in season_ids
+                            for episode in season.get("episodes", [])]
+            conn.executemany(self.SQL_INSERT_EPISODE, episode_rows)
+            episode_ids = {(season_id, episode_num): episode_id for season_id, episode_num, episode_id
+                           in conn.execute(self.SQL_SELECT_EPISODE_IDS, (show_id,))}
+
+            # 3. Refresh the servers of every episode written above
+            server_rows = []
+            refreshed = []
             for season in seasons_data:
-                season_num = season.get("season_number", 1)
-                cursor.execute("INSERT OR IGNORE INTO seasons (show_id, season_number, poster) VALUES (?, ?, ?)", 
-                               (show_id, season_num, season.get("poster")))
-                
-                season_id = cursor.lastrowid
-                if season_id == 0: # Already exists
-                    cursor.execute("SELECT id FROM seasons WHERE show_id = ? AND season_number = ?", (show_id, season_num))
-                    result = cursor.fetchone()
-                    if result: season_id = result[0]
-                
+                season_id = season_ids.get(season.get("season_number", 1))
                 if not season_id: continue
-
                 for episode in season.get("episodes", []):
-                    cursor.execute("INSERT OR IGNORE INTO episodes (season_id, episode_number) VALUES (?, ?)", 
-                                   (season_id, episode.get("episode_number")))
-                    
-                    episode_id = cursor.lastrowid
-                    if episode_id == 0: # Already exists
-                        cursor.execute("SELECT id FROM episodes WHERE season_id = ? AND episode_number = ?", (season_id, episode.get("episode_number")))
-                        result = cursor.fetchone()
-                        if result: episode_id = result[0]
-                    
+                    episode_id = episode_ids.get((season_id, episode.get("episode_number")))
                     if not episode_id: continue
-                    
-                    # Delete old servers for this episode to refresh them
-                    cursor.execute("DELETE FROM servers WHERE parent_type = 'episode' AND parent_id = ?", (episode_id,))
-
-                    for server in episode.get("servers", []):
-                        cursor.execute("""
-                        INSERT INTO servers (embed_url, server_number, parent_type, parent_id) 
-                        VALUES (?, ?, 'episode', ?)
-                        """, (server.get("embed_url"), server.get("server_number"), episode_id))
+                    servers = episode.get("servers", [])
+                    refreshed.append(('episode', episode_id, server_numbers_json(servers)))
+                    server_rows.extend((server.get("embed_url"), server.get("server_number"), 'episode', episode_id)
+                                       for server in servers)
+
+            self.upsert_servers(server_rows)
+            conn.executemany(self.SQL_DELETE_STALE_SERVERS, refreshed)
         except Exception as e:
             log_to_ui("db", f"ERROR writing seasons: {e}")
+            raise # Let the writer roll back the whole show
+
+    def insert_full_show(self, url: str, show_data: Dict) -> Optional[int]:
+        """Writes a show with its seasons, episodes and servers, marks its URL completed, and returns the show ID.
+        Runs in a savepoint of the writer's batch transaction, so the rows land together or not at all."""
+        with self.savepoint():
+            show_id = self.insert_show(show_data)
+            if show_id:
+                if show_data.get("type") in ["series", "anime"]:
+                    self.insert_seasons_episodes_servers(show_id, show_data.get("seasons", []))
+                else:
+                    self.insert_movie_servers(show_id, show_data.get("streaming_servers", []))
+                # Not mark_progress: a failure here has to raise and undo the show's rows
+                self.conn.execute(self.SQL_MARK_PROGRESS, ("completed", show_id, None, url))
+        return show_id
+
+    def upsert_servers(self, server_rows: List[tuple]):
+        """Upserts (embed_url, server_number, parent_type, parent_id) rows, SERVER_UPSERT_ROWS per statement."""
+        full = len(server_rows) - len(server_rows) % SERVER_UPSERT_ROWS
+        for start in range(0, full, SERVER_UPSERT_ROWS):
+            self.conn.execute(self.SQL_UPSERT_SERVER_CHUNK,
+                              [value for row in server_rows[start:start + SERVER_UPSERT_ROWS] for value in row])
+        self.conn.executemany(self.SQL_UPSERT_SERVER, server_rows[full:])
 
     def insert_movie_servers(self, show_id: int, servers_data: List[Dict]):
         """Inserts servers for a movie, linking directly to the show."""
         if not self.conn: return
-        cursor = self.conn.cursor()
         try:
-            # Delete old servers for this movie to refresh them
-            cursor.execute("DELETE FROM servers WHERE parent_type = 'movie' AND parent_id = ?", (show_id,))
-            
-            for server in servers_data:
-                cursor.execute("""
-                INSERT INTO servers (embed_url, server_number, parent_type, parent_id) 
-                VALUES (?, ?, 'movie', ?)
-                """, (server.get("embed_url"), server.get("server_number"), show_id))
+            self.upsert_servers([(server.get("embed_url"), server.get("server_number"), 'movie', show_id)
+                                 for server in servers_data])
+            self.conn.execute(self.SQL_DELETE_STALE_SERVERS, ('movie', show_id, server_numbers_json(servers_data)))
         except Exception as e:
             log_to_ui("db", f"ERROR writing movie servers: {e}")
+            raise # Let the writer roll back the whole show
 
     def mark_progress(self, url: str, status: str, show_id: Optional[int] = None, error: Optional[str] = None):
         if not self.conn: return
-        cursor = self.conn.cursor()
         try:
-            cursor.execute("""
-            UPDATE scrape_progress SET status = ?, show_id = ?, error_message = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE url = ?
-            """, (status, show_id, error, url))
+            self.conn.execute(self.SQL_MARK_PROGRESS, (status, show_id, error, url))
         except Exception as e:
             log_to_ui("db", f"ERROR marking progress: {e}")
 
+    def get_progress_counts(self) -> Tuple[int, int, int, int]:
+        """Returns (total, pending, completed, failed) from scrape_progress in one index scan."""
+        counts = dict(self.conn.execute(self.SQL_PROGRESS_COUNTS).fetchall())
+        return sum(counts.values()), counts.get("pending", 0), counts.get("completed", 0), counts.get("failed", 0)
+
+    def get_pending_type_counts(self) -> Dict[str, int]:
+        """Returns pending URLs per bucket, counted by SQLite from the stored type column."""
+        counts = dict(self.conn.execute(self.SQL_PENDING_TYPE_COUNTS).fetchall())
+        return {"movies": counts.get("movies", 0), "series": counts.get("series", 0), "anime": counts.get("anime", 0)}
+
     def populate_and_get_pending_urls(self, scrape_type: str = "all") -> List[str]:
         """
         Reads all URLs from JSON files, injects them into the DB,
@@ -821,78 +1608,35 @@ class Database:
         scrape_type: 'all', 'movies', 'series', or 'anime'
         """
         if not self.conn: return []
-        cursor = self.conn.cursor()
-        all_urls = []
         log_to_ui("status", "Reading source JSON files...")
-        
-        # Read URLs from BOTH files
-        for file_path in JSON_FILES:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    file_urls = data.get("urls", [])
-                    if file_urls:
-                        all_urls.extend(file_urls)
-            except Exception as e:
-                log_to_ui("status", f"Error reading {file_path}: {e}")
-        
+
+        # Read URLs from BOTH files (cached, de-duplicated)
+        all_urls = get_all_urls_from_files()
+
         log_to_ui("status", f"Found {len(all_urls)} total URLs. Injecting new URLs into DB...")
-        
+
         # Inject all URLs into progress table
         if all_urls:
-            urls_to_insert = [(url,) for url in all_urls if url]
-            cursor.executemany("INSERT OR IGNORE INTO scrape_progress (url) VALUES (?)", urls_to_insert)
-            self.conn.commit()
+            with self.savepoint("populate"): # One transaction for the whole bulk insert
+                self.conn.executemany(self.SQL_INSERT_PROGRESS, ((url, get_url_type(url)) for url in all_urls))
         log_to_ui("status", "Database populated. Calculating stats...")
 
         # Get all stats from the DB
-        cursor.execute("SELECT COUNT(*) FROM scrape_progress")
-        total = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM scrape_progress WHERE status = 'pending'")
-        pending_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM scrape_progress WHERE status = 'completed'")
-        completed = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM scrape_progress WHERE status = 'failed'")
-        failed = cursor.fetchone()[0]
+        total, pending_count, completed, failed = self.get_progress_counts()
 
-        # Get pending URLs
-        cursor.execute("SELECT url FROM scrape_progress WHERE status = 'pending'")
-        all_pending_urls = [row[0] for row in cursor.fetchall()]
-        
-        # Filter URLs by type if specified
-        pending_urls = []
-        movies_count = 0
-        series_count = 0
-        anime_count = 0
-        
-        for url in all_pending_urls:
-            url_type = None
-            if "فيلم" in url or "movie" in url:
-                url_type = "movies"
-                movies_count += 1
-            elif "انمي" in url or "anime" in url:
-                url_type = "anime"
-                anime_count += 1
-            elif "مسلسل" in url or "series" in url:
-                url_type = "series"
-                series_count += 1
-            
-            # Add to pending_urls based on scrape_type filter
-            if scrape_type == "all" or scrape_type == url_type:
-                pending_urls.append(url)
+        # Get pending URLs, filtered by type in SQL if specified
+        if scrape_type == "all":
+            rows = self.conn.execute(self.SQL_SELECT_PENDING_URLS)
+        else:
+            rows = self.conn.execute(self.SQL_SELECT_PENDING_URLS_BY_TYPE, (scrape_type,))
+        pending_urls = [row[0] for row in rows]
                 
         # Update GLOBAL_STATE
-        GLOBAL_STATE["progress"]["total"] = total
-        GLOBAL_STATE["progress"]["pending"] = len(pending_urls) if scrape_type != "all" else pending_count
-        GLOBAL_STATE["progress"]["completed"] = completed
-        GLOBAL_STATE["progress"]["failed"] = failed
-        GLOBAL_STATE["counts"]["movies"] = movies_count
-        GLOBAL_STATE["counts"]["series"] = series_count
-        GLOBAL_STATE["counts"]["anime"] = anime_count
+        set_stats(
+            progress={"total": total, "completed": completed, "failed": failed,
+                      "pending": len(pending_urls) if scrape_type != "all" else pending_count},
+            counts=self.get_pending_type_counts(),
+        )
         
         log_to_ui("status", f"Ready to scrape {len(pending_urls)} pending {scrape_type} items.")
         return pending_urls
@@ -900,38 +1644,13 @@ class Database:
     def get_initial_stats(self):
         """Just read stats from DB without populating. Used on script launch."""
         if not self.conn: return
-        cursor = self.conn.cursor()
         try:
-            cursor.execute("SELECT COUNT(*) FROM scrape_progress")
-            total = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM scrape_progress WHERE status = 'pending'")
-            pending_count = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM scrape_progress WHERE status = 'completed'")
-            completed = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM scrape_progress WHERE status = 'failed'")
-            failed = cursor.fetchone()[0]
+            total, pending_count, completed, failed = self.get_progress_counts()
             
-            cursor.execute("SELECT url FROM scrape_progress WHERE status = 'pending'")
-            pending_urls = [row[0] for row in cursor.fetchall()]
-            
-            movies_count = 0
-            series_count = 0
-            anime_count = 0
-            for url in pending_urls:
-                if "فيلم" in url or "movie" in url:
-                    movies_count += 1
-                elif "انمي" in url:
-                    anime_count += 1
-                elif "مسلسل" in url or "series" in url:
-                    series_count += 1
-
-            GLOBAL_STATE["progress"]["total"] = total
-            GLOBAL_STATE["progress"]["pending"] = pending_count
-            GLOBAL_STATE["progress"]["completed"] = completed
-            GLOBAL_STATE["progress"]["failed"] = failed
-            GLOBAL_STATE["counts"]["movies"] = movies_count
-            GLOBAL_STATE["counts"]["series"] = series_count
-            GLOBAL_STATE["counts"]["anime"] = anime_count
+            set_stats(
+                progress={"total": total, "pending": pending_count, "completed": completed, "failed": failed},
+                counts=self.get_pending_type_counts(),
+            )
             log_to_ui("status", f"Idle. {pending_count} items pending.")
         except Exception as e:
             log_to_ui("status", f"Error loading initial stats: {e}")
@@ -939,10 +1658,8 @@ class Database:
     def get_all_urls_from_progress(self) -> set:
         """Helper to get all URLs currently in the progress table."""
         if not self.conn: return set()
-        cursor = self.conn.cursor()
         try:
-            cursor.execute("SELECT url FROM scrape_progress")
-            return set(row[0] for row in cursor.fetchall())
+            return {row[0] for row in self.conn.execute("SELECT url FROM scrape_progress")}
         except Exception as e:
             log_to_ui("db", f"ERROR getting all URLs: {e}")
             return set()
@@ -951,10 +1668,8 @@ class Database:
     def get_table_names(self) -> List[str]:
         """Returns a list of all table names in the DB."""
         if not self.conn: return []
-        cursor = self.conn.cursor()
         try:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name;")
-            return [row[0] for row in cursor.fetchall()]
+            return [row[0] for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name;")]
         except Exception as e:
             print(f"[DB ERROR] Failed to get table names: {e}")
             return []
@@ -969,13 +1684,12 @@ class Database:
         if table_name not in known_tables:
             return ["Error"], [{"Error": f"Table '{table_name}' does not exist."}]
         
-        cursor = self.conn.cursor()
         try:
             # Safe to use f-string now after validation
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT 100;")
+            cursor = self.conn.execute(f"SELECT * FROM {table_name} LIMIT 100;")
             
             headers = [desc[0] for desc in cursor.description]
-            rows = [dict(row) for row in cursor.fetchall()]
+            rows = [dict(zip(headers, row)) for row in cursor.fetchall()]
             return headers, rows
         except Exception as e:
             print(f"[DB ERROR] Failed to get data for table {table_name}: {e}")
@@ -987,89 +1701,83 @@ def writer_thread_task(db: Database):
     Reads from DATA_QUEUE and performs all DB writes sequentially.
     NOW ACCEPTS the DB object.
     """
-    commit_counter = 0
     running = True
     
     while running:
+        # Block for the first item, then drain whatever is already queued into the same transaction
+        batch = DATA_QUEUE.get_batch(WRITER_BATCH_SIZE) # Blocks until an item or the stop sentinel arrives
+
         try:
-            item = DATA_QUEUE.get(timeout=3) # Wait 3s for new items
+            if db.conn and not db.conn.in_transaction:
+                db.conn.execute("BEGIN IMMEDIATE") # Take the write lock once for the whole batch
+        except Exception as e:
+            log_to_ui("db", f"WRITER ERROR: {e}")
+
+        # Stats deltas are summed here and published under STATE_LOCK once per batch, not per item
+        progress_deltas = Counter()
+        count_deltas = Counter()
+        current_type = GLOBAL_STATE["current_scrape_type"] # Check current scrape type
+        for item in batch:
             if item is None: # Stop signal
                 running = False
-                DATA_QUEUE.task_done()
                 break
             
             if not db.conn:
                 log_to_ui("db", "DB connection lost. Writer thread stopping.")
                 running = False
-                DATA_QUEUE.task_done()
                 break
 
             url = item.get("url")
             result = item.get("result")
             error_msg = item.get("error")
             title = result.get("title", "Unknown") if result else "Unknown"
-            current_type = GLOBAL_STATE["current_scrape_type"] # Check current scrape type
+            count_key = None # Which remaining-count bucket this item drains
+            outcome = "failed"
             
             log_to_ui("db", f"WRITING: {title}")
             
-            if result:
-                show_id = db.insert_show(result)
-                if show_id:
-                    if result.get("type") in ["series", "anime"]:
-                        db.insert_seasons_episodes_servers(show_id, result.get("seasons", []))
-                        # FIX: Only decrement counts if NOT in sync mode
-                        if current_type != "sync":
-                            if result.get("type") == "anime":
-                                GLOBAL_STATE["counts"]["anime"] -= 1
-                            else:
-                                GLOBAL_STATE["counts"]["series"] -= 1
+            try:
+                if result:
+                    show_id = db.insert_full_show(url, result)
+                    if show_id:
+                        if result.get("type") in ["series", "anime"]:
+                            count_key = "anime" if result.get("type") == "anime" else "series"
+                        else:
+                            count_key = "movies"
+                        outcome = "completed"
                     else:
-                        db.insert_movie_servers(show_id, result.get("streaming_servers", []))
-                         # FIX: Only decrement counts if NOT in sync mode
-                        if current_type != "sync":
-                            GLOBAL_STATE["counts"]["movies"] -= 1
-                    
-                    db.mark_progress(url, "completed", show_id)
-                    GLOBAL_STATE["progress"]["completed"] += 1
+                        db.mark_progress(url, "failed", error="Duplicate or DB insert error")
                 else:
-                    db.mark_progress(url, "failed", error="Duplicate or DB insert error")
-                    GLOBAL_STATE["progress"]["failed"] += 1
-            else:
-                # This is a failure (scrape fail OR redflag)
-                db.mark_progress(url, "failed", error=error_msg)
-                GLOBAL_STATE["progress"]["failed"] += 1
-                # FIX: Only decrement counts if NOT in sync mode
-                if current_type != "sync":
-                    if "فيلم" in url or "movie" in url:
-                        GLOBAL_STATE["counts"]["movies"] -= 1
-                    elif "انمي" in url or "anime" in url: # FIX: Added 'or "anime" in url'
-                        GLOBAL_STATE["counts"]["anime"] -= 1
-                    elif "مسلسل" in url or "series" in url:
-                        GLOBAL_STATE["counts"]["series"] -= 1
-
-            GLOBAL_STATE["progress"]["pending"] -= 1
-            commit_counter += 1
-            if commit_counter >= 20: # Commit every 20 writes
-                db.conn.commit()
-                commit_counter = 0
-                
-            DATA_QUEUE.task_done()
-            
-        except queue.Empty:
-            # --- FIX: This is the critical fix for the race condition ---
-            # Check if fetchers are done *only if* the main scraper thread is no longer running
-            if not GLOBAL_STATE["scraper_running"] and DATA_QUEUE.qsize() == 0:
-                # This check ensures we only stop if the main thread has confirmed all fetchers are done
-                running = False
-            # If scraper is still running, just loop and wait for more items
-            pass
+                    # This is a failure (scrape fail OR redflag)
+                    db.mark_progress(url, "failed", error=error_msg)
+                    count_key = get_url_type(url)
+            except Exception as e:
+                # The show's partial writes were rolled back; record the failure instead
+                log_to_ui("db", f"WRITER ERROR: {e}")
+                db.mark_progress(url, "failed", error=f"DB write error: {e}")
+                outcome = "failed"
+                count_key = get_url_type(url)
+
+            progress_deltas[outcome] += 1
+            progress_deltas["pending"] -= 1
+            # FIX: Only decrement counts if NOT in sync mode
+            if count_key and current_type != "sync":
+                count_deltas[count_key] -= 1
+
+        try:
+            if db.conn:
+                db.conn.commit() # One commit per drained batch
+                invalidate_read_caches()
         except Exception as e:
             log_to_ui("db", f"WRITER ERROR: {e}")
-            if 'item' in locals() and item:
-                DATA_QUEUE.task_done()
+        if progress_deltas:
+            bump_stats(progress=progress_deltas, counts=count_deltas)
 
     log_to_ui("status", "Writer thread committing and shutting down.")
-    db.close() # Commits final changes and closes connection
+    db.optimize()
+    if db.conn:
+        db.conn.commit() # The connection stays open for the next type in the chain
+    invalidate_read_caches()
 
 # --- Main Scraper Control ---
 
@@ -1083,6 +1791,7 @@ def fetcher_task(url: str):
         if STOP_EVENT.is_set(): return
 
         if result:
+            result["show_row"] = show_row(result) # Prepared here, in parallel, so the single writer only binds it
             title = result.get("title", "Unknown")
             if result.get("type") == "movie":
                 log_to_ui("fetch", f"✅ [SUCCESS] Scraped {title} ({len(result.get('streaming_servers', []))} servers)")
@@ -1097,8 +1806,33 @@ def fetcher_task(url: str):
         log_to_ui("fetch", f"🔥 [ERROR] ✗ ERROR: {url.split('/')[-2]} ({e})")
         DATA_QUEUE.put({"url": url, "result": None, "error": str(e)})
 
-def start_scraper_thread(pending_urls: List[str], scrape_type: str = "all"):
-    """Main control function to start the writer and fetcher pool."""
+def get_writer_db() -> Database:
+    """Returns the long-lived writer Database, (re)opening it if there is no live connection.
+    Only one scrape or sync runs at a time, so the runs never share it concurrently."""
+    global WRITER_DB
+    if WRITER_DB is None or not WRITER_DB.conn:
+        WRITER_DB = Database(DB_PATH)
+    return WRITER_DB
+
+def start_scraper_thread(pending_urls: Optional[List[str]], scrape_type: str = "all"):
+    """
+    Main control function to start the writer and fetcher pool.
+    pending_urls=None loads the pending URLs of scrape_type from the source files first.
+    Every run and every auto-chained type writes through the same get_writer_db() connection.
+    """
+    db = get_writer_db()
+    if not db.conn:
+        log_to_ui("status", "FATAL: Could not start writer thread. DB connection failed.")
+        release_scraper()
+        return
+
+    if pending_urls is None:
+        try:
+            pending_urls = db.populate_and_get_pending_urls(scrape_type) # Filter by type
+        except Exception as e:
+            log_to_ui("status", f"Failed to get pending URLs: {e}")
+            release_scraper()
+            return
     
     # Determine worker count based on scrape type
     if scrape_type == "movies":
@@ -1109,70 +1843,55 @@ def start_scraper_thread(pending_urls: List[str], scrape_type: str = "all"):
         # Use lower count for safety when scraping all types
         worker_count = FETCHER_WORKERS_SERIES
     
-    # 1. Start the single writer thread
-    # It needs its own DB connection.
-    db = Database(DB_PATH) 
-    if not db.conn:
-        log_to_ui("status", "FATAL: Could not start writer thread. DB connection failed.")
-        GLOBAL_STATE["scraper_running"] = False
-        GLOBAL_STATE["current_scrape_type"] = None
-        return
-        
+    # 1. Start the single writer thread on the run's connection
     writer = threading.Thread(target=writer_thread_task, args=(db,), name="WriterThread")
     writer.start()
         
-    if not pending_urls:
-        log_to_ui("status", f"No pending {scrape_type} URLs found.")
-    else:
-        # 2. Start Fetchers
-        log_to_ui("status", f"Scraping {len(pending_urls)} {scrape_type} URLs with {worker_count} workers...")
-        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="Fetcher") as executor:
-            try:
-                # Submit tasks
-                for url in pending_urls:
-                    if STOP_EVENT.is_set():
-                        break
-                    executor.submit(fetcher_task, url)
-                
-                # Wait for tasks to complete (or be cancelled)
-                executor.shutdown(wait=True)
-
-            except KeyboardInterrupt:
-                log_to_ui("status", "Stop signal received! Shutting down fetchers...")
-                STOP_EVENT.set()
-                executor.shutdown(wait=False, cancel_futures=True)
-
-        log_to_ui("status", f"Finished scraping {scrape_type}. Waiting for writer...")
-
-    # 3. Signal and Stop
-    DATA_QUEUE.put(None) # Signal writer thread to stop
-    writer.join() # Wait for writer to finish
+    try:
+        if not pending_urls:
+            log_to_ui("status", f"No pending {scrape_type} URLs found.")
+        else:
+            # 2. Start Fetchers
+            log_to_ui("status", f"Scraping {len(pending_urls)} {scrape_type} URLs with {worker_count} workers...")
+            with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="Fetcher") as executor:
+                try:
+                    # Submit tasks
+                    for url in pending_urls:
+                        if STOP_EVENT.is_set():
+                            break
+                        executor.submit(fetcher_task, url)
+                    
+                    # Wait for tasks to complete (or be cancelled)
+                    executor.shutdown(wait=True)
+
+                except KeyboardInterrupt:
+                    log_to_ui("status", "Stop signal received! Shutting down fetchers...")
+                    STOP_EVENT.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+            log_to_ui("status", f"Finished scraping {scrape_type}. Waiting for writer...")
+    finally:
+        # 3. Signal and Stop
+        # All fetchers have returned, so the sentinel is queued behind every result. The writer blocks on
+        # the queue with no timeout, so this runs even if the fetch phase raised, or it would wait forever.
+        DATA_QUEUE.put(None) # Signal writer thread to stop
+        writer.join() # Wait for writer to finish
     
     # 4. Check if there's a next type to scrape
     # FIX: Do not auto-chain if this was a 'sync' task
-    if GLOBAL_STATE["scrape_queue"] and not STOP_EVENT.is_set() and scrape_type != "sync":
-        next_type = GLOBAL_STATE["scrape_queue"].pop(0)
+    next_type = advance_scrape_queue() if scrape_type != "sync" else None
+    if next_type:
         log_to_ui("status", f"Auto-starting next scrape type: {next_type}")
-        GLOBAL_STATE["current_scrape_type"] = next_type
         
-        # Load next batch of URLs
+        # Continue with next type (it loads its own batch of URLs on the same connection)
         try:
-            db = Database(DB_PATH)
-            next_pending_urls = db.populate_and_get_pending_urls(next_type)
-            db.close()
-            
-            # Continue with next type
-            start_scraper_thread(next_pending_urls, next_type)
+            start_scraper_thread(None, next_type)
         except Exception as e:
             log_to_ui("status", f"Failed to start next scrape type: {e}")
-            GLOBAL_STATE["scraper_running"] = False
-            GLOBAL_STATE["current_scrape_type"] = None
-            GLOBAL_STATE["scrape_queue"] = []
+            release_scraper()
     else:
         # All done
-        GLOBAL_STATE["scraper_running"] = False
-        GLOBAL_STATE["current_scrape_type"] = None
-        GLOBAL_STATE["scrape_queue"] = []
+        release_scraper()
         log_to_ui("status", "All scraping tasks completed!")
 
 def sync_thread_task(sitemap_url: str):
@@ -1183,12 +1902,11 @@ def sync_thread_task(sitemap_url: str):
         
         if not soup:
             log_to_ui("status", f"ERROR: Could not fetch sitemap URL.")
-            GLOBAL_STATE["scraper_running"] = False
-            GLOBAL_STATE["current_scrape_type"] = None
+            release_scraper()
             return
 
         urls_to_scrape = set()
-        sitemap_links = soup.select("#content table tbody tr a")
+        sitemap_links = CSS_SELECTORS['sitemap_link'].select(soup)
 
         log_to_ui("status", f"Parsing {len(sitemap_links)} links from sitemap...")
 
@@ -1207,49 +1925,37 @@ def sync_thread_task(sitemap_url: str):
         log_to_ui("status", f"Found {len(urls_to_scrape)} unique shows/movies to sync.")
         if not urls_to_scrape:
             log_to_ui("status", "Sync complete. No items found.")
-            GLOBAL_STATE["scraper_running"] = False
-            GLOBAL_STATE["current_scrape_type"] = None
+            release_scraper()
             return
 
-        db = Database(DB_PATH)
+        db = get_writer_db()
         if not db.conn:
              log_to_ui("status", "FATAL: Could not start sync. DB connection failed.")
-             GLOBAL_STATE["scraper_running"] = False
-             GLOBAL_STATE["current_scrape_type"] = None
+             release_scraper()
              return
              
-        cursor = db.conn.cursor()
         existing_urls = db.get_all_urls_from_progress()
         
-        pending_urls = []
-        new_item_count = 0
-
-        for url in urls_to_scrape:
-            if url not in existing_urls:
-                cursor.execute("INSERT OR IGNORE INTO scrape_progress (url) VALUES (?)", (url,))
-                pending_urls.append(url)
-                new_item_count += 1
-            else:
-                # It's an existing show, re-scrape it to check for new episodes
-                pending_urls.append(url)
-        
-        db.conn.commit()
-        db.close()
+        # Existing shows are re-scraped too, to check for new episodes
+        pending_urls = list(urls_to_scrape)
+        new_urls = [url for url in pending_urls if url not in existing_urls]
+        with db.savepoint("sync"): # One transaction for the whole bulk insert
+            db.conn.executemany(db.SQL_INSERT_PROGRESS, ((url, classify_url(url)) for url in new_urls))
+        new_item_count = len(new_urls)
 
         log_to_ui("status", f"Found {new_item_count} new items. Syncing {len(pending_urls)} total items...")
         
         # Reload stats to update totals
         load_initial_stats()
         # Override pending count to just what we are scraping
-        GLOBAL_STATE["progress"]["pending"] = len(pending_urls)
+        set_stats(progress={"pending": len(pending_urls)})
         
         # Call the main scraper engine with our prepared list
         start_scraper_thread(pending_urls, "sync")
 
     except Exception as e:
         log_to_ui("status", f"ERROR during sync: {e}")
-        GLOBAL_STATE["scraper_running"] = False
-        GLOBAL_STATE["current_scrape_type"] = None
+        release_scraper()
 
     
 # --- Flask Web Server ---
@@ -1259,566 +1965,601 @@ app = Flask(__name__)
 # --- HTML Templates ---
 
 # Main dashboard template
-MAIN_PAGE_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SCRAPER-TERMINAL v2.3</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=VT323&family=Share+Tech+Mono&display=swap');
-        
-        :root {
-            --bg-color: #0a0e14;
-            --terminal-bg: #0f1419;
-            --border-color: #00ff41;
-            --text-color: #00ff41;
-            --text-dim: #00aa33;
-            --accent-color: #00ffff;
-            --success-color: #00ff41;
-            --fail-color: #ff0055;
-            --warn-color: #ffaa00;
-            --redflag-color: #ff6e00;
-            --glow: 0 0 10px #00ff41, 0 0 20px #00ff41;
-        }
+MAIN_PAGE_CSS = """
+@import url('https://fonts.googleapis.com/css2?family=VT323&family=Share+Tech+Mono&display=swap');
+
+:root {
+    --bg-color: #0a0e14;
+    --terminal-bg: #0f1419;
+    --border-color: #00ff41;
+    --text-color: #00ff41;
+    --text-dim: #00aa33;
+    --accent-color: #00ffff;
+    --success-color: #00ff41;
+    --fail-color: #ff0055;
+    --warn-color: #ffaa00;
+    --redflag-color: #ff6e00;
+    --glow: 0 0 10px #00ff41, 0 0 20px #00ff41;
+}
 
-        body.theme-blue {
-            --border-color: #00ffff;
-            --text-color: #00ffff;
-            --text-dim: #00aaaa;
-            --accent-color: #00ff41;
-            --success-color: #00ff41;
-            --fail-color: #ff5555;
-            --warn-color: #ffff00;
-            --redflag-color: #ffaa00;
-            --glow: 0 0 10px #00ffff, 0 0 20px #00ffff;
-        }
+body.theme-blue {
+    --border-color: #00ffff;
+    --text-color: #00ffff;
+    --text-dim: #00aaaa;
+    --accent-color: #00ff41;
+    --success-color: #00ff41;
+    --fail-color: #ff5555;
+    --warn-color: #ffff00;
+    --redflag-color: #ffaa00;
+    --glow: 0 0 10px #00ffff, 0 0 20px #00ffff;
+}
 
-        body.theme-amber {
-            --border-color: #ffc400;
-            --text-color: #ffc400;
-            --text-dim: #b38a00;
-            --accent-color: #00ffff;
-            --success-color: #00ff41;
-            --fail-color: #ff4444;
-            --warn-color: #ffaa00;
-            --redflag-color: #ff6e00;
-            --glow: 0 0 10px #ffc400, 0 0 20px #ffc400;
-        }
-        
-        * {
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }
-        
-        body {
-            font-family: 'Share Tech Mono', monospace;
-            background: var(--bg-color);
-            color: var(--text-color);
-            overflow-x: hidden;
-            background-image: 
-                repeating-linear-gradient(0deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px),
-                repeating-linear-gradient(90deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px);
-            transition: color 0.3s, background-color 0.3s;
-        }
+body.theme-amber {
+    --border-color: #ffc400;
+    --text-color: #ffc400;
+    --text-dim: #b38a00;
+    --accent-color: #00ffff;
+    --success-color: #00ff41;
+    --fail-color: #ff4444;
+    --warn-color: #ffaa00;
+    --redflag-color: #ff6e00;
+    --glow: 0 0 10px #ffc400, 0 0 20px #ffc400;
+}
 
-        body.theme-blue {
-            background-image: 
-                repeating-linear-gradient(0deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px),
-                repeating-linear-gradient(90deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px);
-        }
-        body.theme-amber {
-            background-image: 
-                repeating-linear-gradient(0deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px),
-                repeating-linear-gradient(90deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px);
-        }
-        
-        .scanline {
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(to bottom, transparent 50%, rgba(0,255,65,0.02) 51%);
-            background-size: 100% 4px;
-            pointer-events: none;
-            z-index: 9999;
-            animation: scanline 8s linear infinite;
-        }
-        
-        @keyframes scanline {
-            0% { background-position: 0 0; }
-            100% { background-position: 0 100%; }
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        header {
-            border: 2px solid var(--border-color);
-            padding: 20px;
-            margin-bottom: 20px;
-            background: var(--terminal-bg);
-            box-shadow: var(--glow);
-            animation: flicker 0.15s infinite alternate;
-            transition: border-color 0.3s, box-shadow 0.3s;
-        }
-        
-        @keyframes flicker {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.97; }
-        }
-        
-        .terminal-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-bottom: 15px;
-        }
-        
-        h1 {
-            font-family: 'VT323', monospace;
-            font-size: 32px;
-            letter-spacing: 2px;
-            text-shadow: var(--glow);
-            animation: glitch 3s infinite;
-            transition: text-shadow 0.3s;
-        }
-        
-        @keyframes glitch {
-            0%, 90%, 100% { text-shadow: var(--glow); }
-            92% { text-shadow: 2px 0 0 var(--fail-color), -2px 0 0 var(--accent-color); }
-            94% { text-shadow: -2px 0 0 var(--fail-color), 2px 0 0 var(--accent-color); }
-        }
+* {
+    box-sizing: border-box;
+    margin: 0;
+    padding: 0;
+}
 
-        .header-utils {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
+body {
+    font-family: 'Share Tech Mono', monospace;
+    background: var(--bg-color);
+    color: var(--text-color);
+    overflow-x: hidden;
+    background-image: 
+        repeating-linear-gradient(0deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px),
+        repeating-linear-gradient(90deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px);
+    transition: color 0.3s, background-color 0.3s;
+}
 
-        .header-utils a {
-            font-family: 'Share Tech Mono', monospace;
-            font-size: 14px;
-            padding: 8px 12px;
-            border: 1px solid var(--border-color);
-            background: var(--terminal-bg);
-            color: var(--text-color);
-            text-decoration: none;
-            border-radius: 8px;
-            transition: all 0.2s;
-        }
-        .header-utils a:hover {
-            background: var(--border-color);
-            color: var(--terminal-bg);
-            box-shadow: 0 0 15px var(--border-color);
-        }
+body.theme-blue {
+    background-image: 
+        repeating-linear-gradient(0deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px),
+        repeating-linear-gradient(90deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px);
+}
+body.theme-amber {
+    background-image: 
+        repeating-linear-gradient(0deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px),
+        repeating-linear-gradient(90deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px);
+}
 
-        .theme-selector {
-            display: flex;
-            gap: 5px;
-            border: 1px solid var(--text-dim);
-            border-radius: 8px;
-            padding: 5px;
-        }
-        .theme-selector span {
-            padding: 5px 8px;
-            cursor: pointer;
-            border-radius: 5px;
-            transition: all 0.2s;
-            font-size: 12px;
-        }
-        .theme-selector span:hover {
-            background: var(--text-dim);
-            color: var(--terminal-bg);
-        }
-        .theme-selector span.active {
-            background: var(--border-color);
-            color: var(--terminal-bg);
-            font-weight: bold;
-        }
+.scanline {
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(to bottom, transparent 50%, rgba(0,255,65,0.02) 51%);
+    background-size: 100% 4px;
+    pointer-events: none;
+    z-index: 9999;
+    animation: scanline 8s linear infinite;
+}
 
-        .controls {
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-            margin-bottom: 15px; /* Added margin */
-        }
-        
-        .controls button {
-            font-family: 'Share Tech Mono', monospace;
-            font-size: 14px;
-            padding: 12px 20px;
-            border: 2px solid var(--border-color);
-            background: var(--terminal-bg);
-            color: var(--text-color);
-            cursor: pointer;
-            transition: all 0.2s;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            position: relative;
-            overflow: hidden;
-            border-radius: 8px;
-        }
-        
-        .controls button::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: rgba(255,255,255,0.2);
-            transition: left 0.3s;
-        }
-        
-        .controls button:hover:not(:disabled)::before {
-            left: 100%;
-        }
-        
-        .controls button:hover:not(:disabled) {
-            box-shadow: 0 0 15px var(--border-color);
-            transform: translateY(-2px);
-        }
-        
-        .controls button:disabled {
-            opacity: 0.5;
-            cursor: not-allowed;
-        }
-        
-        .controls button.running {
-            animation: pulse 1s infinite;
-            border-color: var(--accent-color);
-            color: var(--accent-color);
-        }
-        
-        @keyframes pulse {
-            0%, 100% { box-shadow: 0 0 5px var(--accent-color); }
-            50% { box-shadow: 0 0 20px var(--accent-color); }
-        }
-        
-        .controls button.stop-btn {
-            border-color: var(--fail-color);
-            color: var(--fail-color);
-        }
-        
-        .controls button.stop-btn:hover {
-            background: var(--fail-color);
-            color: var(--terminal-bg);
-            box-shadow: 0 0 15px var(--fail-color);
-        }
-        
-        .controls button.stopped {
-            display: none;
-        }
+@keyframes scanline {
+    0% { background-position: 0 0; }
+    100% { background-position: 0 100%; }
+}
 
-        /* NEW: Sitemap controls */
-        .controls-sitemap {
-            display: flex;
-            gap: 10px;
-            width: 100%;
-        }
-        .controls-sitemap input[type="text"] {
-            flex: 1;
-            background: var(--terminal-bg);
-            border: 2px solid var(--border-color);
-            color: var(--text-color);
-            padding: 12px 20px;
-            font-family: 'Share Tech Mono', monospace;
-            font-size: 14px;
-            border-radius: 8px;
-            transition: border-color 0.3s;
-        }
-        .controls-sitemap input[type="text"]::placeholder {
-            color: var(--text-dim);
-        }
-        .controls-sitemap button {
-            font-family: 'Share Tech Mono', monospace;
-            font-size: 14px;
-            padding: 12px 20px;
-            border: 2px solid var(--warn-color);
-            background: var(--terminal-bg);
-            color: var(--warn-color);
-            cursor: pointer;
-            transition: all 0.2s;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            border-radius: 8px;
-        }
-        .controls-sitemap button:hover:not(:disabled) {
-            background: var(--warn-color);
-            color: var(--terminal-bg);
-            box-shadow: 0 0 15px var(--warn-color);
-        }
-        .controls-sitemap button:disabled {
-            opacity: 0.5;
-            cursor: not-allowed;
-        }
-        
-        .terminal-panel {
-            border: 2px solid var(--border-color);
-            background: var(--terminal-bg);
-            padding: 20px;
-            margin-bottom: 20px;
-            box-shadow: 0 0 10px rgba(0,255,65,0.3);
-            transition: border-color 0.3s, box-shadow 0.3s;
-        }
-        
-        .panel-header {
-            font-size: 18px;
-            margin-bottom: 15px;
-            padding-bottom: 10px;
-            border-bottom: 1px solid var(--text-dim);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: border-color 0.3s;
-        }
-        
-        .panel-header::before {
-            content: '> ';
-            color: var(--accent-color);
-        }
-        
-        .status-indicator {
-            display: inline-block;
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            background: var(--text-dim);
-            margin-left: 10px;
-            animation: blink 2s infinite;
-        }
-        
-        .status-indicator.active {
-            background: var(--success-color);
-            box-shadow: 0 0 10px var(--success-color);
-        }
-        
-        @keyframes blink {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.3; }
-        }
-        
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }
-        
-        .stat-box {
-            border: 1px solid var(--text-dim);
-            padding: 15px;
-            text-align: center;
-            background: rgba(0,0,0,0.1);
-            transition: all 0.3s;
-        }
-        
-        .stat-box:hover {
-            border-color: var(--border-color);
-            background: rgba(0,0,0,0.2);
-            transform: scale(1.05);
-        }
-        
-        .stat-box strong {
-            display: block;
-            font-size: 32px;
-            font-family: 'VT323', monospace;
-            margin-bottom: 5px;
-            text-shadow: 0 0 10px currentColor;
-        }
-        
-        .stat-box span {
-            font-size: 11px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            color: var(--text-dim);
-        }
-        
-        .progress-container {
-            margin-top: 20px;
-            border: 1px solid var(--border-color);
-            height: 30px;
-            position: relative;
-            overflow: hidden;
-            background: rgba(0,0,0,0.5);
-            transition: border-color 0.3s;
-        }
-        
-        .progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, var(--success-color), var(--accent-color));
-            transition: width 0.5s, background 0.3s;
-            position: relative;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: bold;
-            color: var(--terminal-bg);
-            text-shadow: none;
-        }
-        
-        .progress-fill::after {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
-            animation: shimmer 2s infinite;
-        }
-        
-        @keyframes shimmer {
-            0% { transform: translateX(-100%); }
-            100% { transform: translateX(100%); }
-        }
-        
-        .logs-grid {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-        }
-        
-        @media (max-width: 968px) {
-            .logs-grid {
-                grid-template-columns: 1fr;
-            }
-        }
-        
-        .log-panel {
-            border: 2px solid var(--border-color);
-            background: var(--terminal-bg);
-            padding: 15px;
-            height: 400px;
-            display: flex;
-            flex-direction: column;
-            box-shadow: 0 0 10px rgba(0,255,65,0.3);
-            transition: border-color 0.3s, box-shadow 0.3s;
-        }
-        
-        .log-header {
-            font-size: 16px;
-            margin-bottom: 10px;
-            padding-bottom: 8px;
-            border-bottom: 1px solid var(--text-dim);
-            color: var(--accent-color);
-            transition: border-color 0.3s, color 0.3s;
-        }
-        
-        .log-content {
-            flex: 1;
-            overflow-y: auto;
-            overflow-x: hidden;
-            font-size: 13px;
-            line-height: 1.6;
-            padding: 10px;
-            background: rgba(0,0,0,0.3);
-            border: 1px solid var(--text-dim);
-            transition: border-color 0.3s;
-        }
-        
-        .log-content::-webkit-scrollbar {
-            width: 10px;
-        }
-        
-        .log-content::-webkit-scrollbar-track {
-            background: var(--terminal-bg);
-            border-left: 1px solid var(--text-dim);
-        }
-        
-        .log-content::-webkit-scrollbar-thumb {
-            background: var(--border-color);
-            box-shadow: inset 0 0 5px rgba(255,255,255,0.5);
-        }
-        
-        .log-content::-webkit-scrollbar-thumb:hover {
-            background: var(--success-color);
-        }
-        
-        #live-fetch-logs {
-            display: flex;
-            flex-direction: column;
-        }
-        
-        .log-line {
-            padding: 2px 0;
-            white-space: pre-wrap;
-            word-break: break-all;
-            animation: fadeIn 0.3s;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateX(-10px); }
-            to { opacity: 1; transform: translateX(0); }
-        }
-        
-        .log-line.success { color: var(--success-color); }
-        .log-line.success::before { content: '✅ '; }
-        
-        .log-line.error { color: var(--fail-color); }
-        .log-line.error::before { content: '🔥 '; }
-        
-        .log-line.warn { color: var(--warn-color); }
-        .log-line.warn::before { content: '⚠️ '; }
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+    padding: 20px;
+}
 
-        .log-line.redflag { color: var(--redflag-color); }
-        .log-line.redflag::before { content: '🟠 '; }
+header {
+    border: 2px solid var(--border-color);
+    padding: 20px;
+    margin-bottom: 20px;
+    background: var(--terminal-bg);
+    box-shadow: var(--glow);
+    animation: flicker 0.15s infinite alternate;
+    transition: border-color 0.3s, box-shadow 0.3s;
+}
 
-        .log-line.debug { color: var(--accent-color); }
-        .log-line.debug::before { content: '➡️ '; }
+@keyframes flicker {
+    0%, 100% { opacity: 1; }
+    50% { opacity: 0.97; }
+}
 
-        .log-line.start { color: var(--text-color); font-weight: bold; }
-        .log-line.start::before { content: 'START: '; color: var(--text-dim); }
+.terminal-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    flex-wrap: wrap;
+    gap: 10px;
+    margin-bottom: 15px;
+}
 
-        .log-line.info { color: var(--text-dim); }
-        .log-line.info::before { content: '$ '; color: var(--text-dim); }
-        
-        #live-db-log {
-            padding: 10px;
-            background: rgba(0,0,0,0.3);
-            border: 1px solid var(--text-dim);
-            color: var(--accent-color);
-            font-size: 14px;
-            min-height: 50px;
-            display: flex;
-            align-items: center;
-            transition: border-color 0.3s, color 0.3s;
-        }
-        
-        #live-db-log::before {
-            content: '>>> ';
-            color: var(--success-color);
-            font-weight: bold;
-        }
-        
-        .typing-cursor::after {
-            content: '▊';
-            animation: blink 1s infinite;
-        }
-        
-        .queue-info {
-            font-size: 12px;
-            color: var(--warn-color);
-            margin-top: 10px;
-            padding: 8px;
-            border: 1px dashed var(--text-dim);
-            background: rgba(255,170,0,0.05);
-        }
-        
-        .queue-info::before {
-            content: '⚡ AUTO-CHAIN QUEUE: ';
-            font-weight: bold;
-        }
-    </style>
+h1 {
+    font-family: 'VT323', monospace;
+    font-size: 32px;
+    letter-spacing: 2px;
+    text-shadow: var(--glow);
+    animation: glitch 3s infinite;
+    transition: text-shadow 0.3s;
+}
+
+@keyframes glitch {
+    0%, 90%, 100% { text-shadow: var(--glow); }
+    92% { text-shadow: 2px 0 0 var(--fail-color), -2px 0 0 var(--accent-color); }
+    94% { text-shadow: -2px 0 0 var(--fail-color), 2px 0 0 var(--accent-color); }
+}
+
+.header-utils {
+    display: flex;
+    align-items: center;
+    gap: 15px;
+}
+
+.header-utils a {
+    font-family: 'Share Tech Mono', monospace;
+    font-size: 14px;
+    padding: 8px 12px;
+    border: 1px solid var(--border-color);
+    background: var(--terminal-bg);
+    color: var(--text-color);
+    text-decoration: none;
+    border-radius: 8px;
+    transition: all 0.2s;
+}
+.header-utils a:hover {
+    background: var(--border-color);
+    color: var(--terminal-bg);
+    box-shadow: 0 0 15px var(--border-color);
+}
+
+.theme-selector {
+    display: flex;
+    gap: 5px;
+    border: 1px solid var(--text-dim);
+    border-radius: 8px;
+    padding: 5px;
+}
+.theme-selector span {
+    padding: 5px 8px;
+    cursor: pointer;
+    border-radius: 5px;
+    transition: all 0.2s;
+    font-size: 12px;
+}
+.theme-selector span:hover {
+    background: var(--text-dim);
+    color: var(--terminal-bg);
+}
+.theme-selector span.active {
+    background: var(--border-color);
+    color: var(--terminal-bg);
+    font-weight: bold;
+}
+
+.controls {
+    display: flex;
+    gap: 10px;
+    flex-wrap: wrap;
+    margin-bottom: 15px; /* Added margin */
+}
+
+.controls button {
+    font-family: 'Share Tech Mono', monospace;
+    font-size: 14px;
+    padding: 12px 20px;
+    border: 2px solid var(--border-color);
+    background: var(--terminal-bg);
+    color: var(--text-color);
+    cursor: pointer;
+    transition: all 0.2s;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+    position: relative;
+    overflow: hidden;
+    border-radius: 8px;
+}
+
+.controls button::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: -100%;
+    width: 100%;
+    height: 100%;
+    background: rgba(255,255,255,0.2);
+    transition: left 0.3s;
+}
+
+.controls button:hover:not(:disabled)::before {
+    left: 100%;
+}
+
+.controls button:hover:not(:disabled) {
+    box-shadow: 0 0 15px var(--border-color);
+    transform: translateY(-2px);
+}
+
+.controls button:disabled {
+    opacity: 0.5;
+    cursor: not-allowed;
+}
+
+.controls button.running {
+    animation: pulse 1s infinite;
+    border-color: var(--accent-color);
+    color: var(--accent-color);
+}
+
+@keyframes pulse {
+    0%, 100% { box-shadow: 0 0 5px var(--accent-color); }
+    50% { box-shadow: 0 0 20px var(--accent-color); }
+}
+
+.controls button.stop-btn {
+    border-color: var(--fail-color);
+    color: var(--fail-color);
+}
+
+.controls button.stop-btn:hover {
+    background: var(--fail-color);
+    color: var(--terminal-bg);
+    box-shadow: 0 0 15px var(--fail-color);
+}
+
+.controls button.stopped {
+    display: none;
+}
+
+/* NEW: Sitemap controls */
+.controls-sitemap {
+    display: flex;
+    gap: 10px;
+    width: 100%;
+}
+.controls-sitemap input[type="text"] {
+    flex: 1;
+    background: var(--terminal-bg);
+    border: 2px solid var(--border-color);
+    color: var(--text-color);
+    padding: 12px 20px;
+    font-family: 'Share Tech Mono', monospace;
+    font-size: 14px;
+    border-radius: 8px;
+    transition: border-color 0.3s;
+}
+.controls-sitemap input[type="text"]::placeholder {
+    color: var(--text-dim);
+}
+.controls-sitemap button {
+    font-family: 'Share Tech Mono', monospace;
+    font-size: 14px;
+    padding: 12px 20px;
+    border: 2px solid var(--warn-color);
+    background: var(--terminal-bg);
+    color: var(--warn-color);
+    cursor: pointer;
+    transition: all 0.2s;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+    border-radius: 8px;
+}
+.controls-sitemap button:hover:not(:disabled) {
+    background: var(--warn-color);
+    color: var(--terminal-bg);
+    box-shadow: 0 0 15px var(--warn-color);
+}
+.controls-sitemap button:disabled {
+    opacity: 0.5;
+    cursor: not-allowed;
+}
+
+.terminal-panel {
+    border: 2px solid var(--border-color);
+    background: var(--terminal-bg);
+    padding: 20px;
+    margin-bottom: 20px;
+    box-shadow: 0 0 10px rgba(0,255,65,0.3);
+    transition: border-color 0.3s, box-shadow 0.3s;
+}
+
+.panel-header {
+    font-size: 18px;
+    margin-bottom: 15px;
+    padding-bottom: 10px;
+    border-bottom: 1px solid var(--text-dim);
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    transition: border-color 0.3s;
+}
+
+.panel-header::before {
+    content: '> ';
+    color: var(--accent-color);
+}
+
+.status-indicator {
+    display: inline-block;
+    width: 12px;
+    height: 12px;
+    border-radius: 50%;
+    background: var(--text-dim);
+    margin-left: 10px;
+    animation: blink 2s infinite;
+}
+
+.status-indicator.active {
+    background: var(--success-color);
+    box-shadow: 0 0 10px var(--success-color);
+}
+
+@keyframes blink {
+    0%, 100% { opacity: 1; }
+    50% { opacity: 0.3; }
+}
+
+.stats-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+    gap: 15px;
+    margin: 20px 0;
+}
+
+.stat-box {
+    border: 1px solid var(--text-dim);
+    padding: 15px;
+    text-align: center;
+    background: rgba(0,0,0,0.1);
+    transition: all 0.3s;
+}
+
+.stat-box:hover {
+    border-color: var(--border-color);
+    background: rgba(0,0,0,0.2);
+    transform: scale(1.05);
+}
+
+.stat-box strong {
+    display: block;
+    font-size: 32px;
+    font-family: 'VT323', monospace;
+    margin-bottom: 5px;
+    text-shadow: 0 0 10px currentColor;
+}
+
+.stat-box span {
+    font-size: 11px;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+    color: var(--text-dim);
+}
+
+.progress-container {
+    margin-top: 20px;
+    border: 1px solid var(--border-color);
+    height: 30px;
+    position: relative;
+    overflow: hidden;
+    background: rgba(0,0,0,0.5);
+    transition: border-color 0.3s;
+}
+
+.progress-fill {
+    height: 100%;
+    background: linear-gradient(90deg, var(--success-color), var(--accent-color));
+    transition: width 0.5s, background 0.3s;
+    position: relative;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-weight: bold;
+    color: var(--terminal-bg);
+    text-shadow: none;
+}
+
+.progress-fill::after {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    bottom: 0;
+    background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
+    animation: shimmer 2s infinite;
+}
+
+@keyframes shimmer {
+    0% { transform: translateX(-100%); }
+    100% { transform: translateX(100%); }
+}
+
+.logs-grid {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 20px;
+}
+
+@media (max-width: 968px) {
+    .logs-grid {
+        grid-template-columns: 1fr;
+    }
+}
+
+.log-panel {
+    border: 2px solid var(--border-color);
+    background: var(--terminal-bg);
+    padding: 15px;
+    height: 400px;
+    display: flex;
+    flex-direction: column;
+    box-shadow: 0 0 10px rgba(0,255,65,0.3);
+    transition: border-color 0.3s, box-shadow 0.3s;
+}
+
+.log-header {
+    font-size: 16px;
+    margin-bottom: 10px;
+    padding-bottom: 8px;
+    border-bottom: 1px solid var(--text-dim);
+    color: var(--accent-color);
+    transition: border-color 0.3s, color 0.3s;
+}
+
+.log-content {
+    flex: 1;
+    overflow-y: auto;
+    overflow-x: hidden;
+    font-size: 13px;
+    line-height: 1.6;
+    padding: 10px;
+    background: rgba(0,0,0,0.3);
+    border: 1px solid var(--text-dim);
+    transition: border-color 0.3s;
+}
+
+.log-content::-webkit-scrollbar {
+    width: 10px;
+}
+
+.log-content::-webkit-scrollbar-track {
+    background: var(--terminal-bg);
+    border-left: 1px solid var(--text-dim);
+}
+
+.log-content::-webkit-scrollbar-thumb {
+    background: var(--border-color);
+    box-shadow: inset 0 0 5px rgba(255,255,255,0.5);
+}
+
+.log-content::-webkit-scrollbar-thumb:hover {
+    background: var(--success-color);
+}
+
+#live-fetch-logs {
+    position: relative;
+}
+
+/* Windowed log: the spacer is as tall as every line, the window holds only the visible rows */
+.log-spacer {
+    position: relative;
+}
+
+.log-window {
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+}
+
+.log-window .log-line {
+    height: 22px; /* LOG_ROW_HEIGHT in the script */
+    line-height: 22px;
+    padding: 0;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+}
+
+.log-line {
+    padding: 2px 0;
+    white-space: pre-wrap;
+    word-break: break-all;
+    animation: fadeIn 0.3s;
+}
+
+/* Set by the script while lines arrive faster than LOG_BURST_RATE: rows just appear */
+.burst .log-line {
+    animation: none;
+}
+
+@keyframes fadeIn {
+    from { opacity: 0; transform: translateX(-10px); }
+    to { opacity: 1; transform: translateX(0); }
+}
+
+.log-line.success { color: var(--success-color); }
+.log-line.success::before { content: '✅ '; }
+
+.log-line.error { color: var(--fail-color); }
+.log-line.error::before { content: '🔥 '; }
+
+.log-line.warn { color: var(--warn-color); }
+.log-line.warn::before { content: '⚠️ '; }
+
+.log-line.redflag { color: var(--redflag-color); }
+.log-line.redflag::before { content: '🟠 '; }
+
+.log-line.debug { color: var(--accent-color); }
+.log-line.debug::before { content: '➡️ '; }
+
+.log-line.start { color: var(--text-color); font-weight: bold; }
+.log-line.start::before { content: 'START: '; color: var(--text-dim); }
+
+.log-line.info { color: var(--text-dim); }
+.log-line.info::before { content: '$ '; color: var(--text-dim); }
+
+#live-db-log {
+    padding: 10px;
+    background: rgba(0,0,0,0.3);
+    border: 1px solid var(--text-dim);
+    color: var(--accent-color);
+    font-size: 14px;
+    min-height: 50px;
+    display: flex;
+    align-items: center;
+    transition: border-color 0.3s, color 0.3s;
+}
+
+#live-db-log::before {
+    content: '>>> ';
+    color: var(--success-color);
+    font-weight: bold;
+}
+
+.typing-cursor::after {
+    content: '▊';
+    animation: blink 1s infinite;
+}
+
+/* Scanlines, flicker, glitch, pulses and fade-ins all stop for users who ask for less motion */
+@media (prefers-reduced-motion: reduce) {
+    *, *::before, *::after {
+        animation: none !important;
+        transition: none !important;
+    }
+}
+
+.queue-info {
+    font-size: 12px;
+    color: var(--warn-color);
+    margin-top: 10px;
+    padding: 8px;
+    border: 1px dashed var(--text-dim);
+    background: rgba(255,170,0,0.05);
+}
+
+.queue-info::before {
+    content: '⚡ AUTO-CHAIN QUEUE: ';
+    font-weight: bold;
+}
+"""
+
+MAIN_PAGE_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>SCRAPER-TERMINAL v2.3</title>
+    <link rel="stylesheet" href="{{ stylesheet_url('dashboard.css') }}">
 </head>
 <body class="theme-green">
     <div class="scanline"></div>
@@ -1837,14 +2578,14 @@ MAIN_PAGE_TEMPLATE = """
                 </div>
             </div>
             <div class="controls">
-                <button id="start-movies-btn">▶ MOVIES</button>
-                <button id="start-series-btn">▶ SERIES</button>
-                <button id="start-anime-btn">▶ ANIME</button>
-                <button id="stop-btn" class="stop-btn stopped">⏹ ABORT</button>
+                <button id="start-movies-btn" data-action="start" data-type="movies">▶ MOVIES</button>
+                <button id="start-series-btn" data-action="start" data-type="series">▶ SERIES</button>
+                <button id="start-anime-btn" data-action="start" data-type="anime">▶ ANIME</button>
+                <button id="stop-btn" class="stop-btn stopped" data-action="stop">⏹ ABORT</button>
             </div>
             <div class="controls-sitemap">
                 <input type="text" id="sitemap-url-input" placeholder="https://topcinema.pro/sitemap-pt-post-2025-11.html">
-                <button id="start-sync-btn">⟳ SYNC</button>
+                <button id="start-sync-btn" data-action="sync" data-type="sync">⟳ SYNC</button>
             </div>
         </header>
 
@@ -1889,8 +2630,9 @@ MAIN_PAGE_TEMPLATE = """
             <div class="log-panel">
                 <div class="log-header">▸ FETCH OPERATIONS</div>
                 <div class="log-content" id="live-fetch-logs">
-                    <div class="log-line info">Awaiting commands...</div>
+                    <div class="log-spacer" id="log-spacer"><div class="log-window" id="log-window"></div></div>
                 </div>
+                <template id="log-line-tpl"><div class="log-line"></div></template>
             </div>
             <div class="log-panel">
                 <div class="log-header">▸ DATABASE WRITER</div>
@@ -1902,9 +2644,7 @@ MAIN_PAGE_TEMPLATE = """
     </div>
 
     <script>
-        const startMoviesBtn = document.getElementById('start-movies-btn');
-        const startSeriesBtn = document.getElementById('start-series-btn');
-        const startAnimeBtn = document.getElementById('start-anime-btn');
+        const startButtons = document.querySelectorAll('button[data-type]'); // Movies, series, anime and sync
         const startSyncBtn = document.getElementById('start-sync-btn');
         const sitemapUrlInput = document.getElementById('sitemap-url-input');
         const stopBtn = document.getElementById('stop-btn');
@@ -1923,9 +2663,69 @@ MAIN_PAGE_TEMPLATE = """
         const progressFill = document.getElementById('progress-fill');
         const dbLogEl = document.getElementById('live-db-log');
         const fetchLogEl = document.getElementById('live-fetch-logs');
+        const logSpacer = document.getElementById('log-spacer');
+        const logWindow = document.getElementById('log-window');
+        const logLineTpl = document.getElementById('log-line-tpl').content.firstElementChild;
         
         let userScrolledUp = false;
 
+        // --- Fetch log (windowed) ---
+        // Every line lives in logLines; only the rows in view (plus LOG_OVERSCAN either side)
+        // exist in the DOM, as a reused pool of divs. Rows have a fixed height, so the index
+        // range for a scroll position is plain arithmetic.
+        const LOG_ROW_HEIGHT = 22;
+        const LOG_OVERSCAN = 10;
+        const MAX_LOG_LINES = 5000;
+        const LOG_TRIM_TO = 4000; // Lines kept after a trim, so trims happen once per ~1000 lines
+        const logLines = [{ text: 'Awaiting commands...', level: 'info' }];
+        let logRenderQueued = false;
+        let logTrimQueued = false;
+        const LOG_BURST_RATE = 20; // Lines per second above which new rows skip their fade-in
+        let logRateStart = 0;
+        let logRateCount = 0;
+        let logBurst = false;
+        const whenIdle = window.requestIdleCallback
+            ? f => window.requestIdleCallback(f, { timeout: 1000 })
+            : f => setTimeout(f, 200);
+
+        function renderLogWindow() {
+            logRenderQueued = false;
+            logSpacer.style.height = (logLines.length * LOG_ROW_HEIGHT) + 'px';
+            const scrollTop = Math.max(0, fetchLogEl.scrollTop - logSpacer.offsetTop);
+            const start = Math.max(0, Math.floor(scrollTop / LOG_ROW_HEIGHT) - LOG_OVERSCAN);
+            const end = Math.min(logLines.length,
+                Math.ceil((scrollTop + fetchLogEl.clientHeight) / LOG_ROW_HEIGHT) + LOG_OVERSCAN);
+            const missing = end - start - logWindow.childElementCount;
+            if (missing > 0) {
+                // Grow the row pool from the template in one insertion
+                const frag = document.createDocumentFragment();
+                for (let i = 0; i < missing; i++) frag.appendChild(logLineTpl.cloneNode(false));
+                logWindow.appendChild(frag);
+            }
+            logWindow.style.transform = `translateY(${start * LOG_ROW_HEIGHT}px)`;
+            const rows = logWindow.children;
+            for (let i = 0; i < rows.length; i++) {
+                const row = rows[i];
+                const line = logLines[start + i];
+                if (!line || start + i >= end) {
+                    if (!row.hidden) row.hidden = true;
+                    continue;
+                }
+                if (row.hidden) row.hidden = false;
+                if (row.logLine === line) continue; // Row already shows this line
+                row.logLine = line;
+                row.className = `log-line ${line.level}`;
+                row.textContent = line.text;
+                row.title = line.text; // Long lines are cut off in the fixed-height row
+            }
+        }
+
+        function queueLogRender() {
+            if (logRenderQueued) return;
+            logRenderQueued = true;
+            requestAnimationFrame(renderLogWindow);
+        }
+
         // --- Theme ---
         function setTheme(themeName) {
             document.body.className = themeName;
@@ -1949,142 +2749,301 @@ MAIN_PAGE_TEMPLATE = """
             sitemapUrlInput.value = `https://topcinema.pro/sitemap-pt-post-${year}-${month}.html`;
         });
 
-        // Update time display
-        function updateTime() {
-            // Not needed for terminal theme
-        }
-        
         // Auto-scroll management
         fetchLogEl.addEventListener('scroll', () => {
             const isAtBottom = fetchLogEl.scrollHeight - fetchLogEl.scrollTop <= fetchLogEl.clientHeight + 50;
             userScrolledUp = !isAtBottom;
+            queueLogRender();
         });
+        window.addEventListener('resize', queueLogRender);
+        renderLogWindow();
+
+        // Last value written per element (and style property); an unchanged value is not written
+        // again, since every DOM write invalidates style even when it changes nothing.
+        const lastWritten = new Map();
+
+        function setText(el, value) {
+            value = String(value);
+            if (lastWritten.get(el) === value) return;
+            lastWritten.set(el, value);
+            el.textContent = value;
+        }
+
+        function setStyle(el, prop, value) {
+            const key = el.id + '.' + prop;
+            if (lastWritten.get(key) === value) return;
+            lastWritten.set(key, value);
+            el.style[prop] = value;
+        }
 
         function updateUI(data) {
             // Update buttons based on running state
             const isRunning = data.scraper_running;
             const currentType = data.current_scrape_type;
             
-            // Disable all start buttons if running
-            startMoviesBtn.disabled = isRunning;
-            startSeriesBtn.disabled = isRunning;
-            startAnimeBtn.disabled = isRunning;
-            startSyncBtn.disabled = isRunning;
-            
-            if (isRunning) {
-                statusLed.classList.add('active');
-                stopBtn.classList.remove('stopped');
-                
-                if (currentType === 'movies') {
-                    startMoviesBtn.classList.add('running');
-                } else if (currentType === 'series') {
-                    startSeriesBtn.classList.add('running');
-                } else if (currentType === 'anime') {
-                    startAnimeBtn.classList.add('running');
-                } else if (currentType === 'sync') {
-                    startSyncBtn.classList.add('running');
-                    startSyncBtn.textContent = 'SYNCING...';
-                }
-            } else {
-                statusLed.classList.remove('active');
-                stopBtn.classList.add('stopped');
-                startMoviesBtn.classList.remove('running');
-                startSeriesBtn.classList.remove('running');
-                startAnimeBtn.classList.remove('running');
-                startSyncBtn.classList.remove('running');
-                startSyncBtn.textContent = '⟳ SYNC';
-            }
+            // Disable all start buttons if running; the one for the current type is marked running
+            // (classList.toggle with a force argument is already a no-op when nothing changes)
+            startButtons.forEach(btn => {
+                if (btn.disabled !== isRunning) btn.disabled = isRunning;
+                btn.classList.toggle('running', isRunning && btn.dataset.type === currentType);
+            });
+            statusLed.classList.toggle('active', isRunning);
+            stopBtn.classList.toggle('stopped', !isRunning);
+            setText(startSyncBtn, isRunning && currentType === 'sync' ? 'SYNCING...' : '⟳ SYNC');
             
-            statusMsg.textContent = data.status_message.toUpperCase();
+            setText(statusMsg, data.status_message.toUpperCase());
             
             if (data.scrape_queue && data.scrape_queue.length > 0) {
-                queueInfo.style.display = 'block';
-                queueInfo.textContent = '⚡ AUTO-CHAIN QUEUE: ' + data.scrape_queue.map(t => t.toUpperCase()).join(' → ');
+                setStyle(queueInfo, 'display', 'block');
+                setText(queueInfo, '⚡ AUTO-CHAIN QUEUE: ' + data.scrape_queue.map(t => t.toUpperCase()).join(' → '));
             } else {
-                queueInfo.style.display = 'none';
+                setStyle(queueInfo, 'display', 'none');
             }
 
             const progress = data.progress;
-            pendingEl.textContent = progress.pending < 0 ? 0 : progress.pending;
-            completedEl.textContent = progress.completed;
-            failedEl.textContent = progress.failed;
+            setText(pendingEl, progress.pending < 0 ? 0 : progress.pending);
+            setText(completedEl, progress.completed);
+            setText(failedEl, progress.failed);
             
             const counts = data.counts;
-            moviesEl.textContent = counts.movies < 0 ? 0 : counts.movies;
-            seriesEl.textContent = counts.series < 0 ? 0 : counts.series;
-            animeEl.textContent = counts.anime < 0 ? 0 : counts.anime;
+            setText(moviesEl, counts.movies < 0 ? 0 : counts.movies);
+            setText(seriesEl, counts.series < 0 ? 0 : counts.series);
+            setText(animeEl, counts.anime < 0 ? 0 : counts.anime);
 
             let percent = 0;
             if (progress.total > 0) {
                 percent = ((progress.completed + progress.failed) / progress.total) * 100;
             }
-            progressFill.style.width = percent + '%';
-            progressFill.textContent = Math.round(percent) + '%';
-            
-            dbLogEl.textContent = data.live_db_log || 'Idle...';
+            setStyle(progressFill, 'width', percent + '%');
+            setText(progressFill, Math.round(percent) + '%');
             
-            // --- New Log Parsing ---
-            const wasAtBottom = fetchLogEl.scrollHeight - fetchLogEl.scrollTop <= fetchLogEl.clientHeight + 50;
+            setText(dbLogEl, data.live_db_log || 'Idle...');
+        }
+
+        // --- New Log Parsing ---
+        // Only the lines newer than logSeq arrive; they are added to logLines, never re-rendered.
+        // This is pure data work, so every response is taken in even when frames are coalesced.
+        // One regex match per line picks the level from its prefix; another strips the prefix for display
+        const LOG_LEVELS = {
+            '✅ [SUCCESS]': 'success',
+            '🔥 [ERROR]': 'error',
+            '⚠️ [WARN]': 'warn',
+            '🟠 [REDFLAG]': 'redflag',
+            '➡️ [DEBUG]': 'debug',
+            'START:': 'start',
+        };
+        const LOG_LEVEL_RE = /^(✅ \\[SUCCESS\\]|🔥 \\[ERROR\\]|⚠️ \\[WARN\\]|🟠 \\[REDFLAG\\]|➡️ \\[DEBUG\\]|START:)/;
+        const LOG_PREFIX_RE = /^(?:\\[\\w+\\]\\s*)?(?:(?:✅|🔥|⚠️|🟠|➡️)\\s*)?/;
+
+        function addLogLines(data) {
+            if (data.log_reset) logLines.length = 0;
+            logSeq = data.log_seq;
+            const newLogs = data.live_fetch_logs || [];
+            for (const log of newLogs) {
+                const prefix = LOG_LEVEL_RE.exec(log);
+                const level = prefix ? LOG_LEVELS[prefix[1]] : 'info';
+                logLines.push({ text: log.replace(LOG_PREFIX_RE, ''), level });
+            }
+            if (logLines.length > MAX_LOG_LINES && !logTrimQueued) {
+                logTrimQueued = true;
+                whenIdle(trimLogLines);
+            }
+            if (newLogs.length || data.log_reset) logsChanged = true;
+            trackLogRate(newLogs.length);
+        }
+
+        // logBurst is on while more than LOG_BURST_RATE lines arrived in the current second,
+        // and stays on until a second (or a longer gap) passes below that rate
+        function trackLogRate(count) {
+            const now = performance.now();
+            if (now - logRateStart >= 1000) {
+                if (now - logRateStart >= 2000 || logRateCount <= LOG_BURST_RATE) logBurst = false;
+                logRateStart = now;
+                logRateCount = 0;
+            }
+            logRateCount += count;
+            if (logRateCount > LOG_BURST_RATE) logBurst = true;
+        }
 
-            fetchLogEl.innerHTML = (data.live_fetch_logs || []).map(log => {
-                let level = 'info'; // Default
-                if (log.startsWith('✅ [SUCCESS]')) {
-                    level = 'success';
-                } else if (log.startsWith('🔥 [ERROR]')) {
-                    level = 'error';
-                } else if (log.startsWith('⚠️ [WARN]')) {
-                    level = 'warn';
-                } else if (log.startsWith('🟠 [REDFLAG]')) {
-                    level = 'redflag';
-                } else if (log.startsWith('➡️ [DEBUG]')) {
-                    level = 'debug';
-                } else if (log.startsWith('START:')) {
-                    level = 'start';
+        // Keeps the store bounded off the critical path: one splice in idle time down to LOG_TRIM_TO.
+        // A reader scrolled up keeps the same lines in view.
+        function trimLogLines() {
+            logTrimQueued = false;
+            const removed = logLines.length - LOG_TRIM_TO;
+            if (removed <= 0) return;
+            logLines.splice(0, removed);
+            if (userScrolledUp) fetchLogEl.scrollTop -= removed * LOG_ROW_HEIGHT;
+            queueLogRender();
+        }
+
+        // --- Frame-coalesced redraw ---
+        // Updates only record what changed; one requestAnimationFrame callback paints it, so a
+        // burst of updates costs one layout per frame. Layout is read before anything is written.
+        // Stats and the log are flagged apart, so a log-only update leaves the counters alone.
+        let uiFrame = 0;
+        let statsChanged = false;
+        let logsChanged = false;
+
+        function scheduleUI() {
+            if (!uiFrame) uiFrame = requestAnimationFrame(flushUI);
+        }
+
+        function flushUI() {
+            uiFrame = 0;
+            const wasAtBottom = fetchLogEl.scrollHeight - fetchLogEl.scrollTop <= fetchLogEl.clientHeight + 50;
+            if (statsChanged) {
+                statsChanged = false;
+                updateUI(statusState);
+            }
+            if (logsChanged) {
+                logsChanged = false;
+                fetchLogEl.classList.toggle('burst', logBurst);
+                if (!userScrolledUp && wasAtBottom) {
+                    logSpacer.style.height = (logLines.length * LOG_ROW_HEIGHT) + 'px';
+                    fetchLogEl.scrollTop = fetchLogEl.scrollHeight;
                 }
-                
-                // Clean the log message (remove prefix for display)
-                const displayLog = log.replace(/^\[\w+\]\s*/, '').replace(/^(✅|🔥|⚠️|🟠|➡️)\s*/, ''); 
-                
-                return `<div class="log-line ${level}">${displayLog}</div>`;
-            }).join('');
-            
-            if (!userScrolledUp && wasAtBottom) {
-                fetchLogEl.scrollTop = fetchLogEl.scrollHeight;
+                renderLogWindow();
             }
         }
 
-        async function fetchStatus() {
-            try {
-                const response = await fetch('/api/status');
-                if (!response.ok) return;
-                const data = await response.json();
-                updateUI(data);
-            } catch (e) {
-                // Server might be restarting
+        // Long-poll: the server answers as soon as the state differs from statusEtag
+        // (or with a 304 after ~25s), and the loop immediately asks again.
+        // Responses after the first are deltas (only changed fields); statusState is the merged copy.
+        let statusEtag = null;
+        let statusState = {};
+        let logSeq = 0; // Sequence number of the newest log line on screen
+
+        async function fetchStatus(wait = false, signal = undefined) {
+            const headers = statusEtag ? { 'If-None-Match': statusEtag } : {};
+            const url = `/api/status?delta=1&log_since=${logSeq}` + (wait ? '&wait=1' : '');
+            const response = await fetch(url, { headers, cache: 'no-store', signal });
+            if (response.status === 304 || !response.ok) return response.ok || response.status === 304;
+            statusEtag = response.headers.get('ETag');
+            applyStatus(await response.json());
+            return true;
+        }
+
+        function onStats(data) {
+            statusState = data.partial ? Object.assign(statusState, data) : data;
+            statsChanged = true;
+            scheduleUI();
+        }
+
+        function onLogs(data) {
+            addLogLines(data);
+            scheduleUI();
+        }
+
+        // A long-poll answer carries both
+        function applyStatus(data) {
+            onStats(data);
+            onLogs(data);
+        }
+
+        // A hidden tab stops polling and drops its parked request, so it neither wakes up
+        // nor holds a server thread; the loop resumes as soon as the tab is visible again.
+        let pollAbort = null;
+
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden && pollAbort) pollAbort.abort();
+        });
+
+        function whenVisible() {
+            return new Promise(resolve => {
+                const check = () => {
+                    if (document.hidden) return;
+                    document.removeEventListener('visibilitychange', check);
+                    resolve();
+                };
+                document.addEventListener('visibilitychange', check);
+                check();
+            });
+        }
+
+        async function pollStatus(until = Infinity) {
+            let wait = true; // After a refused or failed poll the next one asks without waiting
+            while (Date.now() < until) {
+                await whenVisible();
+                let ok = false;
+                pollAbort = new AbortController();
+                try {
+                    ok = await fetchStatus(wait, pollAbort.signal);
+                } catch (e) {
+                    // Aborted because the tab was hidden, or the server might be restarting
+                    ok = e.name === 'AbortError';
+                }
+                pollAbort = null;
+                wait = ok;
+                if (!ok) await new Promise(resolve => setTimeout(resolve, 1000));
             }
         }
 
+        // Server-Sent Events push each change over one open response; the long-poll loop is
+        // the fallback. A hidden tab closes its stream and reopens it from logSeq when shown.
+        // When the server has no thread to spare for a stream it refuses it, and the page
+        // polls for STREAM_RETRY_MS before asking again.
+        const STREAM_RETRY_MS = 60000;
+        let stream = null;
+        let polling = false;
+
+        async function pollInstead() {
+            polling = true;
+            await pollStatus(Date.now() + STREAM_RETRY_MS);
+            polling = false;
+            if (!stream && !document.hidden) openStream();
+        }
+
+        function openStream() {
+            stream = new EventSource(`/api/stream?log_since=${logSeq}`);
+            stream.addEventListener('logs', e => onLogs(JSON.parse(e.data)));
+            stream.addEventListener('stats', e => onStats(JSON.parse(e.data)));
+            stream.onerror = () => {
+                // EventSource retries by itself unless the server refused the stream outright
+                if (stream.readyState !== EventSource.CLOSED) return;
+                stream = null;
+                if (!polling) pollInstead();
+            };
+        }
+
+        function watchStatus() {
+            if (typeof EventSource === 'undefined') return pollStatus();
+            document.addEventListener('visibilitychange', () => {
+                if (document.hidden && stream) {
+                    stream.close();
+                    stream = null;
+                } else if (!document.hidden && !stream && !polling) {
+                    openStream();
+                }
+            });
+            if (!document.hidden) openStream();
+        }
+
+        // After a button press: the stream delivers the change by itself, a poller asks now
+        function refreshStatus() {
+            if (!stream) fetchStatus();
+        }
+
         async function startScraper(type) {
             try {
                 const response = await fetch(`/api/start/${type}`, { method: 'POST' });
                 const result = await response.json();
                 if (!result.success) {
-                    statusMsg.textContent = result.message.toUpperCase();
+                    setText(statusMsg, result.message.toUpperCase());
                 }
-                fetchStatus();
+                refreshStatus();
             } catch (e) {
-                statusMsg.textContent = `ERROR STARTING ${type.toUpperCase()} SCRAPER`;
+                setText(statusMsg, `ERROR STARTING ${type.toUpperCase()} SCRAPER`);
             }
         }
         
         async function startSync() {
             const url = sitemapUrlInput.value;
             if (!url) {
-                statusMsg.textContent = "SITEMAP URL IS REQUIRED";
+                setText(statusMsg, "SITEMAP URL IS REQUIRED");
                 return;
             }
             if (!url.startsWith('http')) {
-                statusMsg.textContent = "INVALID SITEMAP URL";
+                setText(statusMsg, "INVALID SITEMAP URL");
                 return;
             }
             
@@ -2098,39 +3057,241 @@ MAIN_PAGE_TEMPLATE = """
                 });
                 const result = await response.json();
                 if (!result.success) {
-                    statusMsg.textContent = result.message.toUpperCase();
+                    setText(statusMsg, result.message.toUpperCase());
                 }
-                fetchStatus();
+                refreshStatus();
+            } catch (e) {
+                setText(statusMsg, `ERROR STARTING SYNC`);
+            }
+        }
+
+        async function stopScraper() {
+            try {
+                stopBtn.disabled = true;
+                await fetch('/api/stop', { method: 'POST' });
+                refreshStatus();
             } catch (e) {
-                statusMsg.textContent = `ERROR STARTING SYNC`;
+                setText(statusMsg, 'ERROR STOPPING SCRAPER');
+            } finally {
+                setTimeout(() => stopBtn.disabled = false, 1000);
             }
         }
 
-        startMoviesBtn.addEventListener('click', async () => await startScraper('movies'));
-        startSeriesBtn.addEventListener('click', async () => await startScraper('series'));
-        startAnimeBtn.addEventListener('click', async () => await startScraper('anime'));
-        startSyncBtn.addEventListener('click', async () => await startSync());
+        // One delegated listener for the controls: each button names its handler in data-action
+        const CONTROL_ACTIONS = {
+            start: btn => startScraper(btn.dataset.type),
+            sync: () => startSync(),
+            stop: () => stopScraper(),
+        };
+
+        document.querySelector('header').addEventListener('click', e => {
+            const btn = e.target.closest('button[data-action]');
+            if (btn && !btn.disabled) CONTROL_ACTIONS[btn.dataset.action](btn);
+        });
+
+        watchStatus();
+    </script>
+</body>
+</html>
+"""
+
+# DB Explorer base page template - Enhanced Show Browser
+DB_PAGE_CSS = """
+@import url('https://fonts.googleapis.com/css2?family=VT323&family=Share+Tech+Mono&display=swap');
+
+:root {
+    --bg-color: #0a0e14;
+    --terminal-bg: #0f1419;
+    --border-color: #00ff41;
+    --text-color: #00ff41;
+    --text-dim: #00aa33;
+    --accent-color: #00ffff;
+    --success-color: #00ff41;
+    --warn-color: #ffaa00;
+    --glow: 0 0 10px #00ff41, 0 0 20px #00ff41;
+}
+
+body.theme-blue {
+    --border-color: #00ffff;
+    --text-color: #00ffff;
+    --text-dim: #00aaaa;
+    --accent-color: #00ff41;
+    --glow: 0 0 10px #00ffff, 0 0 20px #00ffff;
+}
+
+body.theme-amber {
+    --border-color: #ffc400;
+    --text-color: #ffc400;
+    --text-dim: #b38a00;
+    --accent-color: #00ffff;
+    --glow: 0 0 10px #ffc400, 0 0 20px #ffc400;
+}
+
+* { box-sizing: border-box; margin: 0; padding: 0; }
+
+body {
+    font-family: 'Share Tech Mono', monospace;
+    background: var(--bg-color);
+    color: var(--text-color);
+    overflow-x: hidden;
+    background-image: 
+        repeating-linear-gradient(0deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px),
+        repeating-linear-gradient(90deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px);
+    transition: all 0.3s;
+}
+
+body.theme-blue { background-image: repeating-linear-gradient(0deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px), repeating-linear-gradient(90deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px); }
+body.theme-amber { background-image: repeating-linear-gradient(0deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px), repeating-linear-gradient(90deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px); }
+
+.scanline {
+    position: fixed; top: 0; left: 0; width: 100%; height: 100%;
+    background: linear-gradient(to bottom, transparent 50%, rgba(0,255,65,0.02) 51%);
+    background-size: 100% 4px; pointer-events: none; z-index: 9999;
+    animation: scanline 8s linear infinite;
+}
+@keyframes scanline { 0% { background-position: 0 0; } 100% { background-position: 0 100%; } }
+
+.container { max-width: 1400px; margin: 0 auto; padding: 20px; }
+
+header {
+    border: 2px solid var(--border-color); padding: 20px; margin-bottom: 20px;
+    background: var(--terminal-bg); box-shadow: var(--glow);
+    animation: flicker 0.15s infinite alternate; transition: all 0.3s;
+}
+@keyframes flicker { 0%, 100% { opacity: 1; } 50% { opacity: 0.97; } }
+
+.terminal-header {
+    display: flex; justify-content: space-between; align-items: center;
+    flex-wrap: wrap; gap: 10px; margin-bottom: 15px;
+}
+
+h1 {
+    font-family: 'VT323', monospace; font-size: 32px; letter-spacing: 2px;
+    text-shadow: var(--glow); animation: glitch 3s infinite; transition: text-shadow 0.3s;
+}
+@keyframes glitch {
+    0%, 90%, 100% { text-shadow: var(--glow); }
+    92% { text-shadow: 2px 0 0 #ff0055, -2px 0 0 var(--accent-color); }
+    94% { text-shadow: -2px 0 0 #ff0055, 2px 0 0 var(--accent-color); }
+}
+
+.header-utils {
+    display: flex; align-items: center; gap: 15px;
+}
+
+.theme-selector {
+    display: flex; gap: 5px; border: 1px solid var(--text-dim);
+    border-radius: 8px; padding: 5px;
+}
+.theme-selector span {
+    padding: 5px 8px; cursor: pointer; border-radius: 5px;
+    transition: all 0.2s; font-size: 12px;
+}
+.theme-selector span:hover { background: var(--text-dim); color: var(--terminal-bg); }
+.theme-selector span.active { background: var(--border-color); color: var(--terminal-bg); font-weight: bold; }
+
+.header-utils a {
+    font-size: 14px; padding: 8px 12px; border: 1px solid var(--border-color);
+    background: var(--terminal-bg); color: var(--text-color); text-decoration: none;
+    border-radius: 8px; transition: all 0.2s;
+}
+.header-utils a:hover { background: var(--border-color); color: var(--terminal-bg); box-shadow: 0 0 15px var(--border-color); }
 
-        stopBtn.addEventListener('click', async () => {
-            try {
-                stopBtn.disabled = true;
-                await fetch('/api/stop', { method: 'POST' });
-                fetchStatus();
-            } catch (e) {
-                statusMsg.textContent = 'ERROR STOPPING SCRAPER';
-            } finally {
-                setTimeout(() => stopBtn.disabled = false, 1000);
-            }
-        });
+.controls {
+    display: flex; gap: 10px; flex-wrap: wrap; margin-bottom: 15px;
+}
 
-        setInterval(fetchStatus, 1000);
-        fetchStatus();
-    </script>
-</body>
-</html>
+.controls input[type="text"] {
+    flex: 1; min-width: 200px; background: var(--terminal-bg);
+    border: 2px solid var(--border-color); color: var(--text-color);
+    padding: 12px 20px; font-family: 'Share Tech Mono', monospace;
+    font-size: 14px; border-radius: 8px; transition: all 0.3s;
+}
+.controls input[type="text"]::placeholder { color: var(--text-dim); }
+.controls input[type="text"]:focus { outline: none; box-shadow: var(--glow); }
+
+.controls button {
+    font-family: 'Share Tech Mono', monospace; font-size: 14px;
+    padding: 12px 20px; border: 2px solid var(--border-color);
+    background: var(--terminal-bg); color: var(--text-color);
+    cursor: pointer; transition: all 0.2s; text-transform: uppercase;
+    letter-spacing: 1px; border-radius: 8px;
+}
+.controls button:hover { box-shadow: 0 0 15px var(--border-color); transform: translateY(-2px); }
+.controls button.active { background: var(--border-color); color: var(--terminal-bg); font-weight: bold; }
+
+.stats-bar {
+    display: flex; justify-content: space-around; gap: 10px;
+    padding: 15px; border: 1px solid var(--text-dim);
+    background: rgba(0,0,0,0.3); margin-bottom: 20px; border-radius: 8px;
+}
+.stat-item { text-align: center; }
+.stat-item strong {
+    display: block; font-size: 24px; font-family: 'VT323', monospace;
+    color: var(--accent-color); text-shadow: 0 0 10px currentColor;
+}
+.stat-item span { font-size: 11px; text-transform: uppercase; color: var(--text-dim); }
+
+.shows-grid {
+    display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
+    gap: 20px; margin-top: 20px;
+}
+
+.show-card {
+    border: 2px solid var(--text-dim); background: var(--terminal-bg);
+    padding: 0; cursor: pointer; transition: all 0.3s;
+    position: relative; overflow: hidden; border-radius: 8px;
+}
+.show-card:hover {
+    border-color: var(--border-color); transform: translateY(-5px);
+    box-shadow: 0 0 20px var(--border-color);
+}
+
+.show-card .poster {
+    width: 100%; height: 280px; object-fit: cover;
+    background: var(--terminal-bg); border-bottom: 2px solid var(--text-dim);
+}
+.show-card .poster-placeholder {
+    width: 100%; height: 280px; display: flex; align-items: center;
+    justify-content: center; background: var(--terminal-bg);
+    border-bottom: 2px solid var(--text-dim); font-size: 48px;
+    color: var(--text-dim);
+}
+
+.show-card .info {
+    padding: 15px;
+}
+.show-card .title {
+    font-size: 16px; font-weight: bold; margin-bottom: 8px;
+    color: var(--border-color); white-space: nowrap; overflow: hidden;
+    text-overflow: ellipsis;
+}
+.show-card .meta {
+    font-size: 12px; color: var(--text-dim); margin-bottom: 5px;
+}
+.show-card .rating {
+    display: inline-block; padding: 4px 8px; background: var(--border-color);
+    color: var(--terminal-bg); font-size: 12px; font-weight: bold;
+    border-radius: 4px; margin-top: 5px;
+}
+.show-card .type-badge {
+    position: absolute; top: 10px; right: 10px;
+    padding: 4px 8px; background: var(--border-color);
+    color: var(--terminal-bg); font-size: 10px; font-weight: bold;
+    text-transform: uppercase; border-radius: 4px;
+}
+
+.empty-state {
+    text-align: center; padding: 60px 20px; border: 2px dashed var(--text-dim);
+    background: rgba(0,0,0,0.2); margin-top: 40px; border-radius: 8px;
+}
+.empty-state h2 {
+    font-family: 'VT323', monospace; font-size: 36px;
+    color: var(--text-dim); margin-bottom: 15px;
+}
+.empty-state p { color: var(--text-dim); font-size: 14px; }
 """
 
-# DB Explorer base page template - Enhanced Show Browser
 DB_PAGE_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
@@ -2138,201 +3299,7 @@ DB_PAGE_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>SHOW-BROWSER v1.0</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=VT323&family=Share+Tech+Mono&display=swap');
-        
-        :root {
-            --bg-color: #0a0e14;
-            --terminal-bg: #0f1419;
-            --border-color: #00ff41;
-            --text-color: #00ff41;
-            --text-dim: #00aa33;
-            --accent-color: #00ffff;
-            --success-color: #00ff41;
-            --warn-color: #ffaa00;
-            --glow: 0 0 10px #00ff41, 0 0 20px #00ff41;
-        }
-
-        body.theme-blue {
-            --border-color: #00ffff;
-            --text-color: #00ffff;
-            --text-dim: #00aaaa;
-            --accent-color: #00ff41;
-            --glow: 0 0 10px #00ffff, 0 0 20px #00ffff;
-        }
-
-        body.theme-amber {
-            --border-color: #ffc400;
-            --text-color: #ffc400;
-            --text-dim: #b38a00;
-            --accent-color: #00ffff;
-            --glow: 0 0 10px #ffc400, 0 0 20px #ffc400;
-        }
-        
-        * { box-sizing: border-box; margin: 0; padding: 0; }
-        
-        body {
-            font-family: 'Share Tech Mono', monospace;
-            background: var(--bg-color);
-            color: var(--text-color);
-            overflow-x: hidden;
-            background-image: 
-                repeating-linear-gradient(0deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px),
-                repeating-linear-gradient(90deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px);
-            transition: all 0.3s;
-        }
-
-        body.theme-blue { background-image: repeating-linear-gradient(0deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px), repeating-linear-gradient(90deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px); }
-        body.theme-amber { background-image: repeating-linear-gradient(0deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px), repeating-linear-gradient(90deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px); }
-        
-        .scanline {
-            position: fixed; top: 0; left: 0; width: 100%; height: 100%;
-            background: linear-gradient(to bottom, transparent 50%, rgba(0,255,65,0.02) 51%);
-            background-size: 100% 4px; pointer-events: none; z-index: 9999;
-            animation: scanline 8s linear infinite;
-        }
-        @keyframes scanline { 0% { background-position: 0 0; } 100% { background-position: 0 100%; } }
-        
-        .container { max-width: 1400px; margin: 0 auto; padding: 20px; }
-        
-        header {
-            border: 2px solid var(--border-color); padding: 20px; margin-bottom: 20px;
-            background: var(--terminal-bg); box-shadow: var(--glow);
-            animation: flicker 0.15s infinite alternate; transition: all 0.3s;
-        }
-        @keyframes flicker { 0%, 100% { opacity: 1; } 50% { opacity: 0.97; } }
-        
-        .terminal-header {
-            display: flex; justify-content: space-between; align-items: center;
-            flex-wrap: wrap; gap: 10px; margin-bottom: 15px;
-        }
-        
-        h1 {
-            font-family: 'VT323', monospace; font-size: 32px; letter-spacing: 2px;
-            text-shadow: var(--glow); animation: glitch 3s infinite; transition: text-shadow 0.3s;
-        }
-        @keyframes glitch {
-            0%, 90%, 100% { text-shadow: var(--glow); }
-            92% { text-shadow: 2px 0 0 #ff0055, -2px 0 0 var(--accent-color); }
-            94% { text-shadow: -2px 0 0 #ff0055, 2px 0 0 var(--accent-color); }
-        }
-
-        .header-utils {
-            display: flex; align-items: center; gap: 15px;
-        }
-
-        .theme-selector {
-            display: flex; gap: 5px; border: 1px solid var(--text-dim);
-            border-radius: 8px; padding: 5px;
-        }
-        .theme-selector span {
-            padding: 5px 8px; cursor: pointer; border-radius: 5px;
-            transition: all 0.2s; font-size: 12px;
-        }
-        .theme-selector span:hover { background: var(--text-dim); color: var(--terminal-bg); }
-        .theme-selector span.active { background: var(--border-color); color: var(--terminal-bg); font-weight: bold; }
-
-        .header-utils a {
-            font-size: 14px; padding: 8px 12px; border: 1px solid var(--border-color);
-            background: var(--terminal-bg); color: var(--text-color); text-decoration: none;
-            border-radius: 8px; transition: all 0.2s;
-        }
-        .header-utils a:hover { background: var(--border-color); color: var(--terminal-bg); box-shadow: 0 0 15px var(--border-color); }
-        
-        .controls {
-            display: flex; gap: 10px; flex-wrap: wrap; margin-bottom: 15px;
-        }
-        
-        .controls input[type="text"] {
-            flex: 1; min-width: 200px; background: var(--terminal-bg);
-            border: 2px solid var(--border-color); color: var(--text-color);
-            padding: 12px 20px; font-family: 'Share Tech Mono', monospace;
-            font-size: 14px; border-radius: 8px; transition: all 0.3s;
-        }
-        .controls input[type="text"]::placeholder { color: var(--text-dim); }
-        .controls input[type="text"]:focus { outline: none; box-shadow: var(--glow); }
-        
-        .controls button {
-            font-family: 'Share Tech Mono', monospace; font-size: 14px;
-            padding: 12px 20px; border: 2px solid var(--border-color);
-            background: var(--terminal-bg); color: var(--text-color);
-            cursor: pointer; transition: all 0.2s; text-transform: uppercase;
-            letter-spacing: 1px; border-radius: 8px;
-        }
-        .controls button:hover { box-shadow: 0 0 15px var(--border-color); transform: translateY(-2px); }
-        .controls button.active { background: var(--border-color); color: var(--terminal-bg); font-weight: bold; }
-        
-        .stats-bar {
-            display: flex; justify-content: space-around; gap: 10px;
-            padding: 15px; border: 1px solid var(--text-dim);
-            background: rgba(0,0,0,0.3); margin-bottom: 20px; border-radius: 8px;
-        }
-        .stat-item { text-align: center; }
-        .stat-item strong {
-            display: block; font-size: 24px; font-family: 'VT323', monospace;
-            color: var(--accent-color); text-shadow: 0 0 10px currentColor;
-        }
-        .stat-item span { font-size: 11px; text-transform: uppercase; color: var(--text-dim); }
-        
-        .shows-grid {
-            display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
-            gap: 20px; margin-top: 20px;
-        }
-        
-        .show-card {
-            border: 2px solid var(--text-dim); background: var(--terminal-bg);
-            padding: 0; cursor: pointer; transition: all 0.3s;
-            position: relative; overflow: hidden; border-radius: 8px;
-        }
-        .show-card:hover {
-            border-color: var(--border-color); transform: translateY(-5px);
-            box-shadow: 0 0 20px var(--border-color);
-        }
-        
-        .show-card .poster {
-            width: 100%; height: 280px; object-fit: cover;
-            background: var(--terminal-bg); border-bottom: 2px solid var(--text-dim);
-        }
-        .show-card .poster-placeholder {
-            width: 100%; height: 280px; display: flex; align-items: center;
-            justify-content: center; background: var(--terminal-bg);
-            border-bottom: 2px solid var(--text-dim); font-size: 48px;
-            color: var(--text-dim);
-        }
-        
-        .show-card .info {
-            padding: 15px;
-        }
-        .show-card .title {
-            font-size: 16px; font-weight: bold; margin-bottom: 8px;
-            color: var(--border-color); white-space: nowrap; overflow: hidden;
-            text-overflow: ellipsis;
-        }
-        .show-card .meta {
-            font-size: 12px; color: var(--text-dim); margin-bottom: 5px;
-        }
-        .show-card .rating {
-            display: inline-block; padding: 4px 8px; background: var(--border-color);
-            color: var(--terminal-bg); font-size: 12px; font-weight: bold;
-            border-radius: 4px; margin-top: 5px;
-        }
-        .show-card .type-badge {
-            position: absolute; top: 10px; right: 10px;
-            padding: 4px 8px; background: var(--border-color);
-            color: var(--terminal-bg); font-size: 10px; font-weight: bold;
-            text-transform: uppercase; border-radius: 4px;
-        }
-        
-        .empty-state {
-            text-align: center; padding: 60px 20px; border: 2px dashed var(--text-dim);
-            background: rgba(0,0,0,0.2); margin-top: 40px; border-radius: 8px;
-        }
-        .empty-state h2 {
-            font-family: 'VT323', monospace; font-size: 36px;
-            color: var(--text-dim); margin-bottom: 15px;
-        }
-        .empty-state p { color: var(--text-dim); font-size: 14px; }
-    </style>
+    <link rel="stylesheet" href="{{ stylesheet_url('db.css') }}">
 </head>
 <body class="theme-green">
     <div class="scanline"></div>
@@ -2386,6 +3353,9 @@ DB_PAGE_TEMPLATE = """
     </div>
 
     <script>
+        const SHOWS_PAGE_SIZE = 1000;
+        const RENDER_CHUNK_SIZE = 200;
+        let renderToken = 0;
         let allShows = [];
         let currentFilter = 'all';
         
@@ -2436,11 +3406,18 @@ DB_PAGE_TEMPLATE = """
         
         async function loadShows() {
             try {
-                const response = await fetch('/api/shows');
-                const data = await response.json();
-                allShows = data.shows || [];
-                updateStats();
-                filterShows();
+                // Page through the shows by id so the first cards appear before the whole table is read
+                allShows = [];
+                let afterId = null;
+                do {
+                    const query = afterId === null ? '' : `&after_id=${afterId}`;
+                    const response = await fetch(`/api/shows?limit=${SHOWS_PAGE_SIZE}${query}`);
+                    const data = await response.json();
+                    allShows = allShows.concat(data.shows || []);
+                    afterId = data.next_after_id ?? null;
+                    updateStats();
+                    filterShows();
+                } while (afterId !== null);
             } catch (e) {
                 console.error('Failed to load shows:', e);
                 document.getElementById('shows-grid').innerHTML = `
@@ -2482,6 +3459,7 @@ DB_PAGE_TEMPLATE = """
         
         function renderShows(shows) {
             const grid = document.getElementById('shows-grid');
+            const token = ++renderToken;
             
             if (shows.length === 0) {
                 grid.innerHTML = `
@@ -2493,7 +3471,22 @@ DB_PAGE_TEMPLATE = """
                 return;
             }
             
-            grid.innerHTML = shows.map(show => `
+            // Append the cards a chunk per frame: the first ones show up at once and the
+            // page never holds the markup for thousands of cards in a single string
+            grid.innerHTML = '';
+            let index = 0;
+            function renderChunk() {
+                if (token !== renderToken) return; // A newer filter/search took over
+                const chunk = shows.slice(index, index + RENDER_CHUNK_SIZE);
+                grid.insertAdjacentHTML('beforeend', chunk.map(showCardHtml).join(''));
+                index += RENDER_CHUNK_SIZE;
+                if (index < shows.length) requestAnimationFrame(renderChunk);
+            }
+            renderChunk();
+        }
+        
+        function showCardHtml(show) {
+            return `
                 <div class="show-card" onclick="viewShow(${show.id})">
                     <div class="type-badge">${escapeHtml(show.type)}</div>
                     ${show.poster ? 
@@ -2507,7 +3500,7 @@ DB_PAGE_TEMPLATE = """
                         ${show.imdb_rating ? `<span class="rating">⭐ ${show.imdb_rating}</span>` : ''}
                     </div>
                 </div>
-            `).join('');
+            `;
         }
         
         function viewShow(id) {
@@ -2519,6 +3512,183 @@ DB_PAGE_TEMPLATE = """
 """
 
 # Show Details Page Template
+SHOW_DETAILS_CSS = """
+@import url('https://fonts.googleapis.com/css2?family=VT323&family=Share+Tech+Mono&display=swap');
+
+:root {
+    --bg-color: #0a0e14; --terminal-bg: #0f1419; --border-color: #00ff41;
+    --text-color: #00ff41; --text-dim: #00aa33; --accent-color: #00ffff;
+    --success-color: #00ff41; --warn-color: #ffaa00;
+    --glow: 0 0 10px #00ff41, 0 0 20px #00ff41;
+}
+body.theme-blue { --border-color: #00ffff; --text-color: #00ffff; --text-dim: #00aaaa; --accent-color: #00ff41; --glow: 0 0 10px #00ffff, 0 0 20px #00ffff; }
+body.theme-amber { --border-color: #ffc400; --text-color: #ffc400; --text-dim: #b38a00; --accent-color: #00ffff; --glow: 0 0 10px #ffc400, 0 0 20px #ffc400; }
+
+* { box-sizing: border-box; margin: 0; padding: 0; }
+body {
+    font-family: 'Share Tech Mono', monospace; background: var(--bg-color); color: var(--text-color);
+    background-image: repeating-linear-gradient(0deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px), repeating-linear-gradient(90deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px);
+    transition: all 0.3s;
+}
+body.theme-blue { background-image: repeating-linear-gradient(0deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px), repeating-linear-gradient(90deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px); }
+body.theme-amber { background-image: repeating-linear-gradient(0deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px), repeating-linear-gradient(90deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px); }
+
+.scanline { position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: linear-gradient(to bottom, transparent 50%, rgba(0,255,65,0.02) 51%); background-size: 100% 4px; pointer-events: none; z-index: 9999; animation: scanline 8s linear infinite; }
+@keyframes scanline { 0% { background-position: 0 0; } 100% { background-position: 0 100%; } }
+
+.container { max-width: 1400px; margin: 0 auto; padding: 20px; }
+
+header {
+    border: 2px solid var(--border-color); padding: 20px; margin-bottom: 20px;
+    background: var(--terminal-bg); box-shadow: var(--glow); transition: all 0.3s;
+}
+
+.terminal-header { display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 10px; }
+
+h1 {
+    font-family: 'VT323', monospace; font-size: 28px; letter-spacing: 2px;
+    text-shadow: var(--glow); transition: text-shadow 0.3s;
+}
+
+.header-utils { display: flex; align-items: center; gap: 15px; }
+.theme-selector { display: flex; gap: 5px; border: 1px solid var(--text-dim); border-radius: 8px; padding: 5px; }
+.theme-selector span { padding: 5px 8px; cursor: pointer; border-radius: 5px; transition: all 0.2s; font-size: 12px; }
+.theme-selector span:hover { background: var(--text-dim); color: var(--terminal-bg); }
+.theme-selector span.active { background: var(--border-color); color: var(--terminal-bg); font-weight: bold; }
+.header-utils a { font-size: 14px; padding: 8px 12px; border: 1px solid var(--border-color); background: var(--terminal-bg); color: var(--text-color); text-decoration: none; border-radius: 8px; transition: all 0.2s; }
+.header-utils a:hover { background: var(--border-color); color: var(--terminal-bg); box-shadow: 0 0 15px var(--border-color); }
+
+.show-details {
+    display: grid; grid-template-columns: 300px 1fr; gap: 30px; margin-bottom: 30px;
+}
+@media (max-width: 768px) { .show-details { grid-template-columns: 1fr; } }
+
+.poster-section {
+    border: 2px solid var(--border-color); background: var(--terminal-bg); padding: 0; border-radius: 8px; overflow: hidden;
+}
+.poster-section img, .poster-placeholder {
+    width: 100%; height: 420px; object-fit: cover; display: block;
+}
+.poster-placeholder {
+    display: flex; align-items: center; justify-content: center;
+    background: var(--terminal-bg); font-size: 80px; color: var(--text-dim);
+}
+
+.info-section {
+    border: 2px solid var(--border-color); background: var(--terminal-bg);
+    padding: 25px; border-radius: 8px;
+}
+.info-section h2 {
+    font-family: 'VT323', monospace; font-size: 36px;
+    color: var(--border-color); margin-bottom: 15px; text-shadow: var(--glow);
+}
+.type-badge {
+    display: inline-block; padding: 6px 12px; background: var(--border-color);
+    color: var(--terminal-bg); font-size: 12px; font-weight: bold;
+    text-transform: uppercase; border-radius: 4px; margin-bottom: 15px;
+}
+.meta-row {
+    display: flex; gap: 20px; margin-bottom: 20px; flex-wrap: wrap;
+}
+.meta-item strong { color: var(--accent-color); margin-right: 5px; }
+.rating {
+    display: inline-flex; align-items: center; gap: 5px;
+    padding: 6px 12px; background: var(--warn-color); color: var(--terminal-bg);
+    font-weight: bold; border-radius: 4px; font-size: 16px;
+}
+.synopsis {
+    margin-top: 20px; padding-top: 20px; border-top: 1px solid var(--text-dim);
+    line-height: 1.8; color: var(--text-color);
+}
+.metadata {
+    margin-top: 20px; padding-top: 20px; border-top: 1px solid var(--text-dim);
+}
+.metadata-item { margin-bottom: 10px; }
+.metadata-item strong { color: var(--accent-color); margin-right: 10px; }
+
+.trailer-section {
+    margin-bottom: 30px; border: 2px solid var(--border-color);
+    background: var(--terminal-bg); padding: 20px; border-radius: 8px;
+}
+.trailer-section h3 {
+    font-family: 'VT323', monospace; font-size: 24px;
+    color: var(--border-color); margin-bottom: 15px;
+}
+.trailer-section iframe {
+    width: 100%; height: 500px; border: 1px solid var(--text-dim);
+    border-radius: 4px;
+}
+
+.seasons-section {
+    border: 2px solid var(--border-color); background: var(--terminal-bg);
+    padding: 20px; border-radius: 8px; margin-bottom: 30px;
+}
+.seasons-section h3 {
+    font-family: 'VT323', monospace; font-size: 24px;
+    color: var(--border-color); margin-bottom: 15px;
+}
+.season-list { display: flex; gap: 10px; flex-wrap: wrap; }
+.season-btn {
+    padding: 10px 20px; border: 2px solid var(--text-dim);
+    background: var(--terminal-bg); color: var(--text-color);
+    cursor: pointer; transition: all 0.2s; border-radius: 8px;
+    font-family: 'Share Tech Mono', monospace;
+}
+.season-btn:hover, .season-btn.active {
+    border-color: var(--border-color); background: var(--border-color);
+    color: var(--terminal-bg); box-shadow: 0 0 15px var(--border-color);
+}
+
+.episodes-grid {
+    display: grid; grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
+    gap: 15px; margin-top: 20px;
+}
+.episode-card {
+    border: 2px solid var(--text-dim); background: rgba(0,0,0,0.3);
+    padding: 15px; text-align: center; cursor: pointer;
+    transition: all 0.2s; border-radius: 8px;
+}
+.episode-card:hover {
+    border-color: var(--border-color); transform: translateY(-2px);
+    box-shadow: 0 0 10px var(--border-color);
+}
+.episode-card .ep-num {
+    font-family: 'VT323', monospace; font-size: 28px;
+    color: var(--accent-color); margin-bottom: 5px;
+}
+.episode-card .ep-label { font-size: 11px; color: var(--text-dim); }
+
+.servers-section {
+    border: 2px solid var(--border-color); background: var(--terminal-bg);
+    padding: 20px; border-radius: 8px; margin-top: 20px;
+}
+.servers-section h3 {
+    font-family: 'VT323', monospace; font-size: 24px;
+    color: var(--border-color); margin-bottom: 15px;
+}
+.server-list { display: flex; gap: 10px; flex-wrap: wrap; margin-bottom: 20px; }
+.server-btn {
+    padding: 10px 20px; border: 2px solid var(--text-dim);
+    background: var(--terminal-bg); color: var(--text-color);
+    cursor: pointer; transition: all 0.2s; border-radius: 8px;
+    font-family: 'Share Tech Mono', monospace;
+}
+.server-btn:hover, .server-btn.active {
+    border-color: var(--accent-color); background: var(--accent-color);
+    color: var(--terminal-bg); box-shadow: 0 0 15px var(--accent-color);
+}
+.server-player {
+    width: 100%; height: 500px; border: 1px solid var(--text-dim);
+    border-radius: 4px; background: #000;
+}
+
+.empty-state {
+    text-align: center; padding: 40px; color: var(--text-dim);
+    border: 1px dashed var(--text-dim); background: rgba(0,0,0,0.2);
+    border-radius: 8px;
+}
+"""
+
 SHOW_DETAILS_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
@@ -2526,182 +3696,7 @@ SHOW_DETAILS_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{{ show.title }} - SHOW-BROWSER</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=VT323&family=Share+Tech+Mono&display=swap');
-        
-        :root {
-            --bg-color: #0a0e14; --terminal-bg: #0f1419; --border-color: #00ff41;
-            --text-color: #00ff41; --text-dim: #00aa33; --accent-color: #00ffff;
-            --success-color: #00ff41; --warn-color: #ffaa00;
-            --glow: 0 0 10px #00ff41, 0 0 20px #00ff41;
-        }
-        body.theme-blue { --border-color: #00ffff; --text-color: #00ffff; --text-dim: #00aaaa; --accent-color: #00ff41; --glow: 0 0 10px #00ffff, 0 0 20px #00ffff; }
-        body.theme-amber { --border-color: #ffc400; --text-color: #ffc400; --text-dim: #b38a00; --accent-color: #00ffff; --glow: 0 0 10px #ffc400, 0 0 20px #ffc400; }
-        
-        * { box-sizing: border-box; margin: 0; padding: 0; }
-        body {
-            font-family: 'Share Tech Mono', monospace; background: var(--bg-color); color: var(--text-color);
-            background-image: repeating-linear-gradient(0deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px), repeating-linear-gradient(90deg, rgba(0,255,65,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,65,0.03) 3px);
-            transition: all 0.3s;
-        }
-        body.theme-blue { background-image: repeating-linear-gradient(0deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px), repeating-linear-gradient(90deg, rgba(0,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(0,255,255,0.03) 3px); }
-        body.theme-amber { background-image: repeating-linear-gradient(0deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px), repeating-linear-gradient(90deg, rgba(255,196,0,0.03) 0px, transparent 1px, transparent 2px, rgba(255,196,0,0.03) 3px); }
-        
-        .scanline { position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: linear-gradient(to bottom, transparent 50%, rgba(0,255,65,0.02) 51%); background-size: 100% 4px; pointer-events: none; z-index: 9999; animation: scanline 8s linear infinite; }
-        @keyframes scanline { 0% { background-position: 0 0; } 100% { background-position: 0 100%; } }
-        
-        .container { max-width: 1400px; margin: 0 auto; padding: 20px; }
-        
-        header {
-            border: 2px solid var(--border-color); padding: 20px; margin-bottom: 20px;
-            background: var(--terminal-bg); box-shadow: var(--glow); transition: all 0.3s;
-        }
-        
-        .terminal-header { display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 10px; }
-        
-        h1 {
-            font-family: 'VT323', monospace; font-size: 28px; letter-spacing: 2px;
-            text-shadow: var(--glow); transition: text-shadow 0.3s;
-        }
-
-        .header-utils { display: flex; align-items: center; gap: 15px; }
-        .theme-selector { display: flex; gap: 5px; border: 1px solid var(--text-dim); border-radius: 8px; padding: 5px; }
-        .theme-selector span { padding: 5px 8px; cursor: pointer; border-radius: 5px; transition: all 0.2s; font-size: 12px; }
-        .theme-selector span:hover { background: var(--text-dim); color: var(--terminal-bg); }
-        .theme-selector span.active { background: var(--border-color); color: var(--terminal-bg); font-weight: bold; }
-        .header-utils a { font-size: 14px; padding: 8px 12px; border: 1px solid var(--border-color); background: var(--terminal-bg); color: var(--text-color); text-decoration: none; border-radius: 8px; transition: all 0.2s; }
-        .header-utils a:hover { background: var(--border-color); color: var(--terminal-bg); box-shadow: 0 0 15px var(--border-color); }
-        
-        .show-details {
-            display: grid; grid-template-columns: 300px 1fr; gap: 30px; margin-bottom: 30px;
-        }
-        @media (max-width: 768px) { .show-details { grid-template-columns: 1fr; } }
-        
-        .poster-section {
-            border: 2px solid var(--border-color); background: var(--terminal-bg); padding: 0; border-radius: 8px; overflow: hidden;
-        }
-        .poster-section img, .poster-placeholder {
-            width: 100%; height: 420px; object-fit: cover; display: block;
-        }
-        .poster-placeholder {
-            display: flex; align-items: center; justify-content: center;
-            background: var(--terminal-bg); font-size: 80px; color: var(--text-dim);
-        }
-        
-        .info-section {
-            border: 2px solid var(--border-color); background: var(--terminal-bg);
-            padding: 25px; border-radius: 8px;
-        }
-        .info-section h2 {
-            font-family: 'VT323', monospace; font-size: 36px;
-            color: var(--border-color); margin-bottom: 15px; text-shadow: var(--glow);
-        }
-        .type-badge {
-            display: inline-block; padding: 6px 12px; background: var(--border-color);
-            color: var(--terminal-bg); font-size: 12px; font-weight: bold;
-            text-transform: uppercase; border-radius: 4px; margin-bottom: 15px;
-        }
-        .meta-row {
-            display: flex; gap: 20px; margin-bottom: 20px; flex-wrap: wrap;
-        }
-        .meta-item strong { color: var(--accent-color); margin-right: 5px; }
-        .rating {
-            display: inline-flex; align-items: center; gap: 5px;
-            padding: 6px 12px; background: var(--warn-color); color: var(--terminal-bg);
-            font-weight: bold; border-radius: 4px; font-size: 16px;
-        }
-        .synopsis {
-            margin-top: 20px; padding-top: 20px; border-top: 1px solid var(--text-dim);
-            line-height: 1.8; color: var(--text-color);
-        }
-        .metadata {
-            margin-top: 20px; padding-top: 20px; border-top: 1px solid var(--text-dim);
-        }
-        .metadata-item { margin-bottom: 10px; }
-        .metadata-item strong { color: var(--accent-color); margin-right: 10px; }
-        
-        .trailer-section {
-            margin-bottom: 30px; border: 2px solid var(--border-color);
-            background: var(--terminal-bg); padding: 20px; border-radius: 8px;
-        }
-        .trailer-section h3 {
-            font-family: 'VT323', monospace; font-size: 24px;
-            color: var(--border-color); margin-bottom: 15px;
-        }
-        .trailer-section iframe {
-            width: 100%; height: 500px; border: 1px solid var(--text-dim);
-            border-radius: 4px;
-        }
-        
-        .seasons-section {
-            border: 2px solid var(--border-color); background: var(--terminal-bg);
-            padding: 20px; border-radius: 8px; margin-bottom: 30px;
-        }
-        .seasons-section h3 {
-            font-family: 'VT323', monospace; font-size: 24px;
-            color: var(--border-color); margin-bottom: 15px;
-        }
-        .season-list { display: flex; gap: 10px; flex-wrap: wrap; }
-        .season-btn {
-            padding: 10px 20px; border: 2px solid var(--text-dim);
-            background: var(--terminal-bg); color: var(--text-color);
-            cursor: pointer; transition: all 0.2s; border-radius: 8px;
-            font-family: 'Share Tech Mono', monospace;
-        }
-        .season-btn:hover, .season-btn.active {
-            border-color: var(--border-color); background: var(--border-color);
-            color: var(--terminal-bg); box-shadow: 0 0 15px var(--border-color);
-        }
-        
-        .episodes-grid {
-            display: grid; grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
-            gap: 15px; margin-top: 20px;
-        }
-        .episode-card {
-            border: 2px solid var(--text-dim); background: rgba(0,0,0,0.3);
-            padding: 15px; text-align: center; cursor: pointer;
-            transition: all 0.2s; border-radius: 8px;
-        }
-        .episode-card:hover {
-            border-color: var(--border-color); transform: translateY(-2px);
-            box-shadow: 0 0 10px var(--border-color);
-        }
-        .episode-card .ep-num {
-            font-family: 'VT323', monospace; font-size: 28px;
-            color: var(--accent-color); margin-bottom: 5px;
-        }
-        .episode-card .ep-label { font-size: 11px; color: var(--text-dim); }
-        
-        .servers-section {
-            border: 2px solid var(--border-color); background: var(--terminal-bg);
-            padding: 20px; border-radius: 8px; margin-top: 20px;
-        }
-        .servers-section h3 {
-            font-family: 'VT323', monospace; font-size: 24px;
-            color: var(--border-color); margin-bottom: 15px;
-        }
-        .server-list { display: flex; gap: 10px; flex-wrap: wrap; margin-bottom: 20px; }
-        .server-btn {
-            padding: 10px 20px; border: 2px solid var(--text-dim);
-            background: var(--terminal-bg); color: var(--text-color);
-            cursor: pointer; transition: all 0.2s; border-radius: 8px;
-            font-family: 'Share Tech Mono', monospace;
-        }
-        .server-btn:hover, .server-btn.active {
-            border-color: var(--accent-color); background: var(--accent-color);
-            color: var(--terminal-bg); box-shadow: 0 0 15px var(--accent-color);
-        }
-        .server-player {
-            width: 100%; height: 500px; border: 1px solid var(--text-dim);
-            border-radius: 4px; background: #000;
-        }
-        
-        .empty-state {
-            text-align: center; padding: 40px; color: var(--text-dim);
-            border: 1px dashed var(--text-dim); background: rgba(0,0,0,0.2);
-            border-radius: 8px;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ stylesheet_url('show.css') }}">
 </head>
 <body class="theme-green">
     <div class="scanline"></div>
@@ -2911,19 +3906,144 @@ SHOW_DETAILS_TEMPLATE = """
 </html>
 """
 
+# Page stylesheets are served once from /assets/ and cached by the browser;
+# the ?v= content hash in their URL busts that cache whenever the CSS changes.
+STYLESHEETS = {name: (css.encode(), hashlib.blake2b(css.encode(), digest_size=8).hexdigest())
+               for name, css in (("dashboard.css", MAIN_PAGE_CSS), ("db.css", DB_PAGE_CSS), ("show.css", SHOW_DETAILS_CSS))}
+
+def stylesheet_url(name: str) -> str:
+    """Versioned URL of a page stylesheet."""
+    return f"/assets/{name}?v={STYLESHEETS[name][1]}"
+
+app.jinja_env.globals['stylesheet_url'] = stylesheet_url
+
+# Compiled once at import; render_template_string would re-parse the source on every request.
+SHOW_DETAILS_TPL = app.jinja_env.from_string(SHOW_DETAILS_TEMPLATE)
+
+def prerender(source: str) -> Tuple[bytes, str]:
+    """Renders a page template without per-request data once; returns its bytes and ETag."""
+    body = app.jinja_env.from_string(source).render().encode()
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+# The dashboard and the DB explorer fetch everything they show, so their HTML never varies
+MAIN_PAGE = prerender(MAIN_PAGE_TEMPLATE)
+DB_PAGE = prerender(DB_PAGE_TEMPLATE)
+
+def cached_response(body: bytes, etag: str, mimetype: str, max_age: int) -> Response:
+    """Serves fixed bytes with an ETag and public caching (304 if the client's copy is current)."""
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
 
 @app.route('/')
 def index():
     """Main dashboard with retro hacker terminal theme"""
-    return render_template_string(MAIN_PAGE_TEMPLATE)
+    return cached_response(*MAIN_PAGE, "text/html", PAGE_MAX_AGE)
+
+@app.route('/assets/<name>')
+def stylesheet(name):
+    """Serves a page stylesheet with long-lived caching headers."""
+    if name not in STYLESHEETS:
+        return "Not found.", 404
+    return cached_response(*STYLESHEETS[name], "text/css", STYLESHEET_MAX_AGE)
 
 @app.route('/api/status')
 def api_status():
-    """Returns the current state of the scraper."""
-    # Convert deque to list for JSON serialization
-    state_copy = GLOBAL_STATE.copy()
-    state_copy["live_fetch_logs"] = list(GLOBAL_STATE["live_fetch_logs"])
-    return jsonify(state_copy)
+    """
+    Returns the current state of the scraper (304 if the client's ETag is still current).
+    With ?wait=1 an up-to-date client is held until the state changes (long-poll), so the
+    page gets each change as it happens instead of polling on a timer.
+    With ?log_since=<log_seq> only the fetch-log lines newer than that are sent, and with
+    ?delta=1 as well only the fields that changed since the snapshot named by If-None-Match.
+    Bodies over STATUS_GZIP_MIN_SIZE are gzipped for clients that accept it.
+    """
+    body, etag, state = get_status_json()
+    if etag in request.if_none_match and request.args.get("wait"):
+        if not STATUS_HELD_SLOTS.acquire(blocking=False):
+            return status_busy()
+        try:
+            body, etag, state = wait_for_status(etag, STATUS_LONG_POLL_TIMEOUT)
+        finally:
+            STATUS_HELD_SLOTS.release()
+    log_since = request.args.get("log_since", type=int)
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        full = log_since is None
+        if full:
+            body = status_full_json(body, state)
+        else:
+            base = status_base(request.if_none_match) if request.args.get("delta") else None
+            body = status_since_json(state, log_since, base)
+        gzipped = len(body) >= STATUS_GZIP_MIN_SIZE and "gzip" in request.accept_encodings
+        if gzipped:
+            body = gzip_status(body, etag if full else "")
+        response = Response(body, mimetype="application/json")
+        if gzipped:
+            response.headers['Content-Encoding'] = 'gzip'
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = STATUS_CACHE_CONTROL
+    response.vary.add('Accept-Encoding')
+    return response
+
+@app.route('/api/stream')
+def api_stream():
+    """
+    Server-Sent Events version of /api/status?wait=1&delta=1: one open response that pushes
+    changes on two channels. "logs" events carry the new fetch-log lines as they come; their
+    id is the log_seq, so ?log_since=<log_seq> or a reconnecting EventSource (Last-Event-ID)
+    resumes the log. "stats" events carry the other fields that changed since the previous
+    stats event, at most every STATUS_STREAM_STATS_INTERVAL, so a log flood doesn't redraw
+    the counters with every batch.
+    Each open stream holds a web thread; past STATUS_HELD_LIMIT the page gets a 503 and polls.
+    """
+    if not STATUS_HELD_SLOTS.acquire(blocking=False):
+        return status_busy()
+    log_since = request.headers.get("Last-Event-ID", type=int)
+    if log_since is None:
+        log_since = request.args.get("log_since", 0, type=int)
+
+    def events():
+        etag, since = "", log_since
+        sent, sent_at, held = None, 0.0, False # Stats snapshot last sent, when, and whether newer ones wait
+        while True:
+            timeout = STATUS_STREAM_HEARTBEAT
+            if held:
+                timeout = max(0.0, sent_at + STATUS_STREAM_STATS_INTERVAL - time.monotonic())
+            _, latest, state = wait_for_status(etag, timeout)
+            first = sent is None
+            quiet = True
+            # Stats go first, so on connect the counters paint before the log backlog arrives
+            changed = {key: value for key, value in state.items()
+                       if key != "log_seq" and (first or sent.get(key) != value)}
+            held = bool(changed)
+            if held and time.monotonic() - sent_at >= STATUS_STREAM_STATS_INTERVAL:
+                if not first:
+                    changed["partial"] = True
+                yield b"event: stats\ndata: %s\n\n" % orjson.dumps(changed)
+                sent, sent_at, held, quiet = state, time.monotonic(), False, False
+            if latest != etag:
+                etag = latest
+                if state["log_seq"] != since or first:
+                    logs, reset = status_logs(state, since)
+                    # A backlog goes out in STATUS_STREAM_LOG_CHUNK-line events, each one flushed
+                    # and resumable on its own; the oldest lines come first
+                    first_seq = state["log_seq"] - len(logs)
+                    for start in range(0, len(logs) or 1, STATUS_STREAM_LOG_CHUNK):
+                        part = logs[start:start + STATUS_STREAM_LOG_CHUNK]
+                        seq = first_seq + start + len(part)
+                        yield b"event: logs\nid: %d\ndata: %s\n\n" % (seq, orjson.dumps(
+                            {"log_seq": seq, "live_fetch_logs": part, "log_reset": reset and start == 0}))
+                    since, quiet = state["log_seq"], False
+            if quiet and not held:
+                yield b": keep-alive\n\n"
+
+    response = Response(events(), mimetype="text/event-stream")
+    response.headers['Cache-Control'] = STATUS_CACHE_CONTROL
+    response.call_on_close(STATUS_HELD_SLOTS.release) # The server closes the response once the client is gone
+    return response
 
 @app.route('/api/start/<scrape_type>', methods=['POST'])
 def api_start(scrape_type):
@@ -2931,6 +4051,7 @@ def api_start(scrape_type):
     Starts the scraper in a background thread for specific type.
     Auto-chains to the next type (movies -> series -> anime)
     scrape_type: 'movies', 'series', 'anime'
+    Answers 202 right away; loading the pending URLs happens in the scraper thread.
     """
     global SCRAPER_THREAD
     
@@ -2938,40 +4059,22 @@ def api_start(scrape_type):
     if scrape_type not in ['movies', 'series', 'anime']:
         return jsonify({"success": False, "message": "Invalid scrape type. Use 'movies', 'series', or 'anime'."}), 400
     
-    if not GLOBAL_STATE['scraper_running']:
-        GLOBAL_STATE["scraper_running"] = True
-        GLOBAL_STATE["current_scrape_type"] = scrape_type
-        
-        # Set up auto-chain queue: next types to scrape after current one
-        if scrape_type == "movies":
-            GLOBAL_STATE["scrape_queue"] = ["series", "anime"]
-        elif scrape_type == "series":
-            GLOBAL_STATE["scrape_queue"] = ["anime", "movies"]
-        elif scrape_type == "anime":
-            GLOBAL_STATE["scrape_queue"] = ["movies", "series"]
-        
+    # Set up auto-chain queue: next types to scrape after current one
+    auto_chain = {
+        "movies": ["series", "anime"],
+        "series": ["anime", "movies"],
+        "anime": ["movies", "series"],
+    }
+    if claim_scraper(scrape_type, auto_chain[scrape_type]):
         STOP_EVENT.clear()
         # GLOBAL_STATE["live_fetch_logs"].clear() # FIX: Don't clear logs
-        GLOBAL_STATE["live_db_log"] = "..."
-        
-        # Load stats in the main thread to prevent race condition
-        pending_urls = []
-        try:
-            db = Database(DB_PATH)
-            pending_urls = db.populate_and_get_pending_urls(scrape_type) # Filter by type
-            db.close() # Close the temp connection
-        except Exception as e:
-            log_to_ui("status", f"Failed to get pending URLs: {e}")
-            GLOBAL_STATE["scraper_running"] = False
-            GLOBAL_STATE["current_scrape_type"] = None
-            GLOBAL_STATE["scrape_queue"] = []
-            return jsonify({"success": False, "message": "Failed to load URLs from DB."})
         
-        # Pass the pre-fetched list to the scraper thread
-        SCRAPER_THREAD = threading.Thread(target=start_scraper_thread, args=(pending_urls, scrape_type), daemon=True)
+        # The scraper thread loads the pending URLs itself, so the request returns immediately
+        log_to_ui("status", f"Loading {scrape_type} URLs...")
+        SCRAPER_THREAD = threading.Thread(target=start_scraper_thread, args=(None, scrape_type), daemon=True)
         SCRAPER_THREAD.start()
         
-        return jsonify({"success": True, "message": f"Scraper started for {scrape_type}. Will auto-chain to next types."})
+        return jsonify({"success": True, "message": f"Scraper started for {scrape_type}. Will auto-chain to next types."}), 202
     return jsonify({"success": False, "message": "Scraper already running."})
 
 @app.route('/api/sync', methods=['POST'])
@@ -2985,20 +4088,15 @@ def api_sync():
     if not sitemap_url:
         return jsonify({"success": False, "message": "Sitemap URL is required."}), 400
     
-    if not GLOBAL_STATE['scraper_running']:
-        GLOBAL_STATE["scraper_running"] = True
-        GLOBAL_STATE["current_scrape_type"] = "sync"
-        GLOBAL_STATE["scrape_queue"] = [] # Sync does not chain
-        
+    if claim_scraper("sync", []): # Sync does not chain
         STOP_EVENT.clear()
         # GLOBAL_STATE["live_fetch_logs"].clear() # FIX: Don't clear logs
-        GLOBAL_STATE["live_db_log"] = "..."
         
         # Start the sync process in a new thread
         SYNC_THREAD = threading.Thread(target=sync_thread_task, args=(sitemap_url,), daemon=True)
         SYNC_THREAD.start()
         
-        return jsonify({"success": True, "message": f"Sync started from {sitemap_url}."})
+        return jsonify({"success": True, "message": f"Sync started from {sitemap_url}."}), 202
     return jsonify({"success": False, "message": "Scraper already running."})
 
 
@@ -3008,7 +4106,7 @@ def api_stop():
     if GLOBAL_STATE['scraper_running']:
         log_to_ui("status", "Stop signal received... finishing current tasks...")
         STOP_EVENT.set()
-        GLOBAL_STATE["scrape_queue"] = []  # Clear the auto-chain queue
+        update_state(scrape_queue=[])  # Clear the auto-chain queue
         return jsonify({"success": True, "message": "Stop signal sent."})
     return jsonify({"success": False, "message": "Scraper not running."})
 
@@ -3017,53 +4115,66 @@ def api_stop():
 def download_db():
     """Provides the database file for download."""
     try:
-        return send_file(DB_PATH, as_attachment=True, download_name='scrapped.db')
+        # Stream a consistent snapshot; the live file may change under the writer mid-download.
+        fd, snapshot_path = tempfile.mkstemp(suffix=".db", dir=os.path.dirname(DB_PATH) or ".")
+        os.close(fd)
+        try:
+            with read_connection() as conn, closing(sqlite3.connect(snapshot_path)) as snapshot:
+                conn.backup(snapshot)
+            size = os.path.getsize(snapshot_path)
+        except Exception:
+            os.remove(snapshot_path) # A failed backup (e.g. a full disk) must not leave its partial copy behind
+            raise
     except Exception as e:
         log_to_ui("status", f"Error downloading DB: {e}")
-        return "Error: Could not find or read database file.", 404
+        return "Error: Could not read database file.", 500
+
+    def stream_snapshot():
+        with open(snapshot_path, 'rb') as f:
+            while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+                yield chunk
+
+    response = Response(stream_snapshot(), mimetype='application/octet-stream', headers={
+        "Content-Disposition": "attachment; filename=scrapped.db",
+        "Content-Length": str(size),
+    })
+    response.call_on_close(lambda: os.remove(snapshot_path))
+    return response
 
 # --- NEW: DB Explorer Routes ---
 @app.route('/db')
 def db_explorer():
     """Show browser main page - displays all shows in a grid."""
-    return render_template_string(DB_PAGE_TEMPLATE)
+    return cached_response(*DB_PAGE, "text/html", PAGE_MAX_AGE)
 
-@app.route('/db/show/<int:show_id>')
-def db_view_show(show_id):
-    """Show details page with seasons, episodes, and servers."""
-    db = Database(DB_PATH)
-    if not db.conn:
-        return "Error: Could not connect to database.", 500
-    
-    cursor = db.conn.cursor()
-    try:
+@lru_cache(maxsize=SHOW_PAGE_CACHE_SIZE)
+def render_show_page(show_id: int) -> Optional[str]:
+    """Renders a show's details page (None if it doesn't exist); cleared whenever the writer commits."""
+    with read_connection() as conn:
         # Get show details
-        cursor.execute("""
-            SELECT id, title, type, poster, synopsis, imdb_rating, trailer, year, 
-                   genres, cast, directors, country, language, duration, source_url, created_at
-            FROM shows WHERE id = ?
-        """, (show_id,))
-        show_row = cursor.fetchone()
+        show_row = conn.execute(SQL_SELECT_SHOW, (show_id,)).fetchone()
         
         if not show_row:
-            db.close()
-            return "Show not found.", 404
+            return None
         
         show = dict(show_row)
         
         # Get seasons if it's a series or anime
         seasons = []
         if show['type'] in ['series', 'anime']:
-            cursor.execute("""
-                SELECT id, show_id, season_number, poster, created_at
-                FROM seasons WHERE show_id = ? ORDER BY season_number
-            """, (show_id,))
-            seasons = [dict(row) for row in cursor.fetchall()]
-        
-        db.close()
-        return render_template_string(SHOW_DETAILS_TEMPLATE, show=show, seasons=seasons)
+            seasons = [dict(row) for row in conn.execute(SQL_SELECT_SEASONS, (show_id,))]
+    
+    return SHOW_DETAILS_TPL.render(show=show, seasons=seasons)
+
+@app.route('/db/show/<int:show_id>')
+def db_view_show(show_id):
+    """Show details page with seasons, episodes, and servers."""
+    try:
+        page = render_show_page(show_id)
+        if page is None:
+            return "Show not found.", 404
+        return page
     except Exception as e:
-        db.close()
         # Log error internally but don't expose stack trace to user
         log_to_ui("status", f"Error loading show details: {e}")
         return "Error loading show details. Please try again later.", 500
@@ -3072,74 +4183,66 @@ def db_view_show(show_id):
 
 @app.route('/api/shows')
 def api_get_shows():
-    """API endpoint to get all shows for the browser."""
-    db = Database(DB_PATH)
-    if not db.conn:
-        return jsonify({"error": "Database connection failed"}), 500
-    
-    cursor = db.conn.cursor()
+    """
+    API endpoint to get shows for the browser, newest first.
+    Optional keyset paging: ?limit=N&after_id=<last id seen>&type=movie|series|anime
+    """
+    limit = request.args.get('limit', type=int)
+    after_id = request.args.get('after_id', type=int)
+    show_type = request.args.get('type')
+    cache_key = (limit, after_id, show_type)
     try:
-        cursor.execute("""
-            SELECT id, title, type, poster, year, imdb_rating, genres 
-            FROM shows 
-            ORDER BY created_at DESC
-        """)
-        shows = [dict(row) for row in cursor.fetchall()]
-        db.close()
-        return jsonify({"shows": shows})
+        cached = SHOWS_CACHE.get(cache_key)
+        if cached is None or time.monotonic() >= cached[0]:
+            clauses, params = [], []
+            if after_id is not None:
+                clauses.append("id < ?")
+                params.append(after_id)
+            if show_type:
+                clauses.append("type = ?")
+                params.append(show_type)
+            sql = SQL_SELECT_SHOW_CARDS
+            if clauses:
+                sql += " WHERE " + " AND ".join(clauses)
+            sql += " ORDER BY id DESC"
+            if limit:
+                sql += " LIMIT ?"
+                params.append(limit)
+            with read_connection() as conn:
+                shows = [dict(row) for row in conn.execute(sql, params)]
+            # Seek from the last id instead of OFFSET, so every page costs the same
+            next_after_id = shows[-1]["id"] if limit and len(shows) == limit else None
+            cached = (time.monotonic() + SHOWS_CACHE_TTL,
+                      orjson.dumps({"shows": shows, "next_after_id": next_after_id}))
+            SHOWS_CACHE[cache_key] = cached
+        return Response(cached[1], mimetype="application/json")
     except Exception as e:
-        db.close()
         log_to_ui("status", f"Error loading shows: {e}")
         return jsonify({"error": "Failed to load shows"}), 500
 
 @app.route('/api/shows/<int:show_id>')
 def api_get_show(show_id):
     """API endpoint to get a specific show's details."""
-    db = Database(DB_PATH)
-    if not db.conn:
-        return jsonify({"error": "Database connection failed"}), 500
-    
-    cursor = db.conn.cursor()
     try:
-        cursor.execute("""
-            SELECT id, title, type, poster, synopsis, imdb_rating, trailer, year, 
-                   genres, cast, directors, country, language, duration, source_url, created_at
-            FROM shows WHERE id = ?
-        """, (show_id,))
-        show_row = cursor.fetchone()
+        with read_connection() as conn:
+            show_row = conn.execute(SQL_SELECT_SHOW, (show_id,)).fetchone()
         
         if not show_row:
-            db.close()
             return jsonify({"error": "Show not found"}), 404
         
-        show = dict(show_row)
-        db.close()
-        return jsonify({"show": show})
+        return jsonify({"show": dict(show_row)})
     except Exception as e:
-        db.close()
         log_to_ui("status", f"Error loading show {show_id}: {e}")
         return jsonify({"error": "Failed to load show details"}), 500
 
 @app.route('/api/episodes/<int:season_id>')
 def api_get_episodes(season_id):
     """API endpoint to get all episodes for a season."""
-    db = Database(DB_PATH)
-    if not db.conn:
-        return jsonify({"error": "Database connection failed"}), 500
-    
-    cursor = db.conn.cursor()
     try:
-        cursor.execute("""
-            SELECT id, episode_number 
-            FROM episodes 
-            WHERE season_id = ? 
-            ORDER BY CAST(episode_number AS REAL)
-        """, (season_id,))
-        episodes = [dict(row) for row in cursor.fetchall()]
-        db.close()
+        with read_connection() as conn:
+            episodes = [dict(row) for row in conn.execute(SQL_SELECT_EPISODES, (season_id,))]
         return jsonify({"episodes": episodes})
     except Exception as e:
-        db.close()
         log_to_ui("status", f"Error loading episodes for season {season_id}: {e}")
         return jsonify({"error": "Failed to load episodes"}), 500
 
@@ -3149,23 +4252,11 @@ def api_get_servers(parent_type, parent_id):
     if parent_type not in ['movie', 'episode']:
         return jsonify({"error": "Invalid parent type"}), 400
     
-    db = Database(DB_PATH)
-    if not db.conn:
-        return jsonify({"error": "Database connection failed"}), 500
-    
-    cursor = db.conn.cursor()
     try:
-        cursor.execute("""
-            SELECT embed_url, server_number 
-            FROM servers 
-            WHERE parent_type = ? AND parent_id = ? 
-            ORDER BY server_number
-        """, (parent_type, parent_id))
-        servers = [dict(row) for row in cursor.fetchall()]
-        db.close()
+        with read_connection() as conn:
+            servers = [dict(row) for row in conn.execute(SQL_SELECT_SERVERS, (parent_type, parent_id))]
         return jsonify({"servers": servers})
     except Exception as e:
-        db.close()
         log_to_ui("status", f"Error loading servers for {parent_type} {parent_id}: {e}")
         return jsonify({"error": "Failed to load servers"}), 500
 
@@ -3174,7 +4265,7 @@ def api_get_servers(parent_type, parent_id):
 def load_initial_stats():
     """Loads stats from the DB on startup to populate the UI."""
     try:
-        db = Database(DB_PATH)
+        db = Database.open_readonly(DB_PATH)
         db.get_initial_stats()
         db.close() # Close the connection immediately
     except Exception as e:
@@ -3183,14 +4274,15 @@ def load_initial_stats():
 if __name__ == "__main__":
     os.makedirs("data", exist_ok=True)
     
-    # Create dummy JSON files if they don't exist
+    # Create dummy JSON files if they don't exist ('x' fails on existing files, no separate stat)
     for f in JSON_FILES:
-        if not os.path.exists(f):
-            try:
-                with open(f, 'w') as new_file:
-                    json.dump({"urls": []}, new_file)
-            except Exception as e:
-                print(f"[ERROR] Could not create file {f}: {e}")
+        try:
+            with open(f, 'xb') as new_file:
+                new_file.write(EMPTY_URLS_JSON)
+        except FileExistsError:
+            pass
+        except Exception as e:
+            print(f"[ERROR] Could not create file {f}: {e}")
 
     # Initialize DB schema
     try:
@@ -3208,6 +4300,11 @@ if __name__ == "__main__":
     print(f"DB Explorer at: http://127.0.0.1:{SERVER_PORT}/db")
     print("------------------------")
     
-    # Run the Flask app
-    app.run(host='0.0.0.0', port=SERVER_PORT, debug=False, use_reloader=False)
+    # Run the Flask app on a production WSGI server (each request thread borrows a pooled DB connection)
+    try:
+        serve(app, host='0.0.0.0', port=SERVER_PORT, threads=WEB_THREADS)
+    finally:
+        if WRITER_DB:
+            WRITER_DB.close() # The writer connection lives until shutdown
+        close_fetch_loop()
 
@@ -0,0 +1,20 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import route_url
+
+
+def test_anime_under_series_path_is_anime():
+    assert route_url("https://topcinema.pro/series/انمي-gachiakuta-مترجم/") == "anime"
+
+
+def test_movie_beats_anime_and_series():
+    assert route_url("https://topcinema.pro/series/فيلم-anime-x-مترجم/") == "movie"
+    assert route_url("https://topcinema.pro/%D9%81%D9%8A%D9%84%D9%85-ne-zha-2019/") == "movie"
+
+
+def test_series_and_unknown():
+    assert route_url("https://topcinema.pro/series/مسلسل-breaking-bad-مترجم/") == "series"
+    assert route_url("https://topcinema.pro/other/") is None